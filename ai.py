@@ -1,37 +1,86 @@
 import pygame
+import json
 import math
 import random
+from trajectory import BallPredictor
+
+# distances (pixels) that pick a branch in _calculate_target_position
+DEFAULT_RADII = {
+    "shoot_radius": 150,     # ball this close to the human goal...
+    "strike_radius": 100,    # ...and to the AI: line up a shot
+    "defend_radius": 100,    # ball this close to our goal: cover it
+    "approach_radius": 120,  # ball this close to the AI: get behind it
+    "chase_radius": 60,      # further than this: run through the ball
+}
+
+# lookahead: at most this many ticks of ball trajectory prediction (0 = chase the ball where it is)
+DIFFICULTY_TABLE = {
+    "easy":   {"reaction_time": 3, "speed_multiplier": 0.7, "accuracy": 0.7,  "aggression": 0.6,  "lookahead": 0},
+    "medium": {"reaction_time": 2, "speed_multiplier": 0.9, "accuracy": 0.8,  "aggression": 0.8,  "lookahead": 0},
+    "hard":   {"reaction_time": 1, "speed_multiplier": 1.1, "accuracy": 0.9,  "aggression": 0.9,  "lookahead": 20},
+    # anything else gets the unnamed top tier
+    None:     {"reaction_time": 1, "speed_multiplier": 1.3, "accuracy": 0.95, "aggression": 0.95, "lookahead": 40},
+}
+
+# a ball slower than this (pixels per tick) is treated as standing still by the lookahead
+LOOKAHEAD_MIN_SPEED = 1.0
+
+TUNABLE_PARAMS = ("reaction_time", "speed_multiplier", "accuracy", "aggression", "lookahead") + tuple(DEFAULT_RADII)
+
+# written by tune.py; load_difficulty_table() merges it into DIFFICULTY_TABLE (main.py and replay.py do, at start)
+DIFFICULTY_FILE = "ai_difficulty.json"
+
+def load_difficulty_table(path=DIFFICULTY_FILE):
+    """Merge a tuned difficulty table into DIFFICULTY_TABLE. Returns False if there is none."""
+    try:
+        with open(path) as f:
+            tuned = json.load(f)
+    except (OSError, ValueError):
+        return False
+    for name, params in tuned.items():
+        key = None if name == "top" else name
+        DIFFICULTY_TABLE[key] = {**DIFFICULTY_TABLE.get(key, {}), **params}
+    return True
+
+def create_controller(difficulty="medium", rng=None):
+    """AI for a difficulty name; "search" is the lookahead AI that plans in a background worker."""
+    if difficulty == "search":
+        from search_ai import SearchAIController
+        return SearchAIController(difficulty, rng)
+    return AIController(difficulty, rng)
 
 class AIController:
     
-    def __init__(self, difficulty="medium"):
+    def __init__(self, difficulty="medium", rng=None):
         self.difficulty = difficulty
+        # any object with random()/randint(); pass random.Random(seed) for reproducible matches
+        self.rng = rng if rng is not None else random
         self.set_difficulty(difficulty)
         self.cooldown = 0
         self.last_ball_pos = (0, 0)
         self.decision_timer = 0
         
     def set_difficulty(self, difficulty):
-        if difficulty == "easy":
-            self.reaction_time = 3 
-            self.speed_multiplier = 0.7
-            self.accuracy = 0.7
-            self.aggression = 0.6  
-        elif difficulty == "medium":
-            self.reaction_time = 2 
-            self.speed_multiplier = 0.9
-            self.accuracy = 0.8
-            self.aggression = 0.8  
-        elif difficulty == "hard":
-            self.reaction_time = 1  
-            self.speed_multiplier = 1.1
-            self.accuracy = 0.9
-            self.aggression = 0.9  
-        else:  
-            self.reaction_time = 1  
-            self.speed_multiplier = 1.3
-            self.accuracy = 0.95
-            self.aggression = 0.95  
+        params = {**DEFAULT_RADII, **DIFFICULTY_TABLE.get(difficulty, DIFFICULTY_TABLE[None])}
+        self.apply_params(params)
+
+    def close(self):
+        """Release background resources; the heuristic AI has none."""
+
+    def reset(self):
+        """Forget the current match (timers, last ball position, target) before a new one."""
+        self.cooldown = 0
+        self.last_ball_pos = (0, 0)
+        self.decision_timer = 0
+        self.__dict__.pop("target_x", None)
+        self.__dict__.pop("target_y", None)
+
+    def apply_params(self, params):
+        """Override difficulty numbers and decision radii, e.g. with a tuned candidate."""
+        for name, value in params.items():
+            if name not in TUNABLE_PARAMS:
+                raise ValueError(f"unknown AI parameter: {name}")
+            setattr(self, name, int(round(value)) if name in ("reaction_time", "lookahead") else value)
     
     def update_ai_player(self, ai_rect, ball, human_rect, screen_width, screen_height, goal_left, goal_right, ai_side):
 
@@ -64,63 +113,80 @@ class AIController:
             my_goal_y = goal_right.centery
             human_goal_x = goal_left.centerx   
             human_goal_y = goal_left.centery
-        
+
+        ball_x, ball_y = ball.x, ball.y
         ball_to_ai = math.hypot(ball.x - ai_rect.centerx, ball.y - ai_rect.centery)
-        ball_to_my_goal = math.hypot(ball.x - my_goal_x, ball.y - my_goal_y)
-        ball_to_human_goal = math.hypot(ball.x - human_goal_x, ball.y - human_goal_y)
-        ball_to_human = math.hypot(ball.x - human_rect.centerx, ball.y - human_rect.centery)
+        # aim at where the ball will be by the time we can get there, unless it is (nearly) at rest or
+        # already close enough to play: then aiming off the ball only makes us run past it
+        if self.lookahead and ball_to_ai >= self.approach_radius and math.hypot(ball.vx, ball.vy) >= LOOKAHEAD_MIN_SPEED:
+            predictor = BallPredictor.for_field(screen_width, screen_height, ball.radius)
+            ticks = min(self.lookahead, int(ball_to_ai / (4.0 * self.speed_multiplier)), predictor.stop_tick(ball.vx, ball.vy))
+            ball_x, ball_y = predictor.position(ball.x, ball.y, ball.vx, ball.vy, ticks)
 
-        if ball_to_human_goal < 150 and ball_to_ai < 100:
-            angle_to_human_goal = math.atan2(human_goal_y - ball.y, human_goal_x - ball.x)
+        target_x, target_y = self._positional_target(ball_x, ball_y, ai_rect.centerx, ai_rect.centery,
+                                                     human_rect.centerx, human_rect.centery,
+                                                     my_goal_x, my_goal_y, human_goal_x, human_goal_y)
+
+        time_factor = self.decision_timer * 0.1  
+
+        hunting_radius = 20
+        target_x += math.cos(time_factor) * hunting_radius
+        target_y += math.sin(time_factor * 1.3) * hunting_radius
+        
+        if self.rng.random() > self.accuracy:
+            target_x += self.rng.randint(-30, 30)
+            target_y += self.rng.randint(-30, 30)
+
+        margin = 30
+        target_x = max(margin, min(screen_width - margin, target_x))
+        target_y = max(margin, min(screen_height - margin, target_y))
+        
+        return target_x, target_y
+
+    def _positional_target(self, ball_x, ball_y, ai_x, ai_y, human_x, human_y, my_goal_x, my_goal_y, human_goal_x, human_goal_y):
+        """The deterministic part of the decision: where to stand given the three positions."""
+        ball_to_ai = math.hypot(ball_x - ai_x, ball_y - ai_y)
+        ball_to_my_goal = math.hypot(ball_x - my_goal_x, ball_y - my_goal_y)
+        ball_to_human_goal = math.hypot(ball_x - human_goal_x, ball_y - human_goal_y)
+        ball_to_human = math.hypot(ball_x - human_x, ball_y - human_y)
+
+        if ball_to_human_goal < self.shoot_radius and ball_to_ai < self.strike_radius:
+            angle_to_human_goal = math.atan2(human_goal_y - ball_y, human_goal_x - ball_x)
             approach_distance = 25
-            target_x = ball.x - math.cos(angle_to_human_goal) * approach_distance
-            target_y = ball.y - math.sin(angle_to_human_goal) * approach_distance
+            target_x = ball_x - math.cos(angle_to_human_goal) * approach_distance
+            target_y = ball_y - math.sin(angle_to_human_goal) * approach_distance
             
-        elif ball_to_my_goal < 100:
-            target_x = my_goal_x + (ball.x - my_goal_x) * 0.5
-            target_y = my_goal_y + (ball.y - my_goal_y) * 0.6
+        elif ball_to_my_goal < self.defend_radius:
+            target_x = my_goal_x + (ball_x - my_goal_x) * 0.5
+            target_y = my_goal_y + (ball_y - my_goal_y) * 0.6
             
-        elif ball_to_ai < 120:
-            angle_to_human_goal = math.atan2(human_goal_y - ball.y, human_goal_x - ball.x)
+        elif ball_to_ai < self.approach_radius:
+            angle_to_human_goal = math.atan2(human_goal_y - ball_y, human_goal_x - ball_x)
             approach_distance = 30
-            target_x = ball.x - math.cos(angle_to_human_goal) * approach_distance
-            target_y = ball.y - math.sin(angle_to_human_goal) * approach_distance
+            target_x = ball_x - math.cos(angle_to_human_goal) * approach_distance
+            target_y = ball_y - math.sin(angle_to_human_goal) * approach_distance
             
         else:
 
-            human_to_my_goal_x = my_goal_x - human_rect.centerx
-            human_to_my_goal_y = my_goal_y - human_rect.centery
+            human_to_my_goal_x = my_goal_x - human_x
+            human_to_my_goal_y = my_goal_y - human_y
 
-            intercept_x = human_rect.centerx + human_to_my_goal_x * 0.3
-            intercept_y = human_rect.centery + human_to_my_goal_y * 0.3
+            intercept_x = human_x + human_to_my_goal_x * 0.3
+            intercept_y = human_y + human_to_my_goal_y * 0.3
 
             aggression_factor = self.aggression
-            target_x = ball.x * aggression_factor + intercept_x * (1 - aggression_factor)
-            target_y = ball.y * aggression_factor + intercept_y * (1 - aggression_factor)
-
-            if ball_to_ai > 60:
-                target_x = ball.x + (ball.x - ai_rect.centerx) * 0.2
-                target_y = ball.y + (ball.y - ai_rect.centery) * 0.2
+            target_x = ball_x * aggression_factor + intercept_x * (1 - aggression_factor)
+            target_y = ball_y * aggression_factor + intercept_y * (1 - aggression_factor)
 
-        time_factor = self.decision_timer * 0.1  
+            if ball_to_ai > self.chase_radius:
+                target_x = ball_x + (ball_x - ai_x) * 0.2
+                target_y = ball_y + (ball_y - ai_y) * 0.2
 
         if ball_to_human < 100:
-            angle_to_human = math.atan2(human_rect.centery - ball.y, human_rect.centerx - ball.x)
+            angle_to_human = math.atan2(human_y - ball_y, human_x - ball_x)
             target_x += math.cos(angle_to_human + 3.14159) * 40
             target_y += math.sin(angle_to_human + 3.14159) * 40
-        
-        hunting_radius = 20
-        target_x += math.cos(time_factor) * hunting_radius
-        target_y += math.sin(time_factor * 1.3) * hunting_radius
-        
-        if random.random() > self.accuracy:
-            target_x += random.randint(-30, 30)
-            target_y += random.randint(-30, 30)
 
-        margin = 30
-        target_x = max(margin, min(screen_width - margin, target_x))
-        target_y = max(margin, min(screen_height - margin, target_y))
-        
         return target_x, target_y
     
     def _move_toward_target(self, ai_rect, target_x, target_y, screen_width, screen_height):
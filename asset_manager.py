@@ -0,0 +1,184 @@
+"""Shared image and sound assets, each decoded from disk once per session.
+
+``image`` decodes a file the first time it is asked for, converts it to the
+display pixel format (with or without per-pixel alpha) and hands the same
+surface to every caller afterwards. ``scaled`` keeps resized variants, keyed
+by size, in an LRU cache capped by pixel memory. ``preload`` decodes the
+whole asset list up front, so later screens (a new match, a pause menu)
+touch the disk not at all. ``load_async`` and ``sound_async`` start a decode
+on a thread pool instead (see ``loader.py``); the next ``image``/``sound``
+call for that file takes the result, waiting for it if it is still running.
+
+Sources too big to convert cheaply (the field is 10000x7499) stay in their
+decoded format; they are only ever drawn scaled, and ``scaled`` converts the
+resized copy.
+
+Surfaces are shared: blit, scale or copy them, never draw on them.
+"""
+import os
+from collections import OrderedDict
+import pygame
+import profiler
+
+ASSET_DIR = "assets"
+MENU_BACKGROUND = os.path.join(ASSET_DIR, "menu-bg.png")
+MENU_BUTTON = os.path.join(ASSET_DIR, "menu-button.png")
+FIELD = os.path.join(ASSET_DIR, "Field", "Only Field.png")
+BALL = os.path.join(ASSET_DIR, "ball.png")
+HOME_PREVIEW = os.path.join(ASSET_DIR, "Preview", "10.png")
+VISITOR_PREVIEW = os.path.join(ASSET_DIR, "Preview", "14.png")
+PAUSE_BUTTON = os.path.join(ASSET_DIR, "pause", "pause-button.png")
+VOLUME_ON_BUTTON = os.path.join(ASSET_DIR, "pause", "volumn-button-on.png")
+VOLUME_OFF_BUTTON = os.path.join(ASSET_DIR, "pause", "volumn-button-off.png")
+RESUME_BUTTON = os.path.join(ASSET_DIR, "pause", "resume-button.png")
+QUIT_BUTTON = os.path.join(ASSET_DIR, "pause", "quit-button.png")
+SCOREBOARD_BOX = os.path.join(ASSET_DIR, "Electronic Scoreboard", "Background Scoreboard.png")
+SCOREBOARD_HOME = os.path.join(ASSET_DIR, "Electronic Scoreboard", "Home.png")
+SCOREBOARD_VISITOR = os.path.join(ASSET_DIR, "Electronic Scoreboard", "Visitor.png")
+SCOREBOARD_TIME = os.path.join(ASSET_DIR, "Electronic Scoreboard", "time.png")
+SCOREBOARD_EXTRA_TIME = os.path.join(ASSET_DIR, "Electronic Scoreboard", "Extra Time.png")
+KICK_SOUND = os.path.join(ASSET_DIR, "sfx", "kick.mp3")
+GOAL_SOUND = os.path.join(ASSET_DIR, "sfx", "goal.mp3")
+
+# (path, has alpha) for every plain image a session can show; backgrounds are opaque.
+# Player sprites and scoreboard digits come from atlas pages (atlas.py).
+IMAGES = [(MENU_BACKGROUND, False), (FIELD, False), (MENU_BUTTON, True), (BALL, True),
+          (HOME_PREVIEW, True), (VISITOR_PREVIEW, True),
+          (PAUSE_BUTTON, True), (VOLUME_ON_BUTTON, True), (VOLUME_OFF_BUTTON, True),
+          (RESUME_BUTTON, True), (QUIT_BUTTON, True), (SCOREBOARD_BOX, True), (SCOREBOARD_HOME, True),
+          (SCOREBOARD_VISITOR, True), (SCOREBOARD_TIME, True), (SCOREBOARD_EXTRA_TIME, True)]
+SOUNDS = [KICK_SOUND, GOAL_SOUND]
+
+MAX_SCALED_BYTES = 96 * 2**20  # a few window-sized backgrounds plus every button and sprite size
+MAX_CONVERT_PIXELS = 16 * 2**20  # converting holds the GIL, ~300 ms for the field, so huge sources skip it
+
+_images = {}              # (path, alpha) -> Surface, or the exception loading it raised
+_sounds = {}
+_scaled = OrderedDict()   # (path, alpha, size, smooth, area) -> Surface
+_scaled_bytes = 0
+_unconverted = set()      # keys of images kept in their decoded pixel format
+_pending = {}             # (path, alpha) for images, path for sounds -> Future of a background decode
+
+def solid(size, color, alpha=False):
+  """A plain placeholder surface."""
+  surf = pygame.Surface(size, pygame.SRCALPHA if alpha else 0)
+  surf.fill(color)
+  return surf
+
+def _convert(surf, alpha):
+  if pygame.display.get_surface() is None:
+    return surf  # no display yet to convert for; happens in headless tools
+  return surf.convert_alpha() if alpha else surf.convert()
+
+def _decode(key, decoded, decode):
+  with profiler.section("image load"):
+    surf = decoded.result() if decoded is not None else decode(key[0])
+    if surf.get_width() * surf.get_height() > MAX_CONVERT_PIXELS:
+      _unconverted.add(key)
+      return surf
+    return _convert(surf, key[1])
+
+def image(path, alpha=True, placeholder=None, decode=pygame.image.load):
+  """The decoded surface for ``path``, loaded once.
+
+  If the file cannot be loaded, ``placeholder()`` is used (and remembered) in
+  its place; without a placeholder the load error is raised, on every call,
+  without retrying the disk. ``decode(path)`` replaces the plain file read,
+  e.g. to rebuild a generated file first.
+  """
+  key = (path, alpha)
+  surf = _images.get(key)
+  if surf is None:
+    try:
+      surf = _decode(key, _pending.pop(key, None), decode)
+    except (pygame.error, FileNotFoundError) as e:
+      surf = e
+    _images[key] = surf
+  if isinstance(surf, Exception):
+    if placeholder is None:
+      raise surf
+    surf = _images[key] = placeholder()
+  return surf
+
+def scaled(path, size, alpha=True, smooth=True, placeholder=None, area=None):
+  """``image(path)`` resized to ``size``, cached until it falls out of the memory budget.
+
+  ``area`` scales just that rect of the image, such as one sprite of an atlas page.
+  """
+  global _scaled_bytes
+  size = (max(1, int(size[0])), max(1, int(size[1])))
+  area = tuple(area) if area is not None else None
+  key = (path, alpha, size, smooth, area)
+  surf = _scaled.get(key)
+  if surf is not None:
+    _scaled.move_to_end(key)
+    return surf
+  source = image(path, alpha, placeholder)
+  if area is not None and source.get_rect().contains(area) and pygame.Rect(area) != source.get_rect():
+    source = source.subsurface(area)  # a placeholder stands in whole for a missing page
+  with profiler.section("image scale"):
+    if source.get_size() == size:
+      surf = source
+    elif smooth:
+      surf = pygame.transform.smoothscale(source, size)
+    else:
+      surf = pygame.transform.scale(source, size)
+    if (path, alpha) in _unconverted:
+      surf = _convert(surf, alpha)
+  _scaled[key] = surf
+  _scaled_bytes += size[0] * size[1] * surf.get_bytesize()
+  while _scaled_bytes > MAX_SCALED_BYTES and len(_scaled) > 1:
+    _, old = _scaled.popitem(last=False)
+    _scaled_bytes -= old.get_width() * old.get_height() * old.get_bytesize()
+  return surf
+
+def sound(path):
+  """A decoded ``pygame.mixer.Sound``, loaded once; load errors propagate."""
+  snd = _sounds.get(path)
+  if snd is None:
+    decoded = _pending.pop(path, None)
+    snd = _sounds[path] = decoded.result() if decoded is not None else pygame.mixer.Sound(path)
+  return snd
+
+def load_async(executor, path, alpha=True, decode=pygame.image.load):
+  """Start ``decode(path)`` on ``executor``; returns the Future, or None if it is already loaded.
+
+  Call only from the main thread, like ``image``, which converts the result.
+  """
+  key = (path, alpha)
+  if key in _images:
+    return None
+  if key not in _pending:
+    _pending[key] = executor.submit(decode, path)
+  return _pending[key]
+
+def sound_async(executor, path):
+  """``load_async`` for sounds."""
+  if path in _sounds:
+    return None
+  if path not in _pending:
+    _pending[path] = executor.submit(pygame.mixer.Sound, path)
+  return _pending[path]
+
+def preload(images=IMAGES, sounds=SOUNDS):
+  """Decode everything a session can need; missing files are remembered, not retried."""
+  for path, alpha in images:
+    try:
+      image(path, alpha)
+    except (pygame.error, FileNotFoundError):
+      pass
+  if pygame.mixer.get_init():
+    for path in sounds:
+      try:
+        sound(path)
+      except (pygame.error, FileNotFoundError):
+        pass
+
+def clear():
+  global _scaled_bytes
+  _images.clear()
+  _sounds.clear()
+  _scaled.clear()
+  _scaled_bytes = 0
+  _unconverted.clear()
+  _pending.clear()
@@ -0,0 +1,163 @@
+"""Sprite atlases: each team's players (and the scoreboard digits) on one page.
+
+The team folders hold 18 player PNGs each, 843 to 2346 pixels square, and
+the game draws them at about 80. ``build`` shrinks every sprite of a page to
+at most ``SPRITE_SIZE`` on its long side, shelf-packs them into one PNG under
+``ATLAS_DIR`` and writes a JSON index beside it: the rect of each sprite on
+the page, its source size (so callers keep the source's aspect ratio and
+scale factors), and the size and mtime of every source file. ``load`` checks
+that index against the folder and rebuilds only when a source changed, was
+added or went away; otherwise a page is one small decode instead of one big
+decode per sprite.
+
+  python atlas.py          # build (or refresh) every page and print the packing
+"""
+import json, os
+import pygame
+import asset_manager
+
+ATLAS_DIR = "atlas_cache"
+FORMAT = 1           # bump when the page layout or the index changes
+SPRITE_SIZE = 256    # longest side of a packed sprite; covers players up to a 4K-wide window
+MAX_PAGE_WIDTH = 2048
+PADDING = 1
+PLAYER = "2"         # the sprite matches draw for each team
+
+# page -> folder whose numbered PNGs (1.png, 2.png, ...) it packs
+PAGES = {
+  "home": os.path.join(asset_manager.ASSET_DIR, "Romanos FC (Home Team)"),
+  "visitor": os.path.join(asset_manager.ASSET_DIR, "Saint Bari (Visitor Team)"),
+  "scoreboard": os.path.join(asset_manager.ASSET_DIR, "Electronic Scoreboard"),
+}
+
+def page_path(page, directory=ATLAS_DIR):
+  return os.path.join(directory, page + ".png")
+
+def index_path(page, directory=ATLAS_DIR):
+  return os.path.join(directory, page + ".json")
+
+def sources(page):
+  """{sprite name: file} for the numbered PNGs in the page's folder."""
+  folder = PAGES[page]
+  names = [f[:-4] for f in os.listdir(folder) if f.endswith(".png") and f[:-4].isdigit()]
+  return {name: os.path.join(folder, name + ".png") for name in sorted(names, key=int)}
+
+def _stamp(path):
+  st = os.stat(path)
+  return [st.st_size, st.st_mtime_ns]
+
+def _stamps(page):
+  return {name: _stamp(path) for name, path in sources(page).items()}
+
+def _read_index(page, directory):
+  try:
+    with open(index_path(page, directory)) as f:
+      return json.load(f)
+  except (OSError, ValueError):
+    return None
+
+def is_stale(page, directory=ATLAS_DIR):
+  index = _read_index(page, directory)
+  return (index is None or index.get("format") != FORMAT or index.get("sprite_size") != SPRITE_SIZE
+          or index.get("sources") != _stamps(page) or not os.path.exists(page_path(page, directory)))
+
+def pack(sizes, max_width=MAX_PAGE_WIDTH, padding=PADDING):
+  """Shelf-pack ``{name: (w, h)}``, tallest first; returns ({name: (x, y, w, h)}, page size)."""
+  rects = {}
+  x = y = shelf = width = 0
+  for name in sorted(sizes, key=lambda n: (-sizes[n][1], -sizes[n][0])):
+    w, h = sizes[name]
+    if x and x + w > max_width:
+      x, y, shelf = 0, y + shelf + padding, 0
+    rects[name] = (x, y, w, h)
+    x += w + padding
+    shelf = max(shelf, h)
+    width = max(width, x - padding)
+  return rects, (max(1, width), max(1, y + shelf))
+
+def build(page, directory=ATLAS_DIR):
+  """Pack the page's sprites and write its PNG and index; returns the index.
+
+  Safe to run off the main thread: it needs no display, and both files are
+  written under temporary names and then renamed into place.
+  """
+  stamps = _stamps(page)
+  sprites, sizes, source_sizes = {}, {}, {}
+  for name, path in sources(page).items():
+    surf = pygame.image.load(path)
+    w, h = source_sizes[name] = surf.get_size()
+    scale = min(1.0, SPRITE_SIZE / max(w, h))
+    sizes[name] = (max(1, round(w * scale)), max(1, round(h * scale)))
+    if surf.get_bitsize() < 24:  # smoothscale needs 24/32-bit pixels; no display to convert() against here
+      rgba = pygame.Surface((w, h), pygame.SRCALPHA, 32)
+      rgba.blit(surf, (0, 0))
+      surf = rgba
+    sprites[name] = surf if sizes[name] == (w, h) else pygame.transform.smoothscale(surf, sizes[name])
+  rects, size = pack(sizes)
+  sheet = pygame.Surface(size, pygame.SRCALPHA, 32)
+  for name, rect in rects.items():
+    sheet.blit(sprites[name], rect[:2])
+  index = {"format": FORMAT, "sprite_size": SPRITE_SIZE, "size": list(size), "sources": stamps,
+           "sprites": {name: {"rect": list(rects[name]), "source_size": list(source_sizes[name])} for name in rects}}
+  os.makedirs(directory, exist_ok=True)
+  tmp = page_path(page, directory) + ".tmp.png"
+  pygame.image.save(sheet, tmp)
+  os.replace(tmp, page_path(page, directory))
+  tmp = index_path(page, directory) + ".tmp"
+  with open(tmp, "w") as f:
+    json.dump(index, f, indent=1)
+  os.replace(tmp, index_path(page, directory))
+  return index
+
+def decode_page(path):
+  """``pygame.image.load`` for a page file, rebuilding the page first if its sources changed."""
+  directory, filename = os.path.split(path)
+  page = filename[:-4]
+  if is_stale(page, directory):
+    build(page, directory)
+  return pygame.image.load(path)
+
+class Atlas:
+  """One loaded page: its sprites as rects of a single shared surface."""
+  def __init__(self, page, directory=ATLAS_DIR):
+    self.page = page
+    self.path = page_path(page, directory)
+    self.surface = asset_manager.image(self.path, decode=decode_page,
+                                       placeholder=lambda: asset_manager.solid((SPRITE_SIZE, SPRITE_SIZE), (255, 0, 255, 255), alpha=True))
+    index = _read_index(page, directory) or {"sprites": {}}
+    self.rects = {name: pygame.Rect(entry["rect"]) for name, entry in index["sprites"].items()}
+    self.source_sizes = {name: tuple(entry["source_size"]) for name, entry in index["sprites"].items()}
+
+  def __contains__(self, name):
+    return name in self.rects
+
+  def source_size(self, name):
+    """The size of the original file, for layout; a missing sprite reports its placeholder's size."""
+    return self.source_sizes.get(name, self.surface.get_size())
+
+  def sprite(self, name):
+    """The sprite as a subsurface of the page (the whole placeholder page if it is missing)."""
+    rect = self.rects.get(name)
+    return self.surface.subsurface(rect) if rect is not None and self.surface.get_rect().contains(rect) else self.surface
+
+  def scaled(self, name, size, smooth=True):
+    """The sprite resized to ``size``, through ``asset_manager``'s scaled-surface cache."""
+    return asset_manager.scaled(self.path, size, smooth=smooth, area=self.rects.get(name))
+
+_atlases = {}
+
+def load(page, directory=ATLAS_DIR):
+  """The page's ``Atlas``, built if needed and loaded once per session."""
+  key = (page, directory)
+  if key not in _atlases:
+    _atlases[key] = Atlas(page, directory)
+  return _atlases[key]
+
+if __name__ == "__main__":
+  import time
+  for page in PAGES:
+    stale = is_stale(page)
+    start = time.perf_counter()
+    index = build(page) if stale else _read_index(page, ATLAS_DIR)
+    print(f"{page:>10}: {len(index['sprites'])} sprites on a {index['size'][0]}x{index['size'][1]} page"
+          f" ({'built in %.2f s' % (time.perf_counter() - start) if stale else 'up to date'})")
@@ -1,10 +1,11 @@
-import pygame, math, os
+import pygame, math
+import asset_manager
 
 FRICTION_FACTOR = 0.98
 VELOCITY_THRESHOLD = 0.05
 
 class Ball:
-  def __init__(self, width, height, player_size, x, y):
+  def __init__(self, width, height, player_size, x, y, headless=False):
     self.width = width
     self.height = height
     self.player_size = player_size    
@@ -17,14 +18,19 @@ class Ball:
 
     self.last_touch = None
 
-    try:
-      raw_img = pygame.image.load(os.path.join("assets", "ball.png")).convert_alpha()
-    except (pygame.error, FileNotFoundError):
-      raw_img = pygame.Surface((self.radius*2, self.radius*2), pygame.SRCALPHA)
-      pygame.draw.circle(raw_img, (255, 255, 255), (self.radius, self.radius), self.radius)
+    # headless balls (simulations, tests) never touch the display or the asset folder
+    self.image = None
+    self.rect = pygame.Rect(0, 0, self.radius*2, self.radius*2)
+    self.rect.center = (int(self.x), int(self.y))
+    if not headless:
+      self.load_image()
 
-    self.image = pygame.transform.smoothscale(raw_img, (self.radius*2, self.radius*2))
-    self.rect = self.image.get_rect(center=(int(self.x), int(self.y)))
+  def load_image(self):
+    def placeholder():
+      surf = pygame.Surface((self.radius*2, self.radius*2), pygame.SRCALPHA)
+      pygame.draw.circle(surf, (255, 255, 255), (self.radius, self.radius), self.radius)
+      return surf
+    self.image = asset_manager.scaled(asset_manager.BALL, (self.radius*2, self.radius*2), placeholder=placeholder)
 
   def move(self, play_area, goal_left, goal_right):
     self.last_collision_side = None
@@ -88,5 +94,6 @@ class Ball:
       return True
     return False 
 
-  def draw(self, screen):
-    screen.blit(self.image, self.rect)
+  def draw(self, screen, center=None):
+    """Blit the ball at its rect, or centered on ``center`` (an interpolated position)."""
+    return screen.blit(self.image, self.rect if center is None else self.image.get_rect(center=center))
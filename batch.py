@@ -0,0 +1,190 @@
+"""NumPy batch simulator: N independent matches advanced together, one array op per rule.
+
+Row ``i`` of every array is match ``i``. The rules are the ones in ``Ball.move``,
+``Ball.kick`` and ``MatchEngine.step``, including their integer ``Rect``
+rounding, so a batch row follows the scalar engine to within floating point
+rounding of ``np.hypot`` (see ``compare_with_engine``).
+"""
+import numpy as np
+from ball import FRICTION_FACTOR, VELOCITY_THRESHOLD
+from engine import MatchEngine, PLAYER_SIZE, WIN_SCORE
+
+# per-tick divergence allowed between a batch row and the scalar Ball, in pixels
+TOLERANCE = 1e-6
+
+class BatchMatch:
+  """``n`` matches stored structure-of-arrays: ``ball_pos[0]`` is every ball's x, and so on."""
+  def __init__(self, n, width=1200, height=675, player_size=PLAYER_SIZE, win_score=WIN_SCORE):
+    self.n = n
+    self.width = width
+    self.height = height
+    self.win_score = win_score
+
+    # geometry comes from the scalar engine so the two can never drift apart
+    ref = MatchEngine(width, height, player_size)
+    self.radius = ref.ball.radius
+    self.speed = ref.ball.speed
+    self.main_rect = tuple(ref.main_rect)
+    self.goal_left = tuple(ref.goal_left)
+    self.goal_right = tuple(ref.goal_right)
+    self.player_w, self.player_h = ref.players[0].size
+    self.kick_reach = self.radius + (ref.ball.player_size / 2) + 5
+    self.kickoff = [ref.players[0].topleft, ref.players[1].topleft]
+    self.centre = (width // 2, height // 2)
+    self.kick_order = ref.kick_order
+
+    self.ball_pos = np.empty((2, n))
+    self.ball_vel = np.zeros((2, n))
+    self.ball_rect = np.empty((2, n), dtype=np.int32)    # int center of Ball.rect
+    self.last_touch = np.full(n, -1, dtype=np.int8)      # -1 = nobody
+    self.players = np.empty((2, 2, n), dtype=np.int32)   # [team, (left, top), match]
+    self.score = np.zeros((2, n), dtype=np.int32)
+    self.winner = np.full(n, -1, dtype=np.int8)
+    self.ticks = np.zeros(n, dtype=np.int64)
+    self.reset_positions(np.ones(n, dtype=bool))
+
+  def reset_positions(self, mask):
+    for axis in (0, 1):
+      self.ball_pos[axis, mask] = self.centre[axis]
+      self.ball_vel[axis, mask] = 0.0
+      self.ball_rect[axis, mask] = self.centre[axis]
+      for team in (0, 1):
+        self.players[team, axis, mask] = self.kickoff[team][axis]
+    self.last_touch[mask] = -1
+
+  def player_centers(self, team):
+    return self.players[team, 0] + self.player_w // 2, self.players[team, 1] + self.player_h // 2
+
+  def move_players(self, dx, dy):
+    """Move every player by integer offsets of shape (2, n), clamped to the window like ``Rect.clamp_ip``."""
+    done = self.winner >= 0
+    for team in (0, 1):
+      for axis, delta, limit in ((0, dx, self.width - self.player_w), (1, dy, self.height - self.player_h)):
+        coord = self.players[team, axis]
+        np.add(coord, delta[team], out=coord, where=~done, casting="unsafe")
+        np.clip(coord, 0, limit, out=coord)
+
+  def _rect_hits_goal(self, goal):
+    """``Rect.colliderect`` between every ball rect and a goal rect."""
+    half = self.radius
+    gx, gy, gw, gh = goal
+    cx, cy = self.ball_rect
+    return (cx > gx - half) & (cx < gx + gw + half) & (cy > gy - half) & (cy < gy + gh + half)
+
+  def _move_balls(self, active):
+    r = self.radius
+    left, top, w, h = self.main_rect
+    right, bottom = left + w, top + h
+    x, y = self.ball_pos
+    vx, vy = self.ball_vel
+    # finished matches have zero velocity, so moving them is a no-op
+    x += vx
+    y += vy
+
+    hit_top = y - r <= top
+    hit_bottom = ~hit_top & (y + r >= bottom)
+    np.copyto(y, top + r, where=hit_top)
+    np.copyto(y, bottom - r, where=hit_bottom)
+    np.negative(vy, out=vy, where=hit_top | hit_bottom)
+
+    # Ball.move tests the goal mouth against the rect from the previous tick
+    at_left = x - r <= left
+    at_right = ~at_left & (x + r >= right)
+    bounce_left = at_left & ~self._rect_hits_goal(self.goal_left)
+    bounce_right = at_right & ~self._rect_hits_goal(self.goal_right)
+    np.copyto(x, left + r, where=bounce_left)
+    np.copyto(x, right - r, where=bounce_right)
+    np.negative(vx, out=vx, where=bounce_left | bounce_right)
+
+    self.ball_vel *= FRICTION_FACTOR
+    self.ball_vel[np.abs(self.ball_vel) < VELOCITY_THRESHOLD] = 0.0
+    np.copyto(self.ball_rect, self.ball_pos, where=active, casting="unsafe")  # truncates like int()
+
+  def _kick(self, team, active):
+    px, py = self.player_centers(team)
+    dx = self.ball_pos[0] - px
+    dy = self.ball_pos[1] - py
+    # cheap squared-distance prefilter, then the exact hypot test on the few candidates
+    reach = self.kick_reach + 1.0
+    rows = np.flatnonzero(active & (dx * dx + dy * dy < reach * reach))
+    if rows.size == 0:
+      return rows
+    dx, dy = dx[rows], dy[rows]
+    dist = np.hypot(dx, dy)
+    hit = dist < self.kick_reach
+    rows, dx, dy, dist = rows[hit], dx[hit], dy[hit], dist[hit]
+    dist[dist == 0.0] = 1.0
+    self.ball_vel[0, rows] = (dx / dist) * self.speed
+    self.ball_vel[1, rows] = (dy / dist) * self.speed
+    self.last_touch[rows] = team
+    return rows
+
+  def step(self):
+    """Advance every unfinished match one tick.
+
+    Returns ``(kicks, scorer)``: a bool array (2, n) of which team kicked this tick
+    and an int array (n,) holding the scoring team or -1.
+    """
+    active = self.winner < 0
+    self.ticks += active
+    self._move_balls(active)
+
+    kicks = np.zeros((2, self.n), dtype=bool)
+    for team in self.kick_order:
+      kicks[team, self._kick(team, active)] = True
+
+    into_left = active & self._rect_hits_goal(self.goal_left)
+    into_right = active & ~into_left & self._rect_hits_goal(self.goal_right)
+    scorer = np.full(self.n, -1, dtype=np.int8)
+    scorer[into_left] = 1
+    scorer[into_right] = 0
+    scored = np.flatnonzero(scorer >= 0)
+    if scored.size:
+      self.score[scorer[scored], scored] += 1
+      self.reset_positions(scored)
+      won = scored[self.score[:, scored].max(axis=0) >= self.win_score]
+      self.winner[won] = np.where(self.score[0, won] >= self.win_score, 0, 1)
+    return kicks, scorer
+
+  def own_goal(self, scorer, last_touch):
+    """Own-goal flags for a ``scorer`` array, given ``last_touch`` captured before ``step``."""
+    return (scorer >= 0) & (last_touch == 1 - scorer)
+
+
+def compare_with_engine(ticks=2000, seed=0, n=64):
+  """Drive a batch and ``n`` scalar engines with the same random key presses.
+
+  Returns the largest ball position difference (pixels) seen over the run; it
+  should stay below ``TOLERANCE``.
+  """
+  rng = np.random.default_rng(seed)
+  batch = BatchMatch(n)
+  engines = [MatchEngine(batch.width, batch.height) for _ in range(n)]
+  worst = 0.0
+  for _ in range(ticks):
+    keys = rng.random((n, 2, 4)) < 0.3  # up, down, left, right
+    dx = (keys[..., 3].astype(np.int32) - keys[..., 2]).T * 6
+    dy = (keys[..., 1].astype(np.int32) - keys[..., 0]).T * 6
+    batch.move_players(dx, dy)
+    batch.step()
+    for i, engine in enumerate(engines):
+      for team in (0, 1):
+        engine.move_player(team, *keys[i, team])
+      engine.step()
+      worst = max(worst, abs(engine.ball.x - batch.ball_pos[0, i]), abs(engine.ball.y - batch.ball_pos[1, i]))
+  return worst
+
+
+if __name__ == "__main__":
+  import time
+  print(f"max deviation from scalar engine: {compare_with_engine():.3g} px (tolerance {TOLERANCE})")
+  batch = BatchMatch(100_000)
+  rng = np.random.default_rng(1)
+  dx = rng.integers(-1, 2, (2, batch.n)) * 6
+  dy = rng.integers(-1, 2, (2, batch.n)) * 6
+  start = time.perf_counter()
+  for _ in range(100):
+    batch.move_players(dx, dy)
+    batch.step()
+  per_step = (time.perf_counter() - start) / 100
+  print(f"{batch.n} matches: {per_step * 1000:.2f} ms/step, {batch.n / per_step / 1e6:.1f} M match-ticks/s")
@@ -0,0 +1,201 @@
+"""Array version of ``AIController``: one decision step for thousands of AI players at once.
+
+Every ``if`` in ``AIController._calculate_target_position`` becomes a boolean
+mask, the ``atan2``/``cos``/``sin`` pairs become unit vectors, and the per-AI
+``random.random()`` calls become one draw from a seedable NumPy generator.
+Difficulty parameters are per row, so one batch can mix tiers.
+"""
+import math
+import numpy as np
+from ai import AIController, LOOKAHEAD_MIN_SPEED, TUNABLE_PARAMS
+from trajectory import BallPredictor, predict_positions
+
+# cos/sin of the 3.14159 rotation used for the human-avoidance offset
+_AVOID_COS = math.cos(3.14159)
+_AVOID_SIN = math.sin(3.14159)
+
+def _unit(dx, dy):
+  """(cos, sin) of atan2(dy, dx) without trig; atan2(0, 0) == 0 gives (1, 0)."""
+  dist = np.hypot(dx, dy)
+  zero = dist == 0.0
+  dist[zero] = 1.0
+  return np.where(zero, 1.0, dx / dist), dy / dist
+
+class BatchAI:
+  def __init__(self, n, difficulty="medium", seed=None, **params):
+    """``difficulty`` is a tier name or a sequence of ``n`` names; keyword params
+    (``reaction_time=array``, ``shoot_radius=...``) override the tier values per row."""
+    self.n = n
+    names = [difficulty] * n if isinstance(difficulty, str) else list(difficulty)
+    tiers = {name: AIController(name) for name in set(names)}
+    for param in TUNABLE_PARAMS:
+      values = params.get(param)
+      if values is None:
+        values = [getattr(tiers[name], param) for name in names]
+      setattr(self, param, np.broadcast_to(np.asarray(values, dtype=np.float64), (n,)).copy())
+    self.rng = np.random.default_rng(seed)
+
+    self.cooldown = np.zeros(n, dtype=np.int64)
+    self.decision_timer = np.zeros(n, dtype=np.int64)
+    self.target_x = None  # set to the AI's own center on the first update, like AIController
+    self.target_y = None
+
+  def calculate_targets(self, ball_x, ball_y, ball_vx, ball_vy, ai_x, ai_y, human_x, human_y, width, height, goal_left, goal_right, ai_side):
+    """Vectorized ``_calculate_target_position``; positions are center coordinates of shape (n,)."""
+    left_c = (goal_left[0] + goal_left[2] // 2, goal_left[1] + goal_left[3] // 2)
+    right_c = (goal_right[0] + goal_right[2] // 2, goal_right[1] + goal_right[3] // 2)
+    (my_goal_x, my_goal_y), (human_goal_x, human_goal_y) = (left_c, right_c) if ai_side == "left" else (right_c, left_c)
+
+    ball_to_ai = np.hypot(ball_x - ai_x, ball_y - ai_y)
+    predict = ((self.lookahead > 0) & (ball_to_ai >= self.approach_radius)
+               & (np.hypot(ball_vx, ball_vy) >= LOOKAHEAD_MIN_SPEED))
+    if predict.any():
+      # predict_positions stops each axis at its stop tick, like BallPredictor.stop_tick caps the scalar horizon
+      ticks = np.floor(ball_to_ai / (4.0 * self.speed_multiplier))
+      ahead_x, ahead_y = predict_positions(ball_x, ball_y, ball_vx, ball_vy, np.minimum(self.lookahead, ticks),
+                                           BallPredictor.for_field(width, height))
+      ball_x = np.where(predict, ahead_x, ball_x)
+      ball_y = np.where(predict, ahead_y, ball_y)
+
+    target_x, target_y = self.positional_targets(ball_x, ball_y, ai_x, ai_y, human_x, human_y,
+                                                 my_goal_x, my_goal_y, human_goal_x, human_goal_y)
+
+    # "hunting" oscillation
+    time_factor = self.decision_timer * 0.1
+    target_x += np.cos(time_factor) * 20
+    target_y += np.sin(time_factor * 1.3) * 20
+
+    sloppy = self.rng.random(self.n) > self.accuracy
+    target_x += np.where(sloppy, self.rng.integers(-30, 31, self.n), 0)
+    target_y += np.where(sloppy, self.rng.integers(-30, 31, self.n), 0)
+
+    margin = 30
+    np.clip(target_x, margin, width - margin, out=target_x)
+    np.clip(target_y, margin, height - margin, out=target_y)
+    return target_x, target_y
+
+  def positional_targets(self, ball_x, ball_y, ai_x, ai_y, human_x, human_y, my_goal_x, my_goal_y, human_goal_x, human_goal_y):
+    """Vectorized ``AIController._positional_target``: the noise-free target for each row."""
+    ball_to_ai = np.hypot(ball_x - ai_x, ball_y - ai_y)
+    ball_to_my_goal = np.hypot(ball_x - my_goal_x, ball_y - my_goal_y)
+    ball_to_human_goal = np.hypot(ball_x - human_goal_x, ball_y - human_goal_y)
+    ball_to_human = np.hypot(ball_x - human_x, ball_y - human_y)
+
+    shoot = (ball_to_human_goal < self.shoot_radius) & (ball_to_ai < self.strike_radius)
+    defend = ~shoot & (ball_to_my_goal < self.defend_radius)
+    approach = ~shoot & ~defend & (ball_to_ai < self.approach_radius)
+    chase = ~(shoot | defend | approach)
+
+    # shoot / approach: stand behind the ball on the line to the human goal
+    ux, uy = _unit(human_goal_x - ball_x, human_goal_y - ball_y)
+    behind = np.where(shoot, 25.0, 30.0)
+    target_x = ball_x - ux * behind
+    target_y = ball_y - uy * behind
+
+    defend_x = my_goal_x + (ball_x - my_goal_x) * 0.5
+    defend_y = my_goal_y + (ball_y - my_goal_y) * 0.6
+    np.copyto(target_x, defend_x, where=defend)
+    np.copyto(target_y, defend_y, where=defend)
+
+    intercept_x = human_x + (my_goal_x - human_x) * 0.3
+    intercept_y = human_y + (my_goal_y - human_y) * 0.3
+    chase_x = ball_x * self.aggression + intercept_x * (1 - self.aggression)
+    chase_y = ball_y * self.aggression + intercept_y * (1 - self.aggression)
+    far = ball_to_ai > self.chase_radius
+    chase_x = np.where(far, ball_x + (ball_x - ai_x) * 0.2, chase_x)
+    chase_y = np.where(far, ball_y + (ball_y - ai_y) * 0.2, chase_y)
+    np.copyto(target_x, chase_x, where=chase)
+    np.copyto(target_y, chase_y, where=chase)
+
+    # step away from the human when they are close to the ball
+    avoid = ball_to_human < 100
+    hx, hy = _unit(human_x - ball_x, human_y - ball_y)
+    target_x += np.where(avoid, (hx * _AVOID_COS - hy * _AVOID_SIN) * 40, 0.0)
+    target_y += np.where(avoid, (hy * _AVOID_COS + hx * _AVOID_SIN) * 40, 0.0)
+    return target_x, target_y
+
+  def update(self, ai_left, ai_top, ai_size, ball_x, ball_y, ball_vx, ball_vy, human_x, human_y, width, height, goal_left, goal_right, ai_side):
+    """Vectorized ``update_ai_player``: moves the AI rects (int top-left arrays) in place."""
+    ai_w, ai_h = ai_size
+    ai_x = ai_left + ai_w // 2
+    ai_y = ai_top + ai_h // 2
+    if self.target_x is None:
+      self.target_x = ai_x.astype(np.float64)
+      self.target_y = ai_y.astype(np.float64)
+
+    np.maximum(self.cooldown - 1, 0, out=self.cooldown)
+    self.decision_timer += 1
+    decide = self.decision_timer >= self.reaction_time
+    self.decision_timer[decide] = 0
+    if decide.any():
+      new_x, new_y = self.calculate_targets(ball_x, ball_y, ball_vx, ball_vy, ai_x, ai_y, human_x, human_y, width, height, goal_left, goal_right, ai_side)
+      np.copyto(self.target_x, new_x, where=decide)
+      np.copyto(self.target_y, new_y, where=decide)
+
+    # _move_toward_target; Rect float assignment rounds half up
+    dx = self.target_x - ai_x
+    dy = self.target_y - ai_y
+    distance = np.hypot(dx, dy)
+    moving = distance > 2
+    distance[~moving] = 1.0
+    speed = 4.0 * self.speed_multiplier
+    np.copyto(ai_left, np.floor(ai_left + (dx / distance) * speed + 0.5), where=moving, casting="unsafe")
+    np.copyto(ai_top, np.floor(ai_top + (dy / distance) * speed + 0.5), where=moving, casting="unsafe")
+    np.clip(ai_left, 0, width - ai_w, out=ai_left)
+    np.clip(ai_top, 0, height - ai_h, out=ai_top)
+
+  def update_match(self, match, team):
+    """Drive team ``team`` of a ``batch.BatchMatch`` (team 0 plays on the left)."""
+    hx, hy = match.player_centers(1 - team)
+    self.update(match.players[team, 0], match.players[team, 1], (match.player_w, match.player_h),
+                match.ball_pos[0], match.ball_pos[1], match.ball_vel[0], match.ball_vel[1], hx, hy, match.width, match.height,
+                match.goal_left, match.goal_right, "left" if team == 0 else "right")
+
+
+def compare_with_controller(difficulty="hard", ticks=3000, n=16, seed=0):
+  """Play ``n`` AI-vs-AI matches with scalar controllers and replay their AI decisions in a batch.
+
+  Accuracy jitter is switched off on both sides so the two can be compared
+  step for step. Returns the largest AI position difference seen, in pixels.
+  """
+  import random
+  from engine import MatchEngine
+  engines = [MatchEngine(1200, 675) for _ in range(n)]
+  scalar = [AIController(difficulty, random.Random(seed + i)) for i in range(n)]
+  opponents = [AIController("medium", random.Random(1000 + seed + i)) for i in range(n)]
+  for ai in scalar:
+    ai.accuracy = 1.0
+  batch = BatchAI(n, difficulty, seed=seed, accuracy=1.0)
+  worst = 0
+  for _ in range(ticks):
+    ref = engines[0]
+    arr = lambda get: np.array([get(e) for e in engines])
+    left = arr(lambda e: e.players[0].x).astype(np.int32)
+    top = arr(lambda e: e.players[0].y).astype(np.int32)
+    batch.update(left, top, ref.players[0].size, arr(lambda e: e.ball.x), arr(lambda e: e.ball.y),
+                 arr(lambda e: e.ball.vx), arr(lambda e: e.ball.vy),
+                 arr(lambda e: e.players[1].centerx), arr(lambda e: e.players[1].centery),
+                 ref.width, ref.height, tuple(ref.goal_left), tuple(ref.goal_right), "left")
+    for i, engine in enumerate(engines):
+      engine.update_ai(0, scalar[i])
+      worst = max(worst, abs(engine.players[0].x - left[i]), abs(engine.players[0].y - top[i]))
+      engine.players[0].topleft = (int(left[i]), int(top[i]))  # keep the runs in lockstep
+      engine.update_ai(1, opponents[i])
+      engine.step()
+  return worst
+
+
+if __name__ == "__main__":
+  import time
+  from batch import BatchMatch
+  print(f"max AI position difference vs AIController: {compare_with_controller()} px")
+  match = BatchMatch(10_000)
+  left_ai = BatchAI(match.n, "hard", seed=1)
+  right_ai = BatchAI(match.n, ["easy", "medium"] * (match.n // 2), seed=2)
+  start = time.perf_counter()
+  for _ in range(200):
+    left_ai.update_match(match, 0)
+    right_ai.update_match(match, 1)
+    match.step()
+  per_step = (time.perf_counter() - start) / 200
+  print(f"{match.n} AI pairs: {per_step * 1000:.2f} ms/tick; left wins so far: {(match.winner == 0).sum()}, right wins: {(match.winner == 1).sum()}")
@@ -0,0 +1,248 @@
+"""Headless benchmark suite: ball physics, the AI and every screen's frame, with a JSON baseline.
+
+  python bench.py run                               # print results
+  python bench.py run --save bench_baseline.json    # ... and keep them as a baseline
+  python bench.py compare bench_baseline.json       # run again, flag regressions
+  python bench.py run --only ball ai.hard           # benchmarks whose names start with these
+
+Runs without a display or sound card (SDL's dummy drivers unless others are
+set). Every benchmark is seeded and scripted, so two runs do the same work:
+``Ball.move``/``kick``/``collide_rect`` and ``AIController.update_ai_player``
+in isolation, then ``update()`` + ``draw()`` of both gameplay screens (and
+the first draw of a paused one, which freezes and paints the pause menu),
+``Menu.draw``, both phases of ``OptionMenu.draw`` and ``PauseMenu.draw`` at
+each of ``SIZES``. A benchmark is timed in ``REPEAT`` rounds of enough calls
+to take ~0.2 s; the best round is the result, as it is the least disturbed
+by the rest of the machine. ``compare`` exits with status 1 if anything got
+slower than the baseline by more than ``--threshold`` percent.
+"""
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import argparse, json, platform, random, statistics, sys, time, timeit
+from functools import partial
+import pygame
+
+SIZES = ((800, 450), (1200, 675), (1920, 1080))
+REPEAT = 5
+THRESHOLD = 10.0  # percent slower than the baseline that counts as a regression
+DIFFICULTIES = ("easy", "medium", "hard", "expert")
+
+class _Silent:
+  def play(self): pass
+
+SOUNDS = {"kick": _Silent(), "goal": _Silent()}
+
+# ---------- physics and AI, no display ----------
+def bench_ball_move():
+  from engine import MatchEngine
+  engine = MatchEngine(1200, 675)
+  ball, rng = engine.ball, random.Random(1)
+  def op():
+    if not ball.vx and not ball.vy:  # rolled to a stop: send it off again
+      ball.x, ball.y = engine.width / 2, engine.height / 2
+      ball.vx, ball.vy = rng.uniform(-6, 6), rng.uniform(-6, 6)
+    ball.move(engine.play_area, engine.goal_left, engine.goal_right)
+  return op
+
+def bench_ball_kick():
+  from engine import MatchEngine
+  engine = MatchEngine(1200, 675)
+  ball = engine.ball
+  near = pygame.Rect(0, 0, 80, 80); near.center = (int(ball.x) - 40, int(ball.y))
+  far = pygame.Rect(0, 0, 80, 80); far.center = (int(ball.x) - 400, int(ball.y))
+  def op():  # one kick that connects and one that misses
+    ball.kick(near, 0)
+    ball.kick(far, 1)
+  return op
+
+def bench_ball_collide_rect():
+  from engine import MatchEngine
+  ball = MatchEngine(1200, 675).ball
+  hit = pygame.Rect(int(ball.x) - 10, int(ball.y) - 10, 80, 80)
+  miss = pygame.Rect(int(ball.x) + 200, int(ball.y), 80, 80)
+  def op():
+    ball.collide_rect(hit)
+    ball.collide_rect(miss)
+  return op
+
+def _ball_states(ticks=600, seed=3):
+  """Ball states from a seeded AI match, for timing the AI against realistic positions."""
+  from ai import AIController
+  from engine import MatchEngine
+  engine = MatchEngine(1200, 675)
+  left, right = AIController("hard", random.Random(seed)), AIController("medium", random.Random(seed + 1))
+  states = []
+  for _ in range(ticks):
+    engine.update_ai(0, left); engine.update_ai(1, right); engine.step()
+    if engine.finished:
+      engine.reset()
+    states.append((engine.ball.x, engine.ball.y, engine.ball.vx, engine.ball.vy, tuple(engine.players[0])))
+  return states
+
+def bench_ai(difficulty):
+  from ai import AIController
+  from engine import MatchEngine
+  engine = MatchEngine(1200, 675)
+  controller = AIController(difficulty, random.Random(7))
+  states, ball, human = _ball_states(), engine.ball, engine.players[0]
+  index = [0]
+  def op():
+    x, y, vx, vy, rect = states[index[0]]
+    index[0] = (index[0] + 1) % len(states)
+    ball.x, ball.y, ball.vx, ball.vy = x, y, vx, vy
+    ball.rect.center = (int(x), int(y))
+    human.update(rect)
+    engine.update_ai(1, controller)
+  return op
+
+# ---------- screens, on the dummy display ----------
+def _screen(size):
+  return pygame.display.set_mode(size)
+
+def _inputs(seed=5):
+  """Scripted keys: a new random direction for each player every 15 ticks."""
+  rng, state = random.Random(seed), {"tick": 0, "bits": 0}
+  def read():
+    if state["tick"] % 15 == 0:
+      state["bits"] = rng.randrange(256)
+    state["tick"] += 1
+    return state["bits"]
+  return read
+
+def bench_gameplay(mode, size, paused=False):
+  screen = _screen(size)
+  if mode == "pvai":
+    from pvai import PvAIGameplay
+    gameplay = PvAIGameplay(screen, *size, "left", "hard", SOUNDS, seed=11)
+  else:
+    from pvp import PvPGameplay
+    gameplay = PvPGameplay(screen, *size, "left", "right", SOUNDS)
+  gameplay.input_source = _inputs()
+  gameplay.paused = paused
+  def op():
+    if gameplay.finished:
+      gameplay.engine.reset()
+    gameplay.update()
+    if paused:
+      gameplay.pause_menu.thaw()  # time the draw that pauses (frame, freeze, paint); frozen ones after it do nothing
+    gameplay.draw(0.5)
+  return op
+
+def bench_menu(size):
+  from menu import Menu
+  return Menu(_screen(size), *size).draw
+
+def bench_option_menu(phase, size):
+  from option_menu import OptionMenu
+  menu = OptionMenu(_screen(size), *size)
+  if phase == "squad":
+    menu.selected_mode, menu.phase, menu.selected_side = "pvai", "squad", "left"
+    menu.scale_squads()
+  return menu.draw
+
+def bench_pause_menu(size):
+  from resume import PauseMenu
+  screen = _screen(size)
+  menu = PauseMenu(screen, *size)
+  return menu.draw
+
+BENCHMARKS = {
+  "ball.move": bench_ball_move,
+  "ball.kick": bench_ball_kick,
+  "ball.collide_rect": bench_ball_collide_rect,
+  **{f"ai.{difficulty}": partial(bench_ai, difficulty) for difficulty in DIFFICULTIES},
+}
+for _w, _h in SIZES:
+  _size = f"{_w}x{_h}"
+  BENCHMARKS.update({
+    f"frame.pvai.{_size}": partial(bench_gameplay, "pvai", (_w, _h)),
+    f"frame.pvp.{_size}": partial(bench_gameplay, "pvp", (_w, _h)),
+    f"frame.paused.{_size}": partial(bench_gameplay, "pvai", (_w, _h), paused=True),
+    f"menu.{_size}": partial(bench_menu, (_w, _h)),
+    f"options.mode.{_size}": partial(bench_option_menu, "mode", (_w, _h)),
+    f"options.squad.{_size}": partial(bench_option_menu, "squad", (_w, _h)),
+    f"pause.{_size}": partial(bench_pause_menu, (_w, _h)),
+  })
+
+# ---------- running and comparing ----------
+def measure(op, repeat=REPEAT):
+  """{"best_us", "median_us", "calls"}: microseconds per call over ``repeat`` rounds of ~0.2 s each."""
+  op()  # warm caches (fonts, scaled images) outside the timing, as a running game would have them
+  timer = timeit.Timer(op)
+  calls, _ = timer.autorange()
+  rounds = [t / calls * 1e6 for t in timer.repeat(repeat, calls)]
+  return {"best_us": min(rounds), "median_us": statistics.median(rounds), "calls": calls}
+
+def select(names, only):
+  return [name for name in names if not only or any(name.startswith(prefix) for prefix in only)]
+
+def run(names, repeat=REPEAT, report=print):
+  pygame.init()
+  results = {}
+  for name in names:
+    results[name] = measure(BENCHMARKS[name](), repeat)
+    report(f"{name:<28} {results[name]['best_us']:>10.2f} us  (median {results[name]['median_us']:.2f})")
+  pygame.quit()
+  return results
+
+def environment():
+  return {"python": platform.python_version(), "pygame": pygame.version.ver, "sdl": ".".join(map(str, pygame.get_sdl_version())),
+          "machine": platform.machine(), "system": platform.platform(), "video": os.environ.get("SDL_VIDEODRIVER"),
+          "date": time.strftime("%Y-%m-%d %H:%M:%S")}
+
+def compare(baseline, results, threshold=THRESHOLD):
+  """Print each benchmark against the baseline; returns the names that regressed."""
+  regressed = []
+  print(f"{'benchmark':<28} {'baseline':>10} {'now':>10}  change")
+  for name, now in results.items():
+    before = baseline.get(name)
+    if before is None:
+      print(f"{name:<28} {'-':>10} {now['best_us']:>10.2f}  new")
+      continue
+    change = (now["best_us"] / before["best_us"] - 1) * 100
+    flag = "REGRESSION" if change > threshold else "faster" if change < -threshold else ""
+    if flag == "REGRESSION":
+      regressed.append(name)
+    print(f"{name:<28} {before['best_us']:>10.2f} {now['best_us']:>10.2f}  {change:+6.1f}%  {flag}")
+  return regressed
+
+def main(argv=None):
+  parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+  sub = parser.add_subparsers(dest="command", required=True)
+  run_cmd = sub.add_parser("run", help="run the benchmarks and print the results")
+  run_cmd.add_argument("--save", metavar="FILE", help="write the results to FILE as a JSON baseline")
+  cmp_cmd = sub.add_parser("compare", help="run the baseline's benchmarks again and flag regressions")
+  cmp_cmd.add_argument("baseline")
+  cmp_cmd.add_argument("--threshold", type=float, default=THRESHOLD, help="percent slower that counts as a regression")
+  for cmd in (run_cmd, cmp_cmd):
+    cmd.add_argument("--only", nargs="+", metavar="PREFIX", help="only benchmarks whose names start with these")
+    cmd.add_argument("--repeat", type=int, default=REPEAT, help="timed rounds per benchmark")
+  sub.add_parser("list", help="list the benchmarks")
+  args = parser.parse_args(argv)
+
+  if args.command == "list":
+    print("\n".join(BENCHMARKS))
+    return 0
+  if args.command == "run":
+    results = run(select(BENCHMARKS, args.only), args.repeat)
+    if args.save:
+      with open(args.save, "w") as f:
+        json.dump({"environment": environment(), "results": results}, f, indent=2)
+      print(f"saved {len(results)} results to {args.save}")
+    return 0
+
+  with open(args.baseline) as f:
+    baseline = json.load(f)
+  if baseline["environment"]["machine"] != platform.machine() or baseline["environment"]["pygame"] != pygame.version.ver:
+    print("note: the baseline was recorded on a different machine or pygame version")
+  names = select([name for name in baseline["results"] if name in BENCHMARKS], args.only)
+  results = run(names, args.repeat, report=lambda line: None)
+  regressed = compare(baseline["results"], results, args.threshold)
+  print(f"{len(regressed)} regression(s) beyond {args.threshold:g}%" if regressed else "no regressions")
+  return 1 if regressed else 0
+
+if __name__ == "__main__":
+  sys.exit(main())
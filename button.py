@@ -1,25 +1,10 @@
-import pygame
-
 class Button():
+  """An image that can be clicked; clicks come from a ``dispatcher.Dispatcher`` it is added to."""
   def __init__(self, x, y, image, screen):
     self.image = image
     self.screen = screen
     self.rect = self.image.get_rect()
     self.rect.topleft = (x, y)
-    self.clicked = False
-      
-  def draw(self):
-    action = False
-    pos = pygame.mouse.get_pos()
-    
-    if self.rect.collidepoint(pos):
-        if pygame.mouse.get_pressed()[0] == 1 and self.clicked == False:
-            self.clicked = True
-            action = True
-    
-    if pygame.mouse.get_pressed()[0] == 0: 
-        self.clicked = False
 
+  def draw(self):
     self.screen.blit(self.image, (self.rect.x, self.rect.y))
-    
-    return action
\ No newline at end of file
@@ -0,0 +1,51 @@
+"""Dirty-rectangle rendering for the gameplay screens.
+
+With it enabled, a frame does not repaint the whole window. It restores the
+static field layer only where sprites were drawn last frame, draws this
+frame's sprites, and hands back the union of both sets of rects for
+``pygame.display.update``. Anything no sprite touched stays on screen as it
+is. Overlays that cover the whole window or are not tracked (pause menu,
+goal banner, winner screen) force a full redraw, and so does the frame after
+them, since whatever they left behind has to go. Disabled, every frame is a
+full redraw and ``end()`` returns None, meaning flip the whole display.
+"""
+
+class DirtyRenderer:
+  def __init__(self, enabled=False):
+    self.enabled = enabled
+    self.previous = None  # rects drawn last frame; None forces a full redraw
+    self.current = []
+    self.full = True
+    self.overlay = False
+
+  def invalidate(self):
+    """Repaint everything next frame, e.g. after a resize or a new field layer."""
+    self.previous = None
+
+  def begin(self, screen, background, overlay=False):
+    """Start a frame: restore ``background`` under last frame's sprites, or all of it.
+
+    ``overlay`` says this frame will draw something untracked on top.
+    """
+    self.current = []
+    self.overlay = overlay
+    self.full = overlay or not self.enabled or self.previous is None
+    if self.full:
+      screen.blit(background, (0, 0))
+    else:
+      for rect in self.previous:
+        screen.blit(background, rect, rect)
+
+  def add(self, rect):
+    """Track a region drawn this frame."""
+    self.current.append(rect)
+    return rect
+
+  def blit(self, screen, surface, dest):
+    return self.add(screen.blit(surface, dest))
+
+  def end(self):
+    """Rects to pass to ``pygame.display.update``, or None to update the whole display."""
+    rects = None if self.full else self.previous + self.current
+    self.previous = None if self.overlay else self.current
+    return rects
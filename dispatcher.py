@@ -0,0 +1,83 @@
+"""Event-driven mouse input: clicks routed to widgets through a hit-test index.
+
+Screens used to find clicks by polling: every ``Button.draw`` read the mouse
+position and button state, so clicking depended on drawing, a press
+could fire twice or be missed between frames, and a button that appeared
+under a held mouse (the next screen's, say) fired at once. A ``Dispatcher``
+instead reads the ``MOUSEBUTTONDOWN``/``MOUSEBUTTONUP`` events main.py
+already collects. A click is a left press and release on the same widget,
+handled in the frame its release arrives.
+
+Widgets are anything with a ``rect`` (and optionally ``visible``); they are
+bucketed into a grid of ``CELL``-pixel cells, so finding the widget under a
+point looks at one cell's few entries however many are registered. Where
+widgets overlap, the one added last (drawn on top) wins.
+"""
+import pygame
+from viewport import logical_pos
+
+CELL = 64
+LEFT = 1
+
+class Dispatcher:
+  def __init__(self, cell=CELL):
+    self.cell = cell
+    self.entries = {}  # name -> (widget, callback, order)
+    self.grid = {}     # (column, row) -> names of the widgets overlapping that cell
+    self.order = 0
+    self.pressed = None  # name of the widget the left button went down on
+
+  def _cells(self, rect):
+    for column in range(rect.left // self.cell, (rect.right - 1) // self.cell + 1):
+      for row in range(rect.top // self.cell, (rect.bottom - 1) // self.cell + 1):
+        yield column, row
+
+  def add(self, name, widget, callback=None):
+    """Register ``widget`` under ``name`` (replacing any widget of that name); ``callback()`` runs on its clicks."""
+    self.remove(name)
+    self.order += 1
+    self.entries[name] = (widget, callback, self.order)
+    for cell in self._cells(widget.rect):
+      self.grid.setdefault(cell, []).append(name)
+    return widget
+
+  def remove(self, name):
+    entry = self.entries.pop(name, None)
+    if entry is None:
+      return
+    for cell in self._cells(entry[0].rect):
+      self.grid[cell].remove(name)
+    if self.pressed == name:
+      self.pressed = None
+
+  def clear(self):
+    self.entries.clear()
+    self.grid.clear()
+    self.pressed = None
+
+  def hit(self, pos):
+    """Name of the topmost visible widget at ``pos`` (screen coordinates), or None."""
+    best, best_order = None, -1
+    for name in self.grid.get((pos[0] // self.cell, pos[1] // self.cell), ()):
+      widget, _, order = self.entries[name]
+      if order > best_order and getattr(widget, "visible", True) and widget.rect.collidepoint(pos):
+        best, best_order = name, order
+    return best
+
+  def dispatch(self, events):
+    """Handle this frame's mouse events; returns the names clicked, in order, after running their callbacks."""
+    clicked = []
+    for event in events:
+      if event.type not in (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP) or event.button != LEFT:
+        continue
+      name = self.hit(logical_pos(event.pos))
+      if event.type == pygame.MOUSEBUTTONDOWN:
+        self.pressed = name
+      else:
+        if name is not None and name == self.pressed:
+          clicked.append(name)
+          callback = self.entries[name][1]
+          if callback:
+            callback()
+        self.pressed = None
+    return clicked
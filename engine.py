@@ -0,0 +1,193 @@
+import pygame
+from ball import Ball
+
+WIN_SCORE = 3
+PLAYER_SPEED = 6
+PLAYER_SIZE = 80
+TICKS_PER_SECOND = 60  # simulation rate the rules are tuned for
+# one team's keys in a tick; apply_inputs takes team 0's in the low nibble, team 1's in the high one
+UP, DOWN, LEFT, RIGHT = 1, 2, 4, 8
+
+def input_bits(up, down, left, right, team=0):
+  """Pack one player's direction keys into ``apply_inputs`` form for ``team``."""
+  bits = (UP if up else 0) | (DOWN if down else 0) | (LEFT if left else 0) | (RIGHT if right else 0)
+  return bits << (4 * team)
+
+def field_rects(width, height):
+  """(main_rect, goal_left, goal_right) for a window of the given size."""
+  goal_height = max(120, height // 5); goal_thickness = max(32, width // 9)
+  goal_left = pygame.Rect(0, height//2 - goal_height//2, goal_thickness, goal_height)
+  goal_right = pygame.Rect(width-goal_thickness, height//2 - goal_height//2, goal_thickness, goal_height)
+  margin_x = width // 9.5; margin_y = height // 10
+  main_rect = pygame.Rect(margin_x, margin_y, width - 2*margin_x, height - 2*margin_y)
+  return main_rect, goal_left, goal_right
+
+class MatchEngine:
+  """Headless match rules: player movement, ball physics, kicks, goals and scoring.
+
+  Team 0 always starts on the left and scores in ``goal_right``; team 1 starts on
+  the right and scores in ``goal_left``. Nothing here touches the display, the
+  keyboard or the asset folder, so matches can be stepped at CPU speed.
+
+  By default the first team to ``win_score`` goals wins. With ``match_ticks``
+  the match also ends when the clock runs out: the team ahead wins, and a tie
+  goes to ``extra_ticks`` of extra time (if any) and then stands as a draw,
+  i.e. ``finished`` with ``winner`` None. ``win_score=None`` turns the goal
+  limit off for purely timed matches.
+  """
+  def __init__(self, width, height, player_size=PLAYER_SIZE, win_score=WIN_SCORE, headless=True,
+               match_ticks=None, extra_ticks=0):
+    self.width = width
+    self.height = height
+    self.win_score = win_score
+    self.match_ticks = match_ticks
+    self.extra_ticks = extra_ticks
+
+    self.players = [pygame.Rect(0, 0, player_size, player_size), pygame.Rect(0, 0, player_size, player_size)]
+    self.kick_order = (0, 1)
+    self.ball = Ball(width, height, player_size, width // 2, height // 2, headless=headless)
+
+    self.score = [0, 0]
+    self.winner = None
+    self.finished = False
+    self.extra_time = False
+    self.last_goal = None  # (scorer, own_goal) of the most recent goal
+    self.ticks = 0
+
+    self._create_field()
+    self.reset_positions()
+
+  # ------------------- GEOMETRY -------------------
+  def _create_field(self):
+    self.main_rect, self.goal_left, self.goal_right = field_rects(self.width, self.height)
+    self.play_area = [self.main_rect, self.goal_left, self.goal_right]
+
+  def resize(self, width, height):
+    self.width, self.height = width, height
+    self.ball.width, self.ball.height = width, height
+    self._create_field()
+
+  def set_player_size(self, team, size):
+    """Resize a player's hitbox around its current center (e.g. after the sprite was rescaled)."""
+    rect = self.players[team]
+    center = rect.center
+    rect.size = size
+    rect.center = center
+    self.ball.player_size = rect.width
+
+  def kickoff_position(self, team):
+    return (200, self.height // 2) if team == 0 else (self.width - 200, self.height // 2)
+
+  def reset_positions(self):
+    self.ball.x, self.ball.y = self.width // 2, self.height // 2
+    self.ball.vx, self.ball.vy = 0.0, 0.0; self.ball.last_touch = None
+    self.ball.rect.center = (int(self.ball.x), int(self.ball.y))
+    for team, rect in enumerate(self.players):
+      rect.center = self.kickoff_position(team)
+
+  def reset(self):
+    """Start a fresh match on the same field."""
+    self.score[0] = self.score[1] = 0
+    self.winner = None
+    self.finished = False
+    self.extra_time = False
+    self.last_goal = None
+    self.ticks = 0
+    self.reset_positions()
+
+  def clock(self):
+    """(seconds, extra time?) for the match clock: time left in a timed match, time played otherwise."""
+    if self.match_ticks is None:
+      return self.ticks // TICKS_PER_SECOND, False
+    end = self.match_ticks + (self.extra_ticks if self.extra_time else 0)
+    return -(-max(0, end - self.ticks) // TICKS_PER_SECOND), self.extra_time
+
+  # ------------------- INPUT -------------------
+  def move_player(self, team, up=False, down=False, left=False, right=False, speed=PLAYER_SPEED):
+    rect = self.players[team]
+    if up: rect.y -= speed
+    if down: rect.y += speed
+    if left: rect.x -= speed
+    if right: rect.x += speed
+    rect.clamp_ip(pygame.Rect(0, 0, self.width, self.height))
+
+  def apply_inputs(self, inputs, controllers=None):
+    """Move both players for one tick.
+
+    Teams in ``controllers`` (team -> AI controller) steer themselves; the
+    others follow their nibble of ``inputs``. Humans move first, so the AI
+    reacts to where they are this tick.
+    """
+    controllers = controllers or {}
+    for team in (0, 1):
+      if team not in controllers:
+        bits = inputs >> (4 * team)
+        self.move_player(team, bits & UP, bits & DOWN, bits & LEFT, bits & RIGHT)
+    for team, controller in controllers.items():
+      self.update_ai(team, controller)
+
+  def update_ai(self, team, controller):
+    side = "left" if team == 0 else "right"
+    controller.update_ai_player(self.players[team], self.ball, self.players[1 - team], self.width, self.height,
+                                self.goal_left, self.goal_right, side)
+
+  # ------------------- SIMULATION -------------------
+  def step(self):
+    """Advance the ball one tick and resolve kicks and goals.
+
+    Returns the list of events that happened this tick: one ``"kick"`` per
+    successful kick, ``"goal"`` when somebody scored (see ``last_goal``),
+    ``"extra_time"`` when a tied timed match goes into extra time and
+    ``"full_time"`` when the clock ends the match.
+    """
+    events = []
+    if self.finished:
+      return events
+    self.ticks += 1
+
+    self.ball.move(self.play_area, self.goal_left, self.goal_right)
+    for team in self.kick_order:
+      if self.ball.kick(self.players[team], team): events.append("kick")
+
+    scorer, conceding_team = None, None
+    if self.ball.rect.colliderect(self.goal_left):
+      conceding_team, scorer = 0, 1
+    elif self.ball.rect.colliderect(self.goal_right):
+      conceding_team, scorer = 1, 0
+    if scorer is not None:
+      own_goal = (self.ball.last_touch == conceding_team)
+      self.score[scorer] += 1
+      self.last_goal = (scorer, own_goal)
+      events.append("goal")
+      self.reset_positions()
+      if self.win_score is not None and (self.score[0] >= self.win_score or self.score[1] >= self.win_score):
+        self._finish(0 if self.score[0] >= self.win_score else 1)
+        return events
+
+    if self.match_ticks is not None and self.ticks == self.match_ticks + (self.extra_ticks if self.extra_time else 0):
+      if self.score[0] == self.score[1] and self.extra_ticks and not self.extra_time:
+        self.extra_time = True
+        self.reset_positions()
+        events.append("extra_time")
+      else:
+        self._finish(None if self.score[0] == self.score[1] else int(self.score[1] > self.score[0]))
+        events.append("full_time")
+    return events
+
+  def _finish(self, winner):
+    self.winner = winner
+    self.finished = True
+    self.ball.vx = self.ball.vy = 0.0
+
+
+def run_ai_match(left_ai, right_ai, width=1200, height=675, max_ticks=60 * 60 * 5, engine=None):
+  """Play AI against AI headlessly until the match is over or ``max_ticks`` run out.
+
+  Returns the engine so callers can read ``score``, ``winner`` and ``ticks``.
+  """
+  engine = engine or MatchEngine(width, height)
+  while not engine.finished and engine.ticks < max_ticks:
+    engine.update_ai(0, left_ai)
+    engine.update_ai(1, right_ai)
+    engine.step()
+  return engine
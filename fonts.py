@@ -0,0 +1,130 @@
+"""Shared font registry and rendered-text cache.
+
+Opening a TTF file is slow, and so is rasterising a string, yet the menus and
+the gameplay screens used to do both on every frame. ``get_font`` keeps loaded
+fonts by (path, size) and ``render`` keeps rendered strings by (text, size,
+color); both are bounded LRU caches, so sizes left behind by window resizes
+age out on their own. A screen that knows which sizes it stopped using can
+drop them right away with ``forget``.
+
+Rendered surfaces are shared between callers: blit them, never draw on them.
+"""
+import os
+from collections import OrderedDict
+import pygame
+import profiler
+
+FONT_PATH = os.path.join("assets", "fonts", "LuckiestGuy-Regular.ttf")
+MAX_FONTS = 16    # each size of each face is a separate FreeType object
+MAX_TEXTS = 256   # rendered strings: scores, banners, button labels
+
+_fonts = OrderedDict()  # (path, size) -> Font
+_texts = OrderedDict()  # (path, size, text, color, ...) -> Surface
+
+def _touch(cache, key, limit, make):
+  try:
+    cache.move_to_end(key)
+    return cache[key]
+  except KeyError:
+    value = cache[key] = make()
+    if len(cache) > limit:
+      cache.popitem(last=False)
+    return value
+
+def _load(path, size):
+  with profiler.section("font load"):
+    try:
+      return pygame.font.Font(path, size)
+    except (pygame.error, FileNotFoundError):
+      return pygame.font.Font(None, size)
+
+def _rasterise(text, size, color, path, antialias):
+  with profiler.section("text render"):
+    return get_font(size, path).render(text, antialias, color)
+
+def get_font(size, path=FONT_PATH):
+  """The font at ``size``, loaded once; falls back to pygame's default font if ``path`` is missing."""
+  return _touch(_fonts, (path, size), MAX_FONTS, lambda: _load(path, size))
+
+def render(text, size, color, path=FONT_PATH, antialias=True):
+  """``text`` rendered in ``color``, rasterised once per (text, size, color)."""
+  color = tuple(color)
+  return _touch(_texts, (path, size, text, color, antialias), MAX_TEXTS,
+                lambda: _rasterise(text, size, color, path, antialias))
+
+def render_outlined(text, size, color, stroke_color, stroke_width, path=FONT_PATH):
+  """``text`` with a ``stroke_width`` outline, composed once into a single surface.
+
+  The outline is the text in ``stroke_color`` stamped at every offset of the
+  (2w+1)x(2w+1) square around it, which is what the old per-frame loop drew;
+  blit the result centered where the plain text would go.
+  """
+  color, stroke_color = tuple(color), tuple(stroke_color)
+  def make():
+    font = get_font(size, path)
+    fill = font.render(text, True, color)
+    stroke = font.render(text, True, stroke_color)
+    w = stroke_width
+    surf = pygame.Surface((fill.get_width() + 2 * w, fill.get_height() + 2 * w), pygame.SRCALPHA)
+    for dx in range(-w, w + 1):
+      for dy in range(-w, w + 1):
+        if dx or dy:
+          surf.blit(stroke, (w + dx, w + dy))
+    surf.blit(fill, (w, w))
+    return surf
+  return _touch(_texts, (path, size, text, color, stroke_color, stroke_width), MAX_TEXTS, make)
+
+def blit_outlined(surface, text, size, center, color=(255, 255, 255), stroke_color=(0, 0, 0), stroke_width=2, path=FONT_PATH):
+  """Draw outlined text centered on ``center`` with a single blit."""
+  with profiler.section("outlined text"):
+    label = render_outlined(text, size, color, stroke_color, stroke_width, path)
+    return surface.blit(label, label.get_rect(center=center))
+
+def forget(sizes, path=FONT_PATH):
+  """Drop fonts and rendered text at ``sizes``, e.g. the sizes a resize made obsolete."""
+  sizes = set(sizes)
+  for key in [k for k in _fonts if k[0] == path and k[1] in sizes]:
+    del _fonts[key]
+  for key in [k for k in _texts if k[0] == path and k[1] in sizes]:
+    del _texts[key]
+
+def clear():
+  _fonts.clear()
+  _texts.clear()
+
+
+if __name__ == "__main__":
+  # menu frame time with the outline drawn the old way (one render and blit per offset) and from the cache
+  import time
+  os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+  pygame.init()
+  screen = pygame.display.set_mode((1200, 675))
+  from menu import Menu
+  from option_menu import OptionMenu
+
+  def stroke_loop(surface, text, size, center, color=(255, 255, 255), stroke_color=(0, 0, 0), stroke_width=2, path=FONT_PATH):
+    font = get_font(size, path)
+    for dx in range(-stroke_width, stroke_width + 1):
+      for dy in range(-stroke_width, stroke_width + 1):
+        if dx or dy:
+          stroke_surf = font.render(text, True, stroke_color)
+          surface.blit(stroke_surf, stroke_surf.get_rect(center=(center[0] + dx, center[1] + dy)))
+    text_surf = font.render(text, True, color)
+    return surface.blit(text_surf, text_surf.get_rect(center=center))
+
+  squad = OptionMenu(screen, 1200, 675)
+  squad.phase, squad.selected_mode, squad.selected_side = "squad", "pvai", "left"
+  screens = {"menu": Menu(screen, 1200, 675), "mode select": OptionMenu(screen, 1200, 675), "squad select": squad}
+  import fonts  # the module the menus use, not this __main__ copy
+  cached = fonts.blit_outlined
+  for name, menu in screens.items():
+    times = []
+    for draw in (stroke_loop, cached):
+      fonts.blit_outlined = draw
+      menu.draw()  # warm up
+      start = time.perf_counter()
+      for _ in range(100):
+        menu.draw()
+      times.append((time.perf_counter() - start) * 10)
+    fonts.blit_outlined = cached
+    print(f"{name:<13} per-frame outline loop {times[0]:6.2f} ms, cached outline {times[1]:6.2f} ms")
@@ -0,0 +1,102 @@
+"""Start-up asset loading on a thread pool, behind a splash screen.
+
+The window opens and shows ``draw_splash`` straight away while worker threads
+decode images and sounds (``pygame.image.load`` releases the GIL, so the
+splash keeps animating). Jobs are queued in the order the player reaches the
+screens: the main menu first, then the mode/squad menus, then what a match
+needs. ``LAZY`` assets (the team and scoreboard atlas pages) go last and
+nothing waits for them at start-up. ``poll`` hands finished decodes to
+``asset_manager`` on the main thread, where they get converted to the display
+format. If a screen asks for
+an asset whose decode is still running, ``asset_manager`` waits for that
+decode instead of reading the file a second time.
+"""
+import os
+from concurrent.futures import ThreadPoolExecutor
+import pygame
+import asset_manager, atlas, fonts
+
+# (stage, images as (path, alpha), sounds), in the order the screens need them
+STAGES = [
+  ("menu", [(asset_manager.MENU_BACKGROUND, False), (asset_manager.MENU_BUTTON, True)], []),
+  ("options", [(asset_manager.FIELD, False), (asset_manager.HOME_PREVIEW, True), (asset_manager.VISITOR_PREVIEW, True)], []),
+  ("match", [(asset_manager.BALL, True), (asset_manager.PAUSE_BUTTON, True), (asset_manager.VOLUME_ON_BUTTON, True),
+             (asset_manager.VOLUME_OFF_BUTTON, True), (asset_manager.RESUME_BUTTON, True), (asset_manager.QUIT_BUTTON, True),
+             (asset_manager.SCOREBOARD_BOX, True), (asset_manager.SCOREBOARD_HOME, True), (asset_manager.SCOREBOARD_VISITOR, True),
+             (asset_manager.SCOREBOARD_TIME, True), (asset_manager.SCOREBOARD_EXTRA_TIME, True)],
+   [asset_manager.KICK_SOUND, asset_manager.GOAL_SOUND]),
+]
+# (path, alpha, decode); the team pages get rebuilt here, off the main thread, when their sources changed
+LAZY = [(atlas.page_path(page), True, atlas.decode_page) for page in ("home", "visitor", "scoreboard")]
+
+class Loader:
+  def __init__(self, stages=STAGES, lazy=LAZY, workers=None):
+    self.executor = ThreadPoolExecutor(max_workers=workers or min(4, os.cpu_count() or 1), thread_name_prefix="assets")
+    self.stages = [name for name, _, _ in stages]
+    self.jobs = []  # [stage, future, finish] in submission order; finished jobs are dropped
+    self.total = {}
+    sounds_ok = pygame.mixer.get_init() is not None
+    for name, images, sounds in stages:
+      for path, alpha in images:
+        self._add(name, asset_manager.load_async(self.executor, path, alpha), lambda p=path, a=alpha: asset_manager.image(p, a))
+      for path in sounds if sounds_ok else []:
+        self._add(name, asset_manager.sound_async(self.executor, path), lambda p=path: asset_manager.sound(p))
+    for path, alpha, decode in lazy:
+      self._add(None, asset_manager.load_async(self.executor, path, alpha, decode),
+                lambda p=path, a=alpha, d=decode: asset_manager.image(p, a, decode=d))
+
+  def _add(self, stage, future, finish):
+    self.total[stage] = self.total.get(stage, 0) + 1
+    if future is not None:  # None: already loaded
+      self.jobs.append((stage, future, finish))
+
+  def poll(self):
+    """Install every finished decode; call once per frame from the main thread."""
+    waiting = []
+    for job in self.jobs:
+      stage, future, finish = job
+      if not future.done():
+        waiting.append(job)
+        continue
+      try:
+        finish()
+      except (pygame.error, FileNotFoundError):
+        pass  # remembered by asset_manager; the screen that needs it uses a placeholder
+    self.jobs = waiting
+
+  def remaining(self, stage):
+    """Jobs still running for ``stage`` and every stage before it."""
+    upto = self.stages[:self.stages.index(stage) + 1]
+    return sum(1 for job in self.jobs if job[0] in upto)
+
+  def ready(self, stage):
+    return self.remaining(stage) == 0
+
+  def progress(self, stage):
+    """Fraction of ``stage`` and the stages before it that has loaded."""
+    upto = self.stages[:self.stages.index(stage) + 1]
+    total = sum(self.total.get(name, 0) for name in upto)
+    return 1.0 if total == 0 else 1.0 - self.remaining(stage) / total
+
+  @property
+  def done(self):
+    return not self.jobs
+
+  def shutdown(self):
+    """Drop queued decodes and wait for the ones already running."""
+    self.executor.shutdown(wait=True, cancel_futures=True)
+
+def draw_splash(screen, progress, ticks=None):
+  """Title, a progress bar filled to ``progress`` and a moving dot so a stall still looks alive."""
+  width, height = screen.get_size()
+  ticks = pygame.time.get_ticks() if ticks is None else ticks
+  screen.fill((40, 40, 80))
+  title = fonts.render("Tiny football", max(20, int(height * 0.1)), (255, 255, 255))
+  screen.blit(title, title.get_rect(center=(width // 2, height * 2 // 5)))
+  bar = pygame.Rect(0, 0, width // 3, max(6, height // 40))
+  bar.center = (width // 2, height * 3 // 5)
+  pygame.draw.rect(screen, (20, 20, 40), bar)
+  pygame.draw.rect(screen, (255, 255, 255), (bar.x, bar.y, int(bar.width * max(0.0, min(1.0, progress))), bar.height))
+  pygame.draw.rect(screen, (255, 255, 255), bar, 1)
+  dot = bar.x + (ticks // 4) % bar.width
+  pygame.draw.circle(screen, (255, 255, 255), (dot, bar.bottom + bar.height * 2), max(2, bar.height // 2))
@@ -1,120 +1,275 @@
-import pygame, os
+import time
+STARTED = time.perf_counter()  # --startup-timing counts from here, before pygame is imported
+import pygame, os, argparse
+import asset_manager, profiler, snapshot
+from loader import Loader, draw_splash
 from menu import Menu
 from option_menu import OptionMenu
 from pvp import PvPGameplay
 from pvai import PvAIGameplay
+from viewport import Viewport
+from engine import WIN_SCORE, TICKS_PER_SECOND
+from timestep import FixedTimestep
+from replay import Recorder
+from ai import load_difficulty_table
+from scenes import SceneStack, MatchPool, match_key
 
 WIDTH = 1200 
 HEIGHT = 675  
 
-def main():
+def parse_args(argv=None):
+  parser = argparse.ArgumentParser(description="Tiny football")
+  parser.add_argument("--ai", default="medium", choices=["easy", "medium", "hard", "expert", "search"],
+                      help="AI difficulty in Player vs AI; 'search' plans moves in a background worker")
+  parser.add_argument("--dirty-rects", action="store_true",
+                      help="in matches, repaint and update only the screen regions that changed")
+  parser.add_argument("--fixed-resolution", action="store_true",
+                      help=f"draw everything at {WIDTH}x{HEIGHT} and scale the frame to the window")
+  parser.add_argument("--match-minutes", type=float, default=None,
+                      help=f"play timed matches of this length instead of first to {WIN_SCORE} goals")
+  parser.add_argument("--extra-minutes", type=float, default=0,
+                      help="extra time played when a timed match is level at full time")
+  parser.add_argument("--fps", type=int, default=60,
+                      help="frame rate cap, 0 for none; matches simulate at --tick-rate whatever it is")
+  parser.add_argument("--tick-rate", type=int, default=TICKS_PER_SECOND,
+                      help="simulation ticks per second; the rules are tuned for the default, so this also sets game speed")
+  parser.add_argument("--startup-timing", action="store_true",
+                      help="print the time to the first frame, to the usable menu and to the last asset, then quit")
+  parser.add_argument("--record", metavar="DIR", default=None,
+                      help="save every match to DIR for replay.py (except against the search AI, which is not replayable)")
+  parser.add_argument("--profile-trace", metavar="FILE", default=None,
+                      help="write every frame's phase timings to FILE as Chrome trace events (F3 shows them live)")
+  return parser.parse_args(argv)
+
+def close_match(gameplay):
+  """Close a match screen, saving it for the next launch if it was left unfinished (see snapshot.py)."""
+  if gameplay.finished:
+    snapshot.discard(snapshot.SAVE_FILE)
+  elif gameplay.engine.ticks:
+    snapshot.save(snapshot.SAVE_FILE, gameplay)
+  gameplay.close()
+
+def main(argv=None):
+  args = parse_args(argv)
+  load_difficulty_table()  # tiers tuned by tune.py, if it has been run
+  match_ticks = round(args.match_minutes * 60 * TICKS_PER_SECOND) if args.match_minutes else None
+  extra_ticks = round(args.extra_minutes * 60 * TICKS_PER_SECOND)
   pygame.init()
   pygame.mixer.init() 
   width, height = WIDTH, HEIGHT
-  screen = pygame.display.set_mode((width, height), pygame.RESIZABLE)
+  window = pygame.display.set_mode((width, height), pygame.RESIZABLE)
   pygame.display.set_caption("Tiny football")
+  # with a viewport the screens draw on a fixed-size surface and never see a resize
+  view = Viewport((WIDTH, HEIGHT), window.get_size()) if args.fixed_resolution else None
+  if view:
+    view.activate()
+    screen = view.surface
+  else:
+    screen = window
   clock = pygame.time.Clock()
-
-
-  try:
-      pygame.mixer.music.load(os.path.join("assets", "sfx", "bg.mp3"))
-      pygame.mixer.music.set_volume(0.5)
-      pygame.mixer.music.play(-1)
-  except pygame.error as e:
-      print(f"Không thể tải nhạc nền: {e}")
+  # matches advance in fixed ticks; frames draw in between (see timestep.py)
+  timestep = FixedTimestep(args.tick_rate)
+  dt = 0.0
+  # decode on worker threads while the splash shows; the menu's assets come first
+  loader = Loader()
+  startup = {}  # milestone -> seconds since STARTED
 
   class DummySound: 
       def play(self): pass
 
-  try:
-      kick_sound = pygame.mixer.Sound(os.path.join("assets", "sfx", "kick.mp3"))
-      goal_sound = pygame.mixer.Sound(os.path.join("assets", "sfx", "goal.mp3"))
-  except pygame.error as e:
-      print(f"Không thể tải hiệu ứng âm thanh: {e}")
-      kick_sound = goal_sound = DummySound()
+  def load_sounds():
+      try:
+          kick_sound = asset_manager.sound(asset_manager.KICK_SOUND)
+          goal_sound = asset_manager.sound(asset_manager.GOAL_SOUND)
+      except pygame.error as e:
+          print(f"Không thể tải hiệu ứng âm thanh: {e}")
+          kick_sound = goal_sound = DummySound()
+      return {"kick": kick_sound, "goal": goal_sound}
+
+  sounds = None
 
-  sounds = {"kick": kick_sound, "goal": goal_sound}
+  def record(gameplay):
+    if args.record and all(controller.difficulty != "search" for controller in gameplay.controllers.values()):
+      gameplay.recorder = Recorder(gameplay, args.record)
 
   running = True
-  playing = False
-  state = "menu"
+  scenes = SceneStack("loading")
+  pool = MatchPool()  # finished matches' screens, restarted in place for the next match
 
-  menu = Menu(screen, width, height)
-  option_menu = OptionMenu(screen, width, height)
-  pvp_gameplay = None
-  pvai_gameplay = None
+  menu = None
+  option_menu = None
   current_gameplay = None
 
+  if args.profile_trace:
+    profiler.start_trace(args.profile_trace)
+
   while running:
+    profiler.begin_frame()
+    profiler.phase("events")
     events = pygame.event.get()
+    resized = False  # the window was recreated: it needs a whole frame whatever the screens report
 
     for event in events:
       if event.type == pygame.QUIT:
         running = False
       
       if event.type == pygame.VIDEORESIZE:
+          window = pygame.display.set_mode((event.w, event.h), pygame.RESIZABLE)
+          resized = True
+          if view:
+              view.resize(event.w, event.h)
+              continue
           width, height = event.w, event.h
-          screen = pygame.display.set_mode((width, height), pygame.RESIZABLE)
-          if state == "menu":
+          screen = window
+          if scenes.top == "menu":
               menu.resize(width, height, screen)
-          elif state == "option":
+          elif scenes.top == "option":
               option_menu.resize(width, height, screen)
-          elif state == "game" and current_gameplay:
+          elif scenes.top == "game" and current_gameplay:
               current_gameplay.resize(width, height, screen)
       
-      if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE and state == "game":
-          playing = False
-          state = "menu"
-          
-    if state == "menu":
+      if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE and scenes.top == "game":
+          scenes.back_to("menu")
+          if current_gameplay:
+              close_match(current_gameplay)
+              pool.release(current_gameplay)
+              current_gameplay = None
+
+      if event.type == pygame.KEYDOWN and event.key == pygame.K_F3:
+          if not profiler.toggle_hud() and current_gameplay:
+              # repaint what the HUD covered, paused or not
+              current_gameplay.renderer.invalidate()
+              current_gameplay.pause_menu.repaint()
+
+    if view:
+      events = [event for event in events if event.type != pygame.VIDEORESIZE]
+
+    profiler.phase("loader")
+    loader.poll()
+
+    if scenes.top == "loading":
+      profiler.phase("splash")
+      draw_splash(screen, loader.progress("menu"))
+      if loader.ready("menu"):
+        menu = Menu(screen, width, height)
+        scenes.replace("menu")
+        # a match left unfinished last time picks up where it was, on its pause menu
+        saved = None if args.startup_timing else snapshot.load(snapshot.SAVE_FILE)
+        if saved:
+          sounds = load_sounds()
+          key = match_key(saved.mode, saved.sides, saved.difficulty if saved.mode == "pvai" else None,
+                          saved.match_ticks, saved.extra_ticks, args.dirty_rects)
+          current_gameplay = pool.acquire(key, lambda: saved.open(screen, width, height, sounds, args.dirty_rects),
+                                          screen, width, height)
+          timestep.reset()
+          scenes.push("game")
+
+    if scenes.top == "menu":
+      profiler.phase("menu")
+      if option_menu is None and loader.ready("options"):
+        option_menu = OptionMenu(screen, width, height)
       menu.events(events)
       menu.draw()
       if menu.start_selected:
-        state = "option"
+        if option_menu is None:  # clicked before its assets arrived: wait for them now
+          option_menu = OptionMenu(screen, width, height)
+        scenes.push("option")
         menu.start_selected = False
       elif menu.quit_selected:
         running = False
 
-    elif state == "option":
+    elif scenes.top == "option":
+      profiler.phase("options")
       option_menu.events(events)
       option_menu.draw()
       if option_menu.option_completed:
+        if sounds is None:
+          sounds = load_sounds()
         if option_menu.selected_mode == "pvp":
           side_p1 = option_menu.selected_side
           side_p2 = option_menu.selected_side_p2
-          playing = True
-          pvp_gameplay = PvPGameplay(screen, width, height, side_p1, side_p2, sounds)
-          current_gameplay = pvp_gameplay
-          state = "game"
+          current_gameplay = pool.acquire(
+            match_key("pvp", (side_p1, side_p2), None, match_ticks, extra_ticks, args.dirty_rects),
+            lambda: PvPGameplay(screen, width, height, side_p1, side_p2, sounds, args.dirty_rects, match_ticks, extra_ticks),
+            screen, width, height)
+          record(current_gameplay)
+          timestep.reset()
+          scenes.push("game")
         elif option_menu.selected_mode == "pvai":
           human_side = option_menu.selected_side
-          playing = True
-          pvai_gameplay = PvAIGameplay(screen, width, height, human_side, "medium", sounds)
-          current_gameplay = pvai_gameplay
-          state = "game"
+          ai_side = "right" if human_side == "left" else "left"
+          current_gameplay = pool.acquire(
+            match_key("pvai", (human_side, ai_side), args.ai, match_ticks, extra_ticks, args.dirty_rects),
+            lambda: PvAIGameplay(screen, width, height, human_side, args.ai, sounds, args.dirty_rects, match_ticks, extra_ticks),
+            screen, width, height)
+          record(current_gameplay)
+          timestep.reset()
+          scenes.push("game")
         else:
-          state = "menu"
+          scenes.pop()
         option_menu.reset()
 
-    elif state == "game":
+    elif scenes.top == "game":
       if current_gameplay:
+        profiler.phase("handle_events")
         current_gameplay.handle_events(events)
-        current_gameplay.update()
-        current_gameplay.draw()
+        profiler.phase("update")
+        for _ in range(timestep.advance(dt)):
+          current_gameplay.update()
+        profiler.phase("draw")
+        current_gameplay.draw(timestep.alpha)
         
-        if current_gameplay.back_to_menu:
-          playing = False
-          state = "menu"
-          pvp_gameplay = None
-          pvai_gameplay = None
+        if current_gameplay.rematch:
+          # same screen, same settings: reset in place
+          snapshot.discard(snapshot.SAVE_FILE)
+          current_gameplay.restart(screen, width, height)
+          record(current_gameplay)
+          timestep.reset()
+        elif current_gameplay.back_to_menu:
+          scenes.back_to("menu")
+          close_match(current_gameplay)
+          pool.release(current_gameplay)
           current_gameplay = None
+      else:
+        scenes.back_to("menu")
 
-      if not playing:
-        state = "menu"
+    dirty_rects = current_gameplay.dirty_rects if scenes.top == "game" and current_gameplay and not resized else None
+    # an empty list means nothing changed, e.g. a paused match: the window already shows the frame
+    if view and dirty_rects != []:
+      profiler.phase("present")
+      view.present(window)
+    hud = profiler.draw_hud(window)
+    profiler.phase("flip")
+    if dirty_rects is None or (view and dirty_rects):
+      pygame.display.flip()
+    else:
+      pygame.display.update(dirty_rects + [hud] if hud else dirty_rects)
+    profiler.end_frame()
 
-    pygame.display.flip()
-    clock.tick(60)
+    if "first frame" not in startup:
+      startup["first frame"] = time.perf_counter() - STARTED
+      # the music streams from disk, so starting it can wait until the window shows something
+      try:
+          pygame.mixer.music.load(os.path.join("assets", "sfx", "bg.mp3"))
+          pygame.mixer.music.set_volume(0.5)
+          pygame.mixer.music.play(-1)
+      except pygame.error as e:
+          print(f"Không thể tải nhạc nền: {e}")
+    if scenes.top == "menu" and "interactive" not in startup:
+      startup["interactive"] = time.perf_counter() - STARTED
+    if loader.done and "all assets" not in startup:
+      startup["all assets"] = time.perf_counter() - STARTED
+    if args.startup_timing and len(startup) == 3:
+      for milestone, seconds in startup.items():
+        print(f"{milestone:>12}: {seconds * 1000:7.0f} ms")
+      running = False
+    dt = clock.tick(args.fps) / 1000
 
+  loader.shutdown()
+  if current_gameplay:
+    close_match(current_gameplay)
+  if args.profile_trace:
+    print(f"{profiler.stop_trace()} trace events written to {args.profile_trace}")
   pygame.quit()
 
 
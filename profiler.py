@@ -0,0 +1,224 @@
+"""Frame profiler: per-phase timings, an on-screen HUD and a trace file.
+
+main.py brackets each frame with ``begin_frame``/``end_frame`` and splits it
+into phases with ``phase(name)`` (events, update, draw, flip, ...); any code
+can time a piece of work inside them with ``with profiler.section(name):``.
+While the profiler is off, ``section`` hands back one shared do-nothing
+context manager and ``phase`` returns at once, so the instrumentation costs
+a function call.
+
+F3 in the game turns it on and shows the HUD: current, average and 99th
+percentile frame time over the last ``HISTORY`` frames, the heaviest phases
+and sections, and a graph of recent frames. ``start_trace(path)`` (main.py
+``--profile-trace FILE``) also streams every phase and section as Chrome
+trace events, a JSON file that chrome://tracing, ui.perfetto.dev and
+speedscope show as a flame chart.
+"""
+import json, time
+from collections import deque
+import pygame
+import fonts
+
+HISTORY = 240       # frames kept for the HUD statistics and graph
+HUD_REFRESH = 0.25  # seconds between HUD text updates
+HUD_FONT_SIZE = 18
+HUD_LINES = 7       # frame line plus the heaviest phases and sections
+HUD_WIDTH = 340     # fixed, so a dirty-rect frame never leaves a stale edge behind
+GRAPH_HEIGHT = 60
+GRAPH_MS = 33.3     # frame time at the top of the graph
+BUDGET_MS = 1000 / 60
+
+_enabled = False
+_requested = False   # enable() was called; tracing and the HUD also keep timing on
+_trace = None        # open trace file while tracing
+_trace_events = 0
+_origin = time.perf_counter_ns()
+_frame = None        # {name: ns} for the frame in progress
+_frame_start = 0
+_phase = None        # (name, start ns) of the phase in progress
+_frames = deque(maxlen=HISTORY)  # (work ms, {name: ms}) per finished frame
+
+_hud_visible = False
+_hud_lines = []      # rendered HUD text, refreshed every HUD_REFRESH seconds
+_hud_refreshed = 0.0
+_graph = None        # frame-time graph, scrolled one column per frame
+_graphed = 0         # frames drawn into it so far
+_frame_count = 0
+
+class _Section:
+  __slots__ = ("name", "start")
+  def __init__(self, name):
+    self.name = name
+  def __enter__(self):
+    self.start = time.perf_counter_ns()
+  def __exit__(self, *exc):
+    _record(self.name, self.start, time.perf_counter_ns())
+
+class _Off:
+  def __enter__(self): pass
+  def __exit__(self, *exc): pass
+
+_OFF = _Off()
+
+def enabled():
+  return _enabled
+
+def enable(on=True):
+  """Turn timing on or off; tracing and the HUD keep it on regardless."""
+  global _requested
+  _requested = bool(on)
+  _update()
+
+def _update():
+  global _enabled, _frame, _phase
+  _enabled = _requested or _trace is not None or _hud_visible
+  if not _enabled:
+    _frame = _phase = None
+
+def section(name):
+  """``with section(name):`` times its body under ``name`` when the profiler is on."""
+  return _Section(name) if _enabled else _OFF
+
+def _record(name, start, end):
+  if _frame is not None:
+    _frame[name] = _frame.get(name, 0) + end - start
+  if _trace is not None:
+    _write({"name": name, "ph": "X", "ts": (start - _origin) / 1000, "dur": (end - start) / 1000, "pid": 1, "tid": 1})
+
+def begin_frame():
+  global _frame, _frame_start
+  if not _enabled:
+    return
+  _frame_start = time.perf_counter_ns()
+  _frame = {}
+
+def phase(name):
+  """End the current phase of the frame (if any) and start ``name``."""
+  global _phase
+  if not _enabled:
+    return
+  now = time.perf_counter_ns()
+  if _phase is not None:
+    _record(_phase[0], _phase[1], now)
+  _phase = (name, now)
+
+def end_frame():
+  global _frame, _phase, _frame_count
+  if not _enabled or _frame is None:
+    return
+  end = time.perf_counter_ns()
+  if _phase is not None:
+    _record(_phase[0], _phase[1], end)
+    _phase = None
+  _frames.append(((end - _frame_start) / 1e6, {name: ns / 1e6 for name, ns in _frame.items()}))
+  _frame_count += 1
+  if _trace is not None:
+    _write({"name": "frame", "ph": "X", "ts": (_frame_start - _origin) / 1000, "dur": (end - _frame_start) / 1000,
+            "pid": 1, "tid": 0})
+  _frame = None
+
+# ---------- statistics ----------
+def stats():
+  """{"current", "avg", "p99", "max"} frame work in ms over the kept frames, plus "sections": name -> avg ms."""
+  if not _frames:
+    return None
+  work = sorted(ms for ms, _ in _frames)
+  sections = {}
+  for _, frame in _frames:
+    for name, ms in frame.items():
+      sections[name] = sections.get(name, 0.0) + ms
+  count = len(_frames)
+  return {"current": _frames[-1][0], "avg": sum(work) / count, "p99": work[min(count - 1, int(count * 0.99))],
+          "max": work[-1], "sections": {name: total / count for name, total in sections.items()}}
+
+# ---------- trace ----------
+def start_trace(path):
+  """Stream every phase and section to ``path`` as Chrome trace events until ``stop_trace``."""
+  global _trace, _trace_events
+  stop_trace()
+  _trace = open(path, "w")
+  _trace.write("[\n")
+  _trace_events = 0
+  _update()
+
+def _write(event):
+  global _trace_events
+  _trace.write(("" if _trace_events == 0 else ",\n") + json.dumps(event))
+  _trace_events += 1
+
+def stop_trace():
+  """Finish the trace file; returns the number of events written."""
+  global _trace
+  if _trace is None:
+    return 0
+  _trace.write("\n]\n")
+  _trace.close()
+  _trace = None
+  _update()
+  return _trace_events
+
+# ---------- HUD ----------
+def hud_visible():
+  return _hud_visible
+
+def toggle_hud():
+  global _hud_visible, _hud_refreshed
+  _hud_visible = not _hud_visible
+  _hud_refreshed = 0.0
+  _update()
+  return _hud_visible
+
+def _refresh_hud():
+  s = stats()
+  if s is None:
+    lines = ["measuring..."]
+  else:
+    lines = [f"frame {s['current']:5.1f} ms  avg {s['avg']:5.1f}  p99 {s['p99']:5.1f}  max {s['max']:5.1f}"]
+    heaviest = sorted(s["sections"].items(), key=lambda item: -item[1])
+    lines += [f"{name:<16} {ms:6.2f} ms" for name, ms in heaviest[:HUD_LINES - 1]]
+  # rendered directly: the numbers change every refresh and would only churn the fonts text cache
+  font = fonts.get_font(HUD_FONT_SIZE, None)
+  _hud_lines[:] = [font.render(line, True, (255, 255, 255)) for line in lines]
+
+def _update_graph():
+  """The graph with a bar added for each frame finished since the last call, newest on the right."""
+  global _graph, _graphed
+  if _graph is None:
+    _graph = pygame.Surface((HISTORY, GRAPH_HEIGHT))
+    _graph.fill((20, 20, 20))
+    _graphed = _frame_count - len(_frames)
+  new = min(_frame_count - _graphed, len(_frames))
+  _graph.scroll(-new, 0)
+  budget_y = GRAPH_HEIGHT - round(BUDGET_MS / GRAPH_MS * GRAPH_HEIGHT)
+  for i in range(new):
+    ms = _frames[len(_frames) - new + i][0]
+    x = HISTORY - new + i
+    h = min(GRAPH_HEIGHT, round(ms / GRAPH_MS * GRAPH_HEIGHT))
+    color = (80, 200, 80) if ms <= BUDGET_MS else (230, 200, 60) if ms <= 2 * BUDGET_MS else (230, 70, 60)
+    pygame.draw.line(_graph, (20, 20, 20), (x, 0), (x, GRAPH_HEIGHT - 1))
+    pygame.draw.line(_graph, color, (x, GRAPH_HEIGHT - 1), (x, GRAPH_HEIGHT - h))
+    _graph.set_at((x, budget_y), (150, 150, 150))  # the 60 fps line
+  _graphed = _frame_count
+  return _graph
+
+def draw_hud(screen):
+  """Draw the HUD in the top-right corner if it is shown; returns its rect (or None)."""
+  global _hud_refreshed
+  if not _hud_visible:
+    return None
+  with section("hud"):
+    now = time.perf_counter()
+    if now - _hud_refreshed >= HUD_REFRESH:
+      _hud_refreshed = now
+      _refresh_hud()
+    pad = 6
+    line_h = fonts.get_font(HUD_FONT_SIZE, None).get_linesize()
+    rect = pygame.Rect(0, pad, HUD_WIDTH, HUD_LINES * line_h + GRAPH_HEIGHT + 3 * pad)
+    rect.right = screen.get_width() - pad
+    screen.fill((20, 20, 20), rect)
+    y = rect.y + pad
+    for line in _hud_lines:
+      screen.blit(line, (rect.x + pad, y), (0, 0, HUD_WIDTH - 2 * pad, line_h))
+      y += line_h
+    screen.blit(_update_graph(), (rect.right - pad - HISTORY, rect.bottom - pad - GRAPH_HEIGHT))
+  return rect
@@ -1,12 +1,15 @@
-import pygame, os
-from ball import Ball
+import pygame
+import asset_manager, atlas, fonts, snapshot
 from button import Button
+from dispatcher import Dispatcher
+from engine import MatchEngine, WIN_SCORE, input_bits
 from resume import PauseMenu
-
-WIN_SCORE = 3
+from dirty import DirtyRenderer
+from scoreboard import Scoreboard
+from timestep import lerp_point
 
 class PvPGameplay:
-  def __init__(self, screen, width, height, side_p1, side_p2, sounds):
+  def __init__(self, screen, width, height, side_p1, side_p2, sounds, dirty_rects=False, match_ticks=None, extra_ticks=0):
     self.screen = screen
     self.width = width
     self.height = height
@@ -18,228 +21,315 @@ class PvPGameplay:
     self.music_on = pygame.mixer.music.get_volume() > 0
     self.show_bounds = True
     
-    bg_path = os.path.join("assets", "Field", "Only Field.png")
-    try:
-      self.bg_img = pygame.image.load(bg_path).convert()
-    except (pygame.error, FileNotFoundError):
-      self.bg_img = pygame.Surface((self.width, self.height)); self.bg_img.fill((0, 100, 0))
-    self.scaled_bg = pygame.transform.smoothscale(self.bg_img, (self.width, self.height))
+    self.bg_img = asset_manager.image(asset_manager.FIELD, alpha=False,
+                                      placeholder=lambda: asset_manager.solid((self.width, self.height), (0, 100, 0)))
+    self.scaled_bg = asset_manager.scaled(asset_manager.FIELD, (self.width, self.height), alpha=False)
 
     self._load_ui_assets()
     
     self.ui_margin_x = 40
     self.pause_button = Button(self.ui_margin_x, 20, self.pause_btn_img, self.screen)
     self.sound_button = Button(self.ui_margin_x + 50 + 10, 20, self.vol_on_img if self.music_on else self.vol_off_img, self.screen)
+    self.dispatcher = Dispatcher()  # mouse clicks, fed from handle_events
+    self._register_buttons()
     
     self.pause_menu = PauseMenu(screen, width, height)
     
     self.player1_img = self.load_player(side_p1, (0,0,255))
     self.player2_img = self.load_player(side_p2, (255,0,0))
-    self.p1 = self.player1_img.get_rect(center=(200, self.height // 2))
-    self.p2 = self.player2_img.get_rect(center=(self.width - 200, self.height // 2))
-    self.player_size = self.p1.width
-    self.ball = Ball(self.width, self.height, self.player_size, self.width // 2, self.height // 2)
+    self.player_size = self.player1_img.get_width()
+    # timed matches (match_ticks) are decided by the clock alone, not by the first to WIN_SCORE
+    self.engine = MatchEngine(self.width, self.height, self.player_size, headless=False,
+                              win_score=WIN_SCORE if match_ticks is None else None,
+                              match_ticks=match_ticks, extra_ticks=extra_ticks)
+    self.engine.set_player_size(0, self.player1_img.get_size())
+    self.engine.set_player_size(1, self.player2_img.get_size())
 
-    self.score = [0,0]
     self.goal_text = ""
-    self.goal_text_timer = 0
-    self.winner = None
+    self.goal_text_timer = 0  # in simulation ticks
+    self.previous = None  # sprite positions before the last tick, for interpolated drawing
+    self.input_source = self.read_input  # replay.py plays recorded inputs through here
+    self.recorder = None  # a replay.Recorder logging every tick, attached by main.py
+    self.rewind = snapshot.Rewind(self)  # last seconds of play, for rewind and instant replay (R / Backspace)
+    self.controllers = {}  # both players are human
     self.back_to_menu = False
-    
-    self._create_goals(); self._create_play_area()
-
-    try:
-      self.button_img = pygame.image.load(os.path.join("assets", "menu-button.png")).convert_alpha()
-      self.button_font = pygame.font.Font("assets/fonts/LuckiestGuy-Regular.ttf", 36)
-    except (pygame.error, FileNotFoundError):
-      self.button_img = pygame.Surface((200, 50)); self.button_img.fill((100, 100, 100))
-      self.button_font = pygame.font.Font(None, 28)
+    self.rematch = False  # Enter on the result screen; main.py restarts the match in place
+
+    # dirty_rects: repaint only around moving sprites (see dirty.py); main.py reads self.dirty_rects
+    self.renderer = DirtyRenderer(dirty_rects)
+    self.scoreboard = Scoreboard(self.width, self.height)
+    self.dirty_rects = None
+    self._build_field_layer()
+
+    self.button_img = asset_manager.image(asset_manager.MENU_BUTTON, placeholder=lambda: asset_manager.solid((200, 50), (100, 100, 100)))
+    self.button_font = fonts.get_font(36)
     self.back_button = None
 
+  # ------------------- MATCH STATE -------------------
+  # P1 always kicks off from the left, so P1 is engine team 0 and P2 is team 1.
+  @property
+  def ball(self): return self.engine.ball
+  @property
+  def p1(self): return self.engine.players[0]
+  @property
+  def p2(self): return self.engine.players[1]
+  @property
+  def score(self): return self.engine.score
+  @property
+  def winner(self): return self.engine.winner
+  @property
+  def finished(self): return self.engine.finished
+  @property
+  def goal_left(self): return self.engine.goal_left
+  @property
+  def goal_right(self): return self.engine.goal_right
+  @property
+  def main_rect(self): return self.engine.main_rect
+
   # ------------------- FONT SCALING -------------------
   def get_scaled_font_size(self, base_size):
     """Scale font size relative to a 1200x800 base resolution."""
     scale_factor = min(self.width / 1200, self.height / 800)
     return max(16, int(base_size * scale_factor))
+
+  def text_sizes(self):
+    """Font sizes the banners and buttons use at the current window size."""
+    return {self.get_scaled_font_size(base) for base in (72, 84, 36, 28)}
   # ----------------------------------------------------
 
   def _load_ui_assets(self):
-    try:
-        self.pause_btn_img = pygame.transform.smoothscale(pygame.image.load(os.path.join("assets", "pause", "pause-button.png")).convert_alpha(), (50, 50))
-        self.vol_on_img = pygame.transform.smoothscale(pygame.image.load(os.path.join("assets", "pause", "volumn-button-on.png")).convert_alpha(), (50, 50))
-        self.vol_off_img = pygame.transform.smoothscale(pygame.image.load(os.path.join("assets", "pause", "volumn-button-off.png")).convert_alpha(), (50, 50))
-    except (pygame.error, FileNotFoundError):
-        self.pause_btn_img = pygame.Surface((50, 50)); self.pause_btn_img.fill((200,200,200))
-        self.vol_on_img = pygame.Surface((50, 50)); self.vol_on_img.fill((0,255,0))
-        self.vol_off_img = pygame.Surface((50, 50)); self.vol_off_img.fill((255,0,0))
+    self.pause_btn_img = asset_manager.scaled(asset_manager.PAUSE_BUTTON, (50, 50), placeholder=lambda: asset_manager.solid((50, 50), (200, 200, 200)))
+    self.vol_on_img = asset_manager.scaled(asset_manager.VOLUME_ON_BUTTON, (50, 50), placeholder=lambda: asset_manager.solid((50, 50), (0, 255, 0)))
+    self.vol_off_img = asset_manager.scaled(asset_manager.VOLUME_OFF_BUTTON, (50, 50), placeholder=lambda: asset_manager.solid((50, 50), (255, 0, 0)))
+
+  def _build_field_layer(self):
+    """The static part of the frame: background plus the optional bounds outlines."""
+    self.field_layer = self.scaled_bg.copy()
+    if self.show_bounds:
+      for rect in (self.main_rect, self.goal_left, self.goal_right):
+        pygame.draw.rect(self.field_layer, (255, 255, 0), rect, 3)
+    self.renderer.invalidate()
+    self.pause_menu.thaw()
+
+  def close(self):
+    """Save the recording, if any; nothing runs in the background in PvP."""
+    self._save_recording()
+
+  def _save_recording(self):
+    if self.recorder:
+      path = self.recorder.close()
+      if path: print(f"match recorded to {path}")
+      self.recorder = None
+
+  def restart(self, screen, width, height):
+    """Set up a new match in place, with the same sides and settings (see scenes.MatchPool)."""
+    if (width, height, screen) != (self.width, self.height, self.screen):
+      self.resize(width, height, screen)
+    self.engine.reset()
+    self.paused = False
+    self.goal_text, self.goal_text_timer = "", 0
+    self.previous = None
+    self._save_recording()
+    self.rewind.reset()
+    self.back_to_menu = self.rematch = False
+    self.back_button = None
+    self._register_buttons()
+    self.music_on = pygame.mixer.music.get_volume() > 0  # another match may have toggled it
+    self.sound_button.image = self.vol_on_img if self.music_on else self.vol_off_img
+    self.pause_menu.thaw()
+    self.renderer.invalidate()
 
   def toggle_music(self):
     self.music_on = not self.music_on
     pygame.mixer.music.set_volume(0.5 if self.music_on else 0.0)
     self.sound_button.image = self.vol_on_img if self.music_on else self.vol_off_img
+    self.pause_menu.thaw()  # the button shows through the pause menu
+
+  def _register_buttons(self):
+    """Route clicks to the pause and sound buttons; the back button joins when it appears."""
+    self.dispatcher.clear()
+    self.dispatcher.add('pause', self.pause_button)
+    self.dispatcher.add('sound', self.sound_button)
+
+  def handle_clicks(self, events):
+    """Act on the buttons clicked in ``events``: the pause menu's while paused, and the match's own."""
+    if self.paused:
+      action = self.pause_menu.events(events)
+      if action == 'resume': self.paused = False
+      elif action == 'quit': self.back_to_menu = True
+    for name in self.dispatcher.dispatch(events):
+      if name == 'pause' and not self.finished: self.paused = True
+      elif name == 'sound' and not self.finished: self.toggle_music()
+      elif name == 'back' and self.finished and self.back_button: self.back_to_menu = True
 
   def handle_events(self, events):
+    self.handle_clicks(events)
     for event in events:
         if event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_p and not self.winner:
+            if event.key == pygame.K_p and not self.finished:
                 self.paused = not self.paused
-            if event.key == pygame.K_m and not self.winner:
+            if event.key == pygame.K_m and not self.finished:
                 self.toggle_music()
+            if event.key == pygame.K_RETURN and self.finished:
+                self.rematch = True
             if event.key == pygame.K_b:
                 self.show_bounds = not self.show_bounds
+                self._build_field_layer()
+            if event.key == pygame.K_r and not self.paused:
+                self.rewind.replay(snapshot.REPLAY_SECONDS)
+            # rewinding rewrites the match, which a recording could not reproduce
+            if event.key == pygame.K_BACKSPACE and not self.paused and not self.recorder:
+                self.rewind.rewind(snapshot.REWIND_STEP_SECONDS)
 
   def update(self):
-    if self.winner is not None or self.paused:
+    """Advance the match one simulation tick."""
+    if self.paused:
+      self.previous = None
       return
-    self.handle_input()
-    self.ball.move(self.play_area, self.goal_left, self.goal_right)
-    if self.ball.kick(self.p1, 0): self.sounds["kick"].play()
-    if self.ball.kick(self.p2, 1): self.sounds["kick"].play()
-    scorer, conceding_team, own_goal = None, None, False
-    if self.ball.rect.colliderect(self.goal_left):
-      conceding_team, scorer = 0, 1
-    elif self.ball.rect.colliderect(self.goal_right):
-      conceding_team, scorer = 1, 0
-    if scorer is not None:
+    if self.rewind.replaying:
+      previous = self._sprite_positions()
+      if self.rewind.step(): self.previous = previous
+      return
+    if self.goal_text_timer > 0:
+      self.goal_text_timer -= 1
+    if self.finished:
+      self.previous = None
+      return
+    self.previous = self._sprite_positions()
+    inputs = self.handle_input()
+    events = self.engine.step()
+    if self.recorder: self.recorder.tick(inputs, self.engine)
+    for event in events:
+      if event == "kick": self.sounds["kick"].play()
+    if "goal" in events:
       self.sounds["goal"].play()
-      own_goal = (self.ball.last_touch == conceding_team)
-      self.score[scorer] += 1
+      own_goal = self.engine.last_goal[1]
       self.goal_text = "OWN GOAL!" if own_goal else "GOAL!"
       self.goal_text_timer = 120
-      self.reset_positions()
-      if self.score[0] >= WIN_SCORE or self.score[1] >= WIN_SCORE:
-        self.winner = 0 if self.score[0] >= WIN_SCORE else 1
-        self.ball.vx = self.ball.vy = 0.0
-        self.back_button = None
-        return
-
-  def draw(self):
-    self.screen.blit(self.scaled_bg, (0, 0))
-    
-    if self.show_bounds:
-        pygame.draw.rect(self.screen, (255,255,0), self.main_rect, 3)
-        pygame.draw.rect(self.screen, (255,255,0), self.goal_left, 3)
-        pygame.draw.rect(self.screen, (255,255,0), self.goal_right, 3)
-
-    self.screen.blit(self.player1_img, self.p1)
-    self.screen.blit(self.player2_img, self.p2)
-    self.ball.draw(self.screen)
-
-    # Scores
-    score_size = self.get_scaled_font_size(60)
-    p1_color = (0,0,255) if self.side_p1 == "left" else (255,0,0)
-    p2_color = (0,0,255) if self.side_p2 == "left" else (255,0,0)
-    p1_score_surf, p1_rect = self.draw_text(str(self.score[0]), score_size, p1_color, self.width // 4, 50)
-    p2_score_surf, p2_rect = self.draw_text(str(self.score[1]), score_size, p2_color, 3 * self.width // 4, 50)
-    self.screen.blit(p1_score_surf, p1_rect)
-    self.screen.blit(p2_score_surf, p2_rect)
+    if "extra_time" in events:
+      self.goal_text = "EXTRA TIME!"
+      self.goal_text_timer = 120
+    if "goal" in events or "extra_time" in events:
+      self.previous = None  # everyone jumped back to kickoff; don't draw them sliding there
+    if self.finished:
+      self.back_button = None
+    self.rewind.record()
+
+  def _sprite_positions(self):
+    return (self.p1.topleft, self.p2.topleft, self.ball.rect.center)
+
+  def _interpolated(self, alpha):
+    """Sprite positions ``alpha`` of the way from the previous tick to the current one."""
+    current = self._sprite_positions()
+    if self.previous is None or alpha >= 1.0:
+      return current
+    return [lerp_point(a, b, alpha) for a, b in zip(self.previous, current)]
+
+  def draw(self, alpha=1.0):
+    if self.paused and self.pause_menu.frozen:
+      # nothing under the menu can change: repaint nothing
+      self.pause_menu.draw()
+      self.dirty_rects = self.pause_menu.dirty
+      return
+    self.pause_menu.thaw()
+    renderer = self.renderer
+    renderer.begin(self.screen, self.field_layer, overlay=self.paused or self.finished or self.goal_text_timer > 0 or self.rewind.replaying)
+
+    p1_pos, p2_pos, ball_pos = self._interpolated(alpha)
+    renderer.blit(self.screen, self.player1_img, p1_pos)
+    renderer.blit(self.screen, self.player2_img, p2_pos)
+    renderer.add(self.ball.draw(self.screen, ball_pos))
+
+    # Scoreboard: re-composed only when the score or the clock's second changes
+    self.scoreboard.update(self.score, *self.engine.clock())
+    renderer.add(self.scoreboard.draw(self.screen))
 
     # Goal text
     if self.goal_text_timer > 0 and not self.paused:
       goal_size = self.get_scaled_font_size(72)
       txt, rect = self.draw_text(self.goal_text, goal_size, (255, 255, 0), self.width // 2, self.height // 2)
       self.screen.blit(txt, rect)
-      self.goal_text_timer -= 1
+
+    if self.rewind.replaying:
+      txt, rect = self.draw_text("REPLAY", self.get_scaled_font_size(36), (255, 255, 255), self.width // 2, self.height - self.height // 12)
+      self.screen.blit(txt, rect)
 
     # Pause & Sound buttons
-    if self.pause_button.draw() and not self.winner: self.paused = True
-    if self.sound_button.draw() and not self.winner: self.toggle_music()
+    self.pause_button.draw(); self.sound_button.draw()
+    renderer.add(self.pause_button.rect); renderer.add(self.sound_button.rect)
 
-    # Pause menu
+    # Pause menu, over a snapshot of this frame that later paused frames reuse
     if self.paused:
-      action = self.pause_menu.draw()
-      if action == 'resume': self.paused = False
-      elif action == 'quit': self.back_to_menu = True
+      self.pause_menu.freeze(self.screen)
+      self.pause_menu.draw()
 
     # Winner screen
-    elif self.winner is not None:
+    elif self.finished:
       winner_size = self.get_scaled_font_size(84)
-      winner_txt, winner_rect = self.draw_text(f"P{self.winner + 1} WINS!", winner_size, (255, 215, 0), self.width // 2, self.height // 2 - 80)
+      result = "DRAW!" if self.winner is None else f"P{self.winner + 1} WINS!"
+      winner_txt, winner_rect = self.draw_text(result, winner_size, (255, 215, 0), self.width // 2, self.height // 2 - 80)
       self.screen.blit(winner_txt, winner_rect)
 
       self.ensure_back_button()
       if self.back_button:
-        if self.back_button.draw(): self.back_to_menu = True
+        self.back_button.draw()
+        fonts.blit_outlined(self.screen, "BACK TO MENU", self.get_scaled_font_size(36), self.back_button.rect.center, stroke_width=4)
+        fonts.blit_outlined(self.screen, "ENTER: REMATCH", self.get_scaled_font_size(28),
+                            (self.width // 2, self.back_button.rect.bottom + self.get_scaled_font_size(28)), stroke_width=3)
 
-        btn_font_size = self.get_scaled_font_size(36)
-        try:
-          btn_font = pygame.font.Font("assets/fonts/LuckiestGuy-Regular.ttf", btn_font_size)
-        except (pygame.error, FileNotFoundError):
-          btn_font = pygame.font.Font(None, btn_font_size)
+    self.dirty_rects = renderer.end()
 
-        self.draw_text_with_stroke(self.screen, self.back_button, "BACK TO MENU", btn_font, (255,255,255), (0,0,0), stroke_width=4)
-        
   def resize(self, width, height, screen):
+    old_sizes = self.text_sizes()
     self.width, self.height, self.screen = width, height, screen
-    self.scaled_bg = pygame.transform.smoothscale(self.bg_img, (self.width, self.height))
-    self._create_goals(); self._create_play_area()
+    fonts.forget(old_sizes - self.text_sizes())
+    self.scaled_bg = asset_manager.scaled(asset_manager.FIELD, (self.width, self.height), alpha=False)
+    self.engine.resize(width, height)
     self.pause_menu.resize(width, height, screen)
     self.pause_button = Button(self.ui_margin_x, 20, self.pause_btn_img, self.screen)
     self.sound_button = Button(self.ui_margin_x + 50 + 10, 20, self.vol_on_img if self.music_on else self.vol_off_img, self.screen)
+    self._register_buttons()
     self.player1_img = self.load_player(self.side_p1, (0,0,255))
     self.player2_img = self.load_player(self.side_p2, (255,0,0))
-    self.p1 = self.player1_img.get_rect(center=self.p1.center)
-    self.p2 = self.player2_img.get_rect(center=self.p2.center)
-    self.ball.width, self.ball.height = width, height
+    self.engine.set_player_size(0, self.player1_img.get_size())
+    self.engine.set_player_size(1, self.player2_img.get_size())
+    if self.recorder: self.recorder.resize(self.engine)
+    self.scoreboard.resize(width, height)
+    self.previous = None
     self.back_button = None
+    self._build_field_layer()
 
   def load_player(self, side, tint_color):
-    if side == "left": path = os.path.join("assets", "Romanos FC (Home Team)", "2.png")
-    else: path = os.path.join("assets", "Saint Bari (Visitor Team)", "2.png")
-    try: img = pygame.image.load(path).convert_alpha()
-    except: img = pygame.Surface((80,80), pygame.SRCALPHA); img.fill(tint_color)
-    target_w = max(80, self.width // 16); ratio = target_w / max(1, img.get_width())
-    return pygame.transform.smoothscale(img, (int(img.get_width()*ratio), int(img.get_height()*ratio)))
-
-  def _create_play_area(self):
-    margin_x = self.width // 9.5; margin_y = self.height // 10
-    self.main_rect = pygame.Rect(margin_x, margin_y, self.width - 2*margin_x, self.height - 2*margin_y)
-    self.play_area = [self.main_rect, self.goal_left, self.goal_right]
-
-  def _create_goals(self):
-    goal_height = max(120, self.height // 5); goal_thickness = max(32, self.width // 9)
-    self.goal_left = pygame.Rect(0, self.height//2 - goal_height//2, goal_thickness, goal_height)
-    self.goal_right = pygame.Rect(self.width-goal_thickness, self.height//2 - goal_height//2, goal_thickness, goal_height)
+    sheet = atlas.load("home" if side == "left" else "visitor")
+    target_w = max(80, self.width // 16)
+    if atlas.PLAYER not in sheet:
+      return asset_manager.solid((target_w, target_w), tint_color, alpha=True)
+    w, h = sheet.source_size(atlas.PLAYER); ratio = target_w / w
+    return sheet.scaled(atlas.PLAYER, (int(w*ratio), int(h*ratio)))
 
   def reset_positions(self):
-    self.ball.x, self.ball.y = self.width // 2, self.height // 2
-    self.ball.vx, self.ball.vy = 0.0, 0.0; self.ball.last_touch = None
-    self.ball.rect.center = (int(self.ball.x), int(self.ball.y))
-    self.p1.center = (200, self.height // 2)
-    self.p2.center = (self.width - 200, self.height // 2)
+    self.engine.reset_positions()
+
+  def read_input(self):
+    keys = pygame.key.get_pressed()
+    return (input_bits(keys[pygame.K_w], keys[pygame.K_s], keys[pygame.K_a], keys[pygame.K_d], 0)
+            | input_bits(keys[pygame.K_UP], keys[pygame.K_DOWN], keys[pygame.K_LEFT], keys[pygame.K_RIGHT], 1))
 
   def handle_input(self):
-    keys = pygame.key.get_pressed(); speed = 6
-    if keys[pygame.K_w]: self.p1.y -= speed
-    if keys[pygame.K_s]: self.p1.y += speed
-    if keys[pygame.K_a]: self.p1.x -= speed
-    if keys[pygame.K_d]: self.p1.x += speed
-    if keys[pygame.K_UP]: self.p2.y -= speed
-    if keys[pygame.K_DOWN]: self.p2.y += speed
-    if keys[pygame.K_LEFT]: self.p2.x -= speed
-    if keys[pygame.K_RIGHT]: self.p2.x += speed
-    self.p1.clamp_ip(self.screen.get_rect()); self.p2.clamp_ip(self.screen.get_rect())
-
-  def draw_text_with_stroke(self, surface, button, text, font, color, stroke_color, stroke_width=2):
-    text_surf = font.render(text, True, color); text_rect = text_surf.get_rect(center=button.rect.center)
-    for dx in range(-stroke_width, stroke_width + 1):
-      for dy in range(-stroke_width, stroke_width + 1):
-        if dx == 0 and dy == 0: continue
-        stroke_surf = font.render(text, True, stroke_color)
-        stroke_rect = stroke_surf.get_rect(center=(button.rect.centerx + dx, button.rect.centery + dy))
-        surface.blit(stroke_surf, stroke_rect)
-    surface.blit(text_surf, text_rect)
+    """Move both players for this tick; returns the input bits used."""
+    inputs = self.input_source()
+    self.engine.apply_inputs(inputs)
+    return inputs
 
   def ensure_back_button(self):
     if self.back_button is not None: return
     btn_w = self.width // 6; src_w = max(self.button_img.get_width(), 1); src_h = max(self.button_img.get_height(), 1)
-    btn_h = int(src_h * (btn_w / src_w)); scaled_btn = pygame.transform.smoothscale(self.button_img, (btn_w, btn_h))
+    btn_h = int(src_h * (btn_w / src_w)); scaled_btn = asset_manager.scaled(asset_manager.MENU_BUTTON, (btn_w, btn_h))
     btn_x = self.width // 2 - btn_w // 2; btn_y = self.height // 2 + 40
     self.back_button = Button(btn_x, btn_y, scaled_btn, self.screen)
+    self.dispatcher.add('back', self.back_button)
 
   def draw_text(self, text, size, color, x, y):
-    try: font = pygame.font.Font("assets/fonts/LuckiestGuy-Regular.ttf", size)
-    except (pygame.error, FileNotFoundError): font = pygame.font.Font(None, size)
-    text_surface = font.render(text, True, color)
+    text_surface = fonts.render(text, size, color)
     text_rect = text_surface.get_rect(center=(x, y))
     return text_surface, text_rect
@@ -0,0 +1,359 @@
+"""Match recordings: per-tick inputs in a compact binary log, replayed bit for bit.
+
+A match is fully determined by its settings (field and player sizes, rules,
+the AI's difficulty and RNG seed) and by the keys held on each tick, so that
+is all a recording stores: a small header, the window resizes, one byte of
+input per tick (zlib-compressed, typically well under 1 KB a minute) and a
+CRC of the match state every ``CHECK_EVERY`` ticks. ``Player`` re-runs a
+recording through the engine, headless at tens of thousands of ticks per
+second or under a gameplay screen at normal speed, compares those CRCs to
+prove the replay took the same course, and seeks by restoring the nearest of
+the state snapshots it keeps every ``SNAPSHOT_EVERY`` ticks.
+
+  python main.py --record recordings      # save every match played
+  python replay.py info FILE
+  python replay.py verify FILE            # headless, full speed, checks every CRC
+  python replay.py play FILE [--start SECONDS] [--speed N]
+
+The search AI plans in real time in a worker process, so its matches cannot
+be replayed and are not recorded.
+"""
+import argparse, json, os, random, struct, time, zlib
+import snapshot
+from ai import TUNABLE_PARAMS, create_controller, load_difficulty_table
+from engine import MatchEngine, TICKS_PER_SECOND
+
+MAGIC = b"TFRP"
+VERSION = 2
+CHECK_EVERY = 60        # ticks between state CRCs
+SNAPSHOT_EVERY = 600    # ticks between seek snapshots
+
+# magic, version, width, height, player sizes (w, h) x2, first kicker, win score (-1: none),
+# match ticks (0: untimed), extra ticks, AI team (-1: none), seed, AI params CRC, difficulty length
+HEADER = struct.Struct("<4sBHHHHHHBhIIbIIB")
+RESIZE = struct.Struct("<IHHHHHH")  # after this many ticks: width, height, player sizes (w, h) x2
+COUNT = struct.Struct("<I")
+STATE = struct.Struct("<4d8i3I")
+
+def state_crc(engine):
+  """CRC of everything that shows whether two runs of a match went the same way."""
+  ball = engine.ball
+  players = [v for rect in engine.players for v in rect]
+  return zlib.crc32(STATE.pack(ball.x, ball.y, ball.vx, ball.vy, *players, engine.score[0], engine.score[1], engine.ticks))
+
+def params_crc(controller):
+  return zlib.crc32(json.dumps({name: getattr(controller, name) for name in TUNABLE_PARAMS}, sort_keys=True).encode())
+
+class Recording:
+  def __init__(self, width, height, sizes, first_kicker=0, win_score=None, match_ticks=None, extra_ticks=0,
+               ai_team=-1, difficulty="", seed=0, ai_params_crc=0):
+    self.width, self.height, self.sizes = width, height, [tuple(size) for size in sizes]
+    self.first_kicker = first_kicker
+    self.win_score, self.match_ticks, self.extra_ticks = win_score, match_ticks, extra_ticks
+    self.ai_team, self.difficulty, self.seed, self.ai_params_crc = ai_team, difficulty, seed, ai_params_crc
+    self.resizes = []  # (tick, width, height, sizes)
+    self.checks = []   # state_crc after every CHECK_EVERY-th tick
+    self.inputs = bytearray()
+
+  @classmethod
+  def of(cls, gameplay):
+    """The settings of a gameplay screen's match, ready to record from its first tick."""
+    engine = gameplay.engine
+    recording = cls(engine.width, engine.height, [rect.size for rect in engine.players], engine.kick_order[0],
+                    engine.win_score, engine.match_ticks, engine.extra_ticks)
+    for team, controller in gameplay.controllers.items():
+      recording.ai_team, recording.difficulty, recording.seed = team, controller.difficulty, gameplay.seed
+      recording.ai_params_crc = params_crc(controller)
+    return recording
+
+  @property
+  def ticks(self):
+    return len(self.inputs)
+
+  # ---------- binary format ----------
+  def to_bytes(self):
+    difficulty = self.difficulty.encode()
+    (w0, h0), (w1, h1) = self.sizes
+    parts = [HEADER.pack(MAGIC, VERSION, self.width, self.height, w0, h0, w1, h1, self.first_kicker,
+                         -1 if self.win_score is None else self.win_score, self.match_ticks or 0, self.extra_ticks,
+                         self.ai_team, self.seed, self.ai_params_crc, len(difficulty)),
+             difficulty, COUNT.pack(len(self.resizes))]
+    for tick, width, height, ((rw0, rh0), (rw1, rh1)) in self.resizes:
+      parts.append(RESIZE.pack(tick, width, height, rw0, rh0, rw1, rh1))
+    parts.append(COUNT.pack(len(self.checks)))
+    parts.append(struct.pack(f"<{len(self.checks)}I", *self.checks))
+    parts.append(COUNT.pack(len(self.inputs)))
+    parts.append(zlib.compress(bytes(self.inputs), 9))
+    return b"".join(parts)
+
+  @classmethod
+  def from_bytes(cls, data):
+    fields = HEADER.unpack_from(data)
+    magic, version, width, height, w0, h0, w1, h1, first, win, match, extra, ai_team, seed, crc, n = fields
+    if magic != MAGIC or version != VERSION:
+      raise ValueError("not a recording this version can read")
+    pos = HEADER.size
+    difficulty = data[pos:pos + n].decode(); pos += n
+    recording = cls(width, height, [(w0, h0), (w1, h1)], first, None if win < 0 else win, match or None, extra,
+                    ai_team, difficulty, seed, crc)
+    (count,), pos = COUNT.unpack_from(data, pos), pos + COUNT.size
+    for _ in range(count):
+      tick, rw, rh, rw0, rh0, rw1, rh1 = RESIZE.unpack_from(data, pos); pos += RESIZE.size
+      recording.resizes.append((tick, rw, rh, ((rw0, rh0), (rw1, rh1))))
+    (count,), pos = COUNT.unpack_from(data, pos), pos + COUNT.size
+    recording.checks = list(struct.unpack_from(f"<{count}I", data, pos)); pos += 4 * count
+    (count,), pos = COUNT.unpack_from(data, pos), pos + COUNT.size
+    recording.inputs = bytearray(zlib.decompress(data[pos:]))
+    if len(recording.inputs) != count:
+      raise ValueError("truncated recording")
+    return recording
+
+  def save(self, path):
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+      f.write(self.to_bytes())
+    os.replace(tmp, path)
+
+  @classmethod
+  def load(cls, path):
+    with open(path, "rb") as f:
+      return cls.from_bytes(f.read())
+
+  # ---------- re-running ----------
+  def controllers(self):
+    """Fresh AI controllers, seeded as in the recorded match."""
+    if self.ai_team < 0:
+      return {}
+    if self.difficulty == "search":
+      raise ValueError("the search AI plans in real time; its matches cannot be replayed")
+    controller = create_controller(self.difficulty, random.Random(self.seed))
+    if params_crc(controller) != self.ai_params_crc:
+      print(f"warning: the {self.difficulty} AI has changed since this match was recorded; the replay may differ")
+    return {self.ai_team: controller}
+
+  def new_match(self):
+    """A headless engine and AI controllers at the recorded kickoff."""
+    engine = MatchEngine(self.width, self.height, self.sizes[0][0], win_score=self.win_score,
+                         match_ticks=self.match_ticks, extra_ticks=self.extra_ticks)
+    self.configure(engine)
+    return engine, self.controllers()
+
+  def configure(self, engine):
+    """Give an engine (perhaps a gameplay screen's) the recorded rules and player sizes."""
+    engine.win_score, engine.match_ticks, engine.extra_ticks = self.win_score, self.match_ticks, self.extra_ticks
+    engine.kick_order = (self.first_kicker, 1 - self.first_kicker)
+    for team, size in enumerate(self.sizes):
+      engine.set_player_size(team, size)
+
+class Recorder:
+  """Records a gameplay screen's match, tick by tick; ``close()`` writes it under ``directory``."""
+  def __init__(self, gameplay, directory):
+    self.recording = Recording.of(gameplay)
+    self.directory = directory
+    self.started = time.strftime("%Y%m%d-%H%M%S")
+
+  def tick(self, inputs, engine):
+    self.recording.inputs.append(inputs)
+    if engine.ticks % CHECK_EVERY == 0:
+      self.recording.checks.append(state_crc(engine))
+
+  def resize(self, engine):
+    self.recording.resizes.append((engine.ticks, engine.width, engine.height, [rect.size for rect in engine.players]))
+
+  def close(self):
+    """Save the recording (if anything was played); returns its path or None."""
+    if not self.recording.ticks:
+      return None
+    os.makedirs(self.directory, exist_ok=True)
+    path = os.path.join(self.directory, f"match-{self.started}.tfr")
+    number = 1
+    while os.path.exists(path):  # another match started in the same second, e.g. a rematch
+      number += 1
+      path = os.path.join(self.directory, f"match-{self.started}-{number}.tfr")
+    self.recording.save(path)
+    return path
+
+# ---------- seek snapshots ----------
+def capture(engine, controllers):
+  """A snapshot.py state plus the AI's random stream, which a replay must also reproduce."""
+  return snapshot.pack(engine, controllers), {team: c.rng.getstate() for team, c in controllers.items()}
+
+def restore(engine, controllers, state):
+  data, rng_states = state
+  snapshot.unpack(data, engine, controllers)
+  for team, rng_state in rng_states.items():
+    controllers[team].rng.setstate(rng_state)
+
+class Player:
+  """Plays a recording back through an engine, checking it stays on the recorded course.
+
+  Without ``engine`` it builds a headless one; a gameplay screen passes its
+  own engine and controllers and routes ``next_input`` into its input source.
+  """
+  def __init__(self, recording, engine=None, controllers=None, snapshot_every=SNAPSHOT_EVERY):
+    self.recording = recording
+    if engine is None:
+      engine, controllers = recording.new_match()
+    else:
+      recording.configure(engine)
+    self.engine, self.controllers = engine, controllers or {}
+    self.snapshot_every = snapshot_every
+    self.snapshots = {0: capture(self.engine, self.controllers)}
+    self.diverged = None  # first tick whose state CRC did not match the recording
+    self.resizes = {tick: rest for tick, *rest in recording.resizes}
+
+  @property
+  def tick(self):
+    return self.engine.ticks
+
+  @property
+  def done(self):
+    return self.engine.finished or self.tick >= self.recording.ticks
+
+  def pending_resize(self):
+    """(width, height, sizes) to apply before the coming tick, if the window was resized there."""
+    return self.resizes.get(self.tick)
+
+  def next_input(self):
+    return self.recording.inputs[self.tick] if self.tick < self.recording.ticks else 0
+
+  def after_tick(self):
+    """Check the state CRC and keep a seek snapshot; call after every engine step."""
+    tick = self.tick
+    if tick % CHECK_EVERY == 0 and self.diverged is None:
+      index = tick // CHECK_EVERY - 1
+      if index < len(self.recording.checks) and self.recording.checks[index] != state_crc(self.engine):
+        self.diverged = tick
+    if tick % self.snapshot_every == 0 and tick not in self.snapshots:
+      self.snapshots[tick] = capture(self.engine, self.controllers)
+
+  def step(self):
+    """Run one recorded tick headless; returns the engine's events."""
+    resize = self.pending_resize()
+    if resize:
+      width, height, sizes = resize
+      self.engine.resize(width, height)
+      for team, size in enumerate(sizes):
+        self.engine.set_player_size(team, size)
+    self.engine.apply_inputs(self.next_input(), self.controllers)
+    events = self.engine.step()
+    self.after_tick()
+    return events
+
+  def run(self, until=None):
+    """Step until tick ``until`` (or the end); returns the number of ticks run."""
+    until = self.recording.ticks if until is None else min(until, self.recording.ticks)
+    start = self.tick
+    while self.tick < until and not self.engine.finished:
+      self.step()
+    return self.tick - start
+
+  def seek(self, tick):
+    """Jump to ``tick`` from the nearest snapshot at or before it, re-running the rest."""
+    base = max(t for t in self.snapshots if t <= max(0, tick))
+    restore(self.engine, self.controllers, self.snapshots[base])
+    self.run(tick)
+
+# ---------- command line ----------
+def info(recording):
+  seconds = recording.ticks / TICKS_PER_SECOND
+  mode = "PvP" if recording.ai_team < 0 else f"PvAI ({recording.difficulty}, seed {recording.seed})"
+  rules = f"first to {recording.win_score}" if recording.match_ticks is None else \
+          f"{recording.match_ticks / TICKS_PER_SECOND / 60:g} min + {recording.extra_ticks / TICKS_PER_SECOND / 60:g} extra"
+  print(f"{mode}, {recording.width}x{recording.height}, {rules}: {recording.ticks} ticks ({seconds:.1f} s), "
+        f"{len(recording.resizes)} resizes, {len(recording.checks)} state checks, "
+        f"{len(recording.to_bytes())} bytes")
+
+def verify(recording):
+  player = Player(recording)
+  start = time.perf_counter()
+  ticks = player.run()
+  elapsed = time.perf_counter() - start
+  print(f"replayed {ticks} ticks in {elapsed:.2f} s ({ticks / max(elapsed, 1e-9):,.0f} ticks/s); "
+        f"score {player.engine.score[0]}-{player.engine.score[1]}")
+  if player.diverged is None:
+    print("identical to the recorded match at every check")
+  else:
+    print(f"DIVERGED by tick {player.diverged}")
+  return player.diverged is None
+
+def play(recording, start=0.0, speed=1):
+  import pygame
+  from timestep import FixedTimestep
+  pygame.init()
+  screen = pygame.display.set_mode((recording.width, recording.height))
+  pygame.display.set_caption("Tiny football replay")
+  class Silent:
+    def play(self): pass
+  sounds = {"kick": Silent(), "goal": Silent()}
+  sides = ("left", "right")
+  if recording.ai_team < 0:
+    from pvp import PvPGameplay
+    gameplay = PvPGameplay(screen, recording.width, recording.height, *sides, sounds,
+                           match_ticks=recording.match_ticks, extra_ticks=recording.extra_ticks)
+  else:
+    from pvai import PvAIGameplay
+    gameplay = PvAIGameplay(screen, recording.width, recording.height, sides[1 - recording.ai_team], recording.difficulty,
+                            sounds, match_ticks=recording.match_ticks,
+                            extra_ticks=recording.extra_ticks, seed=recording.seed)
+  player = Player(recording, gameplay.engine, gameplay.controllers)
+  gameplay.input_source = player.next_input
+  def seek(tick):
+    player.seek(tick)
+    width, height = gameplay.engine.width, gameplay.engine.height
+    if (width, height) != (gameplay.width, gameplay.height):  # jumped across a recorded resize
+      sizes = [rect.size for rect in gameplay.engine.players]
+      gameplay.resize(width, height, pygame.display.set_mode((width, height)))
+      for team, size in enumerate(sizes):
+        gameplay.engine.set_player_size(team, size)
+    gameplay.previous = None
+  seek(int(start * TICKS_PER_SECOND))
+  timestep, clock, dt = FixedTimestep(TICKS_PER_SECOND * speed, max_steps=5 * speed), pygame.time.Clock(), 0.0
+  while not gameplay.back_to_menu:
+    events = pygame.event.get()
+    for event in events:
+      if event.type == pygame.QUIT or (event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE):
+        gameplay.back_to_menu = True
+      elif event.type == pygame.KEYDOWN and event.key in (pygame.K_LEFT, pygame.K_RIGHT):
+        step = 10 * TICKS_PER_SECOND * (1 if event.key == pygame.K_RIGHT else -1)
+        seek(player.tick + step)
+    gameplay.handle_events(events)
+    for _ in range(timestep.advance(dt)):
+      if player.done:
+        break
+      resize = player.pending_resize()
+      if resize:
+        width, height, sizes = resize
+        gameplay.resize(width, height, pygame.display.set_mode((width, height)))
+        for team, size in enumerate(sizes):
+          gameplay.engine.set_player_size(team, size)
+      if not gameplay.paused:
+        gameplay.update()
+        player.after_tick()
+    gameplay.draw(timestep.alpha)
+    pygame.display.flip()
+    dt = clock.tick(60) / 1000
+  gameplay.close()
+  pygame.quit()
+  if player.diverged is not None:
+    print(f"DIVERGED by tick {player.diverged}")
+
+def main(argv=None):
+  parser = argparse.ArgumentParser(description="Inspect, verify or watch a recorded match")
+  parser.add_argument("command", choices=["info", "verify", "play"])
+  parser.add_argument("file")
+  parser.add_argument("--start", type=float, default=0.0, help="play: seconds into the match to start from")
+  parser.add_argument("--speed", type=int, default=1, help="play: ticks simulated per normal tick")
+  args = parser.parse_args(argv)
+  load_difficulty_table()  # the game plays with the tuned tiers, so its recordings replay with them
+  recording = Recording.load(args.file)
+  if args.command == "info":
+    info(recording)
+  elif args.command == "verify":
+    return 0 if verify(recording) else 1
+  else:
+    play(recording, args.start, args.speed)
+  return 0
+
+if __name__ == "__main__":
+  raise SystemExit(main())
@@ -1,5 +1,7 @@
-import pygame, os
+import pygame
+import asset_manager, profiler
 from button import Button
+from dispatcher import Dispatcher
 
 class PauseMenu:
   def __init__(self, screen, width, height):
@@ -8,24 +10,28 @@ class PauseMenu:
     self.height = height
 
     # Only buttons now, no board background
-    self.resume_img = self._load_image(os.path.join("assets", "pause", "resume-button.png"))
-    self.quit_img = self._load_image(os.path.join("assets", "pause", "quit-button.png"))
+    self.resume_img = self._load_image(asset_manager.RESUME_BUTTON)
+    self.quit_img = self._load_image(asset_manager.QUIT_BUTTON)
 
+    self.backdrop = None  # the paused game frame with the shade composited in, see freeze()
+    self.painted = False
+    self.dirty = None     # what the last draw() changed: None for the whole screen, else a list of rects
+    self.dispatcher = Dispatcher()
     self._create_buttons()
 
   def _load_image(self, path, scale=None, default_size=(100, 50)):
-    try:
-      img = pygame.image.load(path).convert_alpha()
-      if scale:
-        img = pygame.transform.smoothscale(img, (int(scale[0]), int(scale[1])))
-      return img
-    except (pygame.error, FileNotFoundError):
+    def placeholder():
       print(f"Warning: Cannot load image at {path}. Using a placeholder.")
-      surf = pygame.Surface(scale if scale else default_size, pygame.SRCALPHA)
-      surf.fill((128, 128, 128, 200))
-      return surf
+      return asset_manager.solid(scale if scale else default_size, (128, 128, 128, 200), alpha=True)
+    if scale:
+      return asset_manager.scaled(path, scale, placeholder=placeholder)
+    return asset_manager.image(path, placeholder=placeholder)
 
   def _create_buttons(self):
+    # Dark overlay, built once per window size
+    self.shade = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
+    self.shade.fill((0, 0, 0, 150))
+
     btn_width = self.width / 4  # buttons scale based on screen width
 
     # Get original sizes
@@ -36,8 +42,8 @@ class PauseMenu:
     scaled_resume_h = int(resume_h * btn_width / max(1, resume_w))
     scaled_quit_h = int(quit_h * btn_width / max(1, quit_w))
 
-    scaled_resume_img = pygame.transform.smoothscale(self.resume_img, (int(btn_width), scaled_resume_h))
-    scaled_quit_img = pygame.transform.smoothscale(self.quit_img, (int(btn_width), scaled_quit_h))
+    scaled_resume_img = asset_manager.scaled(asset_manager.RESUME_BUTTON, (int(btn_width), scaled_resume_h))
+    scaled_quit_img = asset_manager.scaled(asset_manager.QUIT_BUTTON, (int(btn_width), scaled_quit_h))
 
     spacing = 30
     total_button_height = scaled_resume_h + scaled_quit_h + spacing
@@ -53,25 +59,56 @@ class PauseMenu:
 
     self.resume_button = Button(button_x, resume_y, scaled_resume_img, self.screen)
     self.quit_button = Button(button_x, quit_y, scaled_quit_img, self.screen)
+    self.dispatcher.clear()
+    self.dispatcher.add('resume', self.resume_button)
+    self.dispatcher.add('quit', self.quit_button)
+
+  @property
+  def frozen(self):
+    return self.backdrop is not None
+
+  def freeze(self, frame):
+    """Keep ``frame`` (the last game frame) dimmed by the shade, to stand behind the menu until ``thaw``."""
+    with profiler.section("pause overlay"):
+      self.backdrop = frame.copy()
+      self.backdrop.blit(self.shade, (0, 0))
+    self.painted = False
+
+  def thaw(self):
+    """Forget the frozen frame, e.g. because the game under the menu changed."""
+    self.backdrop = None
+
+  def repaint(self):
+    """Paint the frozen frame again on the next draw, e.g. after something drew over the window."""
+    self.painted = False
+
+  def events(self, events):
+    """The button clicked in ``events``: 'resume', 'quit' or None."""
+    clicked = self.dispatcher.dispatch(events)
+    return clicked[-1] if clicked else None
 
   def draw(self):
-    action = None
-
-    # Dark overlay
-    overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-    overlay.fill((0, 0, 0, 150))
-    self.screen.blit(overlay, (0, 0))
-
-    # Draw buttons
-    if self.resume_button.draw():
-      action = 'resume'
-    if self.quit_button.draw():
-      action = 'quit'
-
-    return action
+    """Draw the menu.
+
+    Frozen, only the first call paints (the backdrop and the buttons, which
+    never change) and later calls leave ``dirty`` empty. Unfrozen, the shade
+    goes over whatever is on screen.
+    """
+    if self.backdrop is None:
+      self.screen.blit(self.shade, (0, 0))
+    elif not self.painted:
+      self.screen.blit(self.backdrop, (0, 0))
+      self.painted = True
+    else:
+      self.dirty = []
+      return
+    self.dirty = None
+    self.resume_button.draw()
+    self.quit_button.draw()
 
   def resize(self, width, height, screen):
     self.width = width
     self.height = height
     self.screen = screen
+    self.thaw()
     self._create_buttons()
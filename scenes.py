@@ -0,0 +1,74 @@
+"""Which screen is showing, and match screens kept warm between matches.
+
+``SceneStack`` is the path the player took through the screens ("menu",
+"option", "game"), newest on top; main.py runs the top one, and leaving a
+match pops back to the menu underneath, which (like the options screen) is
+never rebuilt. A match's own pause menu lives inside its gameplay screen.
+
+A gameplay screen is the heavy one: scaled field and sprites, buttons,
+pause menu, scoreboard, rewind buffer, engine and ball. ``MatchPool``
+keeps the screens of finished or abandoned matches, up to ``POOL_SIZE``,
+keyed by everything their construction depends on (mode, sides, AI,
+rules). Starting a match with the same settings takes one back and
+``restart()``s it in place (a fresh score, kickoff positions and AI state),
+so a rematch or a second match from the menu costs no loading, scaling or
+allocation. The search AI is never pooled: closing its match stops its
+worker.
+"""
+from collections import OrderedDict
+
+POOL_SIZE = 4
+
+class SceneStack:
+  def __init__(self, *names):
+    self.names = list(names)
+
+  @property
+  def top(self):
+    return self.names[-1]
+
+  def push(self, name):
+    self.names.append(name)
+
+  def pop(self):
+    self.names.pop()
+    return self.top
+
+  def replace(self, name):
+    self.names[-1] = name
+
+  def back_to(self, name):
+    """Pop the screens above the most recent ``name``."""
+    del self.names[len(self.names) - self.names[::-1].index(name):]
+
+def match_key(mode, sides, difficulty=None, match_ticks=None, extra_ticks=0, dirty_rects=False):
+  """The settings a gameplay screen is built for, or None for one that cannot be reused."""
+  if difficulty == "search":
+    return None
+  return (mode, tuple(sides), difficulty, match_ticks, extra_ticks, dirty_rects)
+
+class MatchPool:
+  def __init__(self, size=POOL_SIZE):
+    self.size = size
+    self.idle = OrderedDict()  # key -> closed gameplay screen, least recently used first
+    self.keys = {}             # gameplay screen in use -> its key
+
+  def acquire(self, key, build, screen, width, height):
+    """A screen for a new match: an idle one with ``key``, restarted for this window, or else ``build()``."""
+    gameplay = self.idle.pop(key, None) if key is not None else None
+    if gameplay is None:
+      gameplay = build()
+    else:
+      gameplay.restart(screen, width, height)
+    self.keys[gameplay] = key
+    return gameplay
+
+  def release(self, gameplay):
+    """Keep a closed match screen for reuse (unless its settings make it unpoolable)."""
+    key = self.keys.pop(gameplay, None)
+    if key is None:
+      return
+    self.idle[key] = gameplay
+    self.idle.move_to_end(key)
+    while len(self.idle) > self.size:
+      self.idle.popitem(last=False)
@@ -0,0 +1,117 @@
+"""Match scoreboard built from the Electronic Scoreboard sprites.
+
+The board shows HOME and VISITOR scores in their boxes and a MM:SS clock
+between them, titled TIME (or EXTRA TIME). ``resize`` scales every sprite
+once per window size: the digits come from the scoreboard atlas page, the
+rest from their files. ``update`` re-composes the board only when the
+score, the clock's second or the period changes, so most frames cost a
+single blit. A missing sprite falls back to text from ``fonts``.
+"""
+import pygame
+import asset_manager, atlas, fonts
+
+PANEL_COLOR = (0, 0, 128)
+FRAME_COLOR = (230, 230, 230)
+MAX_CLOCK = 99 * 60 + 59
+
+class Scoreboard:
+  def __init__(self, width, height):
+    self.value = None
+    self.resize(width, height)
+
+  # ---------- sprites, scaled once per window size ----------
+  def _label(self, path, text, height):
+    def placeholder():
+      return fonts.render(text, 64, FRAME_COLOR)
+    src = asset_manager.image(path, placeholder=placeholder)
+    w = max(1, round(src.get_width() * height / max(1, src.get_height())))
+    return asset_manager.scaled(path, (w, height), placeholder=placeholder)
+
+  def _digits(self, height):
+    """Glyphs '0'-'9' sharing one scale factor, so the thin 1, 4 and 7 keep their proportions."""
+    sheet = atlas.load("scoreboard")
+    if not all(str(d) in sheet for d in range(10)):
+      return {str(d): fonts.render(str(d), height, FRAME_COLOR) for d in range(10)}
+    tallest = max(sheet.source_size(str(d))[1] for d in range(10))
+    glyphs = {}
+    for d in map(str, range(10)):
+      w, h = sheet.source_size(d)
+      glyphs[d] = sheet.scaled(d, (max(1, round(w * height / tallest)), max(1, round(h * height / tallest))))
+    return glyphs
+
+  def resize(self, width, height):
+    """Lay the board out for a ``width`` x ``height`` window and redraw it on the next ``update``."""
+    unit = max(48, height // 8)
+    pad = self.pad = max(3, unit // 12)
+    label_h = max(8, unit // 5)
+    box_h = unit - 2 * pad - label_h - pad
+    self.box = asset_manager.scaled(asset_manager.SCOREBOARD_BOX, (round(box_h * 932 / 991), box_h),
+                                    placeholder=lambda: asset_manager.solid((932, 991), PANEL_COLOR + (255,), alpha=True))
+    self.score_digits = self._digits(int(box_h * 0.7))
+    self.clock_digits = self._digits(int(box_h * 0.6))
+    self.labels = {"home": self._label(asset_manager.SCOREBOARD_HOME, "HOME", label_h),
+                   "visitor": self._label(asset_manager.SCOREBOARD_VISITOR, "VISITOR", label_h),
+                   "time": self._label(asset_manager.SCOREBOARD_TIME, "TIME", label_h),
+                   "extra": self._label(asset_manager.SCOREBOARD_EXTRA_TIME, "EXTRA TIME", label_h)}
+    # the clock is monospaced so the board does not jitter as digits change
+    self.clock_advance = max(g.get_width() for g in self.clock_digits.values()) + pad // 2
+    self.colon_w = max(4, self.clock_advance // 3)
+    clock_w = 4 * self.clock_advance + self.colon_w
+
+    side_w = max(self.box.get_width(), self.labels["home"].get_width(), self.labels["visitor"].get_width())
+    mid_w = max(clock_w, self.labels["time"].get_width(), self.labels["extra"].get_width())
+    self.columns = (pad * 2 + side_w // 2, pad * 4 + side_w + mid_w // 2, pad * 6 + side_w + mid_w + side_w // 2)
+    self.content_top = pad + label_h + pad
+
+    self.rect = pygame.Rect(0, 0, pad * 8 + 2 * side_w + mid_w, unit)
+    self.rect.midtop = (width // 2, pad)
+    self.base = pygame.Surface(self.rect.size, pygame.SRCALPHA)
+    radius = unit // 5
+    pygame.draw.rect(self.base, PANEL_COLOR, self.base.get_rect(), border_radius=radius)
+    pygame.draw.rect(self.base, FRAME_COLOR, self.base.get_rect(), max(2, unit // 30), border_radius=radius)
+    for column, name in ((0, "home"), (2, "visitor")):
+      x = self.columns[column]
+      self.base.blit(self.labels[name], self.labels[name].get_rect(midtop=(x, pad)))
+      self.base.blit(self.box, self.box.get_rect(midtop=(x, self.content_top)))
+    self.surface = self.base
+    self.value = None
+
+  # ---------- per-value composition ----------
+  def _blit_number(self, text, glyphs, center, advance=None):
+    widths = [advance or glyphs[c].get_width() for c in text]
+    x = center[0] - sum(widths) // 2
+    for c, w in zip(text, widths):
+      self.surface.blit(glyphs[c], glyphs[c].get_rect(center=(x + w // 2, center[1])))
+      x += w
+
+  def _compose(self, score, seconds, extra):
+    self.surface = self.base.copy()
+    box_mid = self.content_top + self.box.get_height() // 2
+    for column, goals in ((0, score[0]), (2, score[1])):
+      # two digits only fit the box at the clock's size
+      glyphs = self.score_digits if goals < 10 else self.clock_digits
+      self._blit_number(str(goals), glyphs, (self.columns[column], box_mid))
+    x = self.columns[1]
+    label = self.labels["extra" if extra else "time"]
+    self.surface.blit(label, label.get_rect(midtop=(x, self.pad)))
+    minutes, secs = divmod(min(MAX_CLOCK, max(0, seconds)), 60)
+    left = x - (4 * self.clock_advance + self.colon_w) // 2
+    self._blit_number(f"{minutes:02d}", self.clock_digits, (left + self.clock_advance, box_mid), self.clock_advance)
+    self._blit_number(f"{secs:02d}", self.clock_digits, (left + 3 * self.clock_advance + self.colon_w, box_mid), self.clock_advance)
+    colon_x = left + 2 * self.clock_advance + self.colon_w // 2
+    dot = max(2, self.colon_w // 2)
+    gap = self.clock_digits["0"].get_height() // 5
+    for dy in (-gap, gap):
+      pygame.draw.rect(self.surface, FRAME_COLOR, (colon_x - dot // 2, box_mid + dy - dot // 2, dot, dot))
+
+  def update(self, score, seconds, extra=False):
+    """Re-compose the board if the score, the clock's second or the period changed; returns whether it did."""
+    value = (tuple(score), int(seconds), extra)
+    if value == self.value:
+      return False
+    self.value = value
+    self._compose(*value)
+    return True
+
+  def draw(self, screen):
+    return screen.blit(self.surface, self.rect)
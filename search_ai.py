@@ -0,0 +1,187 @@
+"""Lookahead AI: beam search over movement directions, planned off the render thread.
+
+``SearchAIController`` is the "search" difficulty. Every frame it hands a
+snapshot of the match to a background worker and immediately moves toward the
+newest target the worker has published; it never waits. The worker rolls the
+ball and kick physics of a headless ``MatchEngine`` forward for each candidate
+direction, keeps the best few (beam search), extends them with a second move,
+and stops as soon as its per-plan time budget runs out, returning the best plan
+found so far. Until the first plan arrives, the top tier's heuristic is used.
+
+The worker is a separate process by default so it does not compete with the
+render loop for the GIL; ``worker="thread"`` keeps it in-process.
+"""
+import math, os, queue, threading, time
+import multiprocessing as mp
+import pygame
+
+from ai import AIController
+from engine import MatchEngine, PLAYER_SPEED
+
+# wall-clock time a single plan may take in the worker; on one core the worker shares it with the render loop
+BUDGET_MS = 8.0 if (os.cpu_count() or 1) > 1 else 3.0
+HORIZON = 24           # ticks simulated per move in a rollout
+BEAM_WIDTH = 3         # first moves kept for the second search level
+AIM_DISTANCE = 200     # how far along the chosen direction the published target sits
+
+# eight compass directions plus standing still
+DIRECTIONS = [(math.cos(a * math.pi / 4), math.sin(a * math.pi / 4)) for a in range(8)] + [(0.0, 0.0)]
+
+class Planner:
+  """Time-budgeted beam search over AI moves, using a private headless engine."""
+  def __init__(self, budget_ms=BUDGET_MS, horizon=HORIZON, beam_width=BEAM_WIDTH):
+    self.budget = budget_ms / 1000.0
+    self.horizon = horizon
+    self.beam_width = beam_width
+    self.engine = None
+
+  def _engine_for(self, width, height):
+    if self.engine is None or (self.engine.width, self.engine.height) != (width, height):
+      self.engine = MatchEngine(width, height)
+      self.bounds = pygame.Rect(0, 0, width, height)
+    return self.engine
+
+  def _load(self, state):
+    engine = self._engine_for(state["width"], state["height"])
+    ball = engine.ball
+    ball.x, ball.y, ball.vx, ball.vy = state["ball"]
+    ball.last_touch = state["last_touch"]
+    ball.rect.center = (int(ball.x), int(ball.y))
+    for team, (center, size) in enumerate(state["players"]):
+      engine.set_player_size(team, size)
+      engine.players[team].center = center
+    return engine
+
+  def _rollout(self, engine, team, speed, moves):
+    """Play ``moves`` (one direction per ``horizon`` ticks) and score the result for ``team``."""
+    ball, me, other = engine.ball, engine.players[team], engine.players[1 - team]
+    my_goal, their_goal = (engine.goal_left, engine.goal_right) if team == 0 else (engine.goal_right, engine.goal_left)
+    tick = 0
+    for dx, dy in moves:
+      for _ in range(self.horizon):
+        tick += 1
+        me.x += dx * speed; me.y += dy * speed
+        me.clamp_ip(self.bounds)
+        # assume the opponent runs straight at the ball
+        ox, oy = ball.x - other.centerx, ball.y - other.centery
+        dist = math.hypot(ox, oy) or 1.0
+        other.x += ox / dist * PLAYER_SPEED; other.y += oy / dist * PLAYER_SPEED
+        ball.move(engine.play_area, engine.goal_left, engine.goal_right)
+        for kicker in engine.kick_order:
+          ball.kick(engine.players[kicker], kicker)
+        if ball.rect.colliderect(their_goal):
+          return 10_000 - tick
+        if ball.rect.colliderect(my_goal):
+          return -10_000 + tick
+    # no goal: reward pushing the ball toward their goal and keeping it away from ours
+    score = math.hypot(ball.x - my_goal.centerx, ball.y - my_goal.centery)
+    score -= math.hypot(ball.x - their_goal.centerx, ball.y - their_goal.centery)
+    score -= 0.5 * math.hypot(ball.x - me.centerx, ball.y - me.centery)
+    if ball.last_touch == team:
+      score += 50
+    return score
+
+  def plan(self, state):
+    """Best first direction for the AI in ``state``, found within the time budget."""
+    deadline = time.perf_counter() + self.budget
+    team, speed = state["team"], state["speed"]
+    scored = []
+    for move in DIRECTIONS:
+      scored.append((self._rollout(self._load(state), team, speed, [move]), move))
+      if time.perf_counter() > deadline:
+        break
+    scored.sort(reverse=True)
+    best_score, best_move = scored[0]
+    # second level: extend the most promising first moves
+    for _, first in scored[:self.beam_width]:
+      for second in DIRECTIONS:
+        if time.perf_counter() > deadline:
+          return best_move
+        score = self._rollout(self._load(state), team, speed, [first, second])
+        if score > best_score:
+          best_score, best_move = score, first
+    return best_move
+
+def search_loop(requests, results, budget_ms, nice=0):
+  """Worker body: plan for the newest snapshot, publish, repeat. ``None`` stops it."""
+  if nice and hasattr(os, "nice"):
+    os.nice(nice)  # on a busy or single-core machine the render loop wins the CPU
+  planner = Planner(budget_ms)
+  while True:
+    state = requests.get()
+    try:
+      while True:  # skip snapshots that went stale while we were planning
+        state = requests.get_nowait()
+    except queue.Empty:
+      pass
+    if state is None:
+      return
+    results.put((state["seq"], planner.plan(state)))
+
+class SearchAIController(AIController):
+  def __init__(self, difficulty="search", rng=None, budget_ms=BUDGET_MS, worker="process"):
+    super().__init__(difficulty, rng)
+    self.budget_ms = budget_ms
+    self.seq = 0
+    self.reset_seq = 0  # plans for snapshots up to this one predate the last reset
+    self.pending = False
+    self.plan = None
+    if worker == "process":
+      try:
+        self.requests, self.results = mp.Queue(), mp.Queue()
+        self.worker = mp.Process(target=search_loop, args=(self.requests, self.results, budget_ms, 19), daemon=True)
+        self.worker.start()
+        return
+      except OSError:
+        pass  # no process support here: fall back to a thread
+    self.requests, self.results = queue.Queue(), queue.Queue()
+    self.worker = threading.Thread(target=search_loop, args=(self.requests, self.results, budget_ms), daemon=True)
+    self.worker.start()
+
+  def update_ai_player(self, ai_rect, ball, human_rect, screen_width, screen_height, goal_left, goal_right, ai_side):
+    if self.worker is None or not self.worker.is_alive():
+      # no worker (closed, or it died): nothing will ever answer, so play the heuristic
+      self.plan = None
+      super().update_ai_player(ai_rect, ball, human_rect, screen_width, screen_height, goal_left, goal_right, ai_side)
+      return
+    self.cooldown = max(0, self.cooldown - 1)
+    # collect whatever the worker finished since last frame, never blocking
+    try:
+      while True:
+        seq, plan = self.results.get_nowait()
+        if seq <= self.reset_seq:
+          continue  # planned for the match as it was before reset()
+        self.plan = plan
+        self.pending = False
+    except queue.Empty:
+      pass
+    if not self.pending:
+      self.seq += 1
+      self.requests.put({
+        "seq": self.seq, "width": screen_width, "height": screen_height,
+        "team": 0 if ai_side == "left" else 1, "speed": 4.0 * self.speed_multiplier,
+        "ball": (ball.x, ball.y, ball.vx, ball.vy), "last_touch": ball.last_touch,
+        "players": [(r.center, r.size) for r in ((ai_rect, human_rect) if ai_side == "left" else (human_rect, ai_rect))],
+      })
+      self.pending = True
+
+    if self.plan is None:
+      super().update_ai_player(ai_rect, ball, human_rect, screen_width, screen_height, goal_left, goal_right, ai_side)
+      return
+    dx, dy = self.plan
+    self.target_x = ai_rect.centerx + dx * AIM_DISTANCE
+    self.target_y = ai_rect.centery + dy * AIM_DISTANCE
+    self._move_toward_target(ai_rect, self.target_x, self.target_y, screen_width, screen_height)
+
+  def reset(self):
+    super().reset()
+    self.seq += 1
+    self.reset_seq = self.seq
+    self.pending = False
+    self.plan = None
+
+  def close(self):
+    if self.worker is not None and self.worker.is_alive():
+      self.requests.put(None)
+      self.worker.join(timeout=1.0)
+    self.worker = None
@@ -0,0 +1,252 @@
+"""Compact match snapshots: fixed-layout structs for rewind, instant replay and save/resume.
+
+``pack`` writes everything that decides how a match goes on from a given
+tick into one ``SIZE``-byte struct (no pickle): the field size, both
+players, the ball, score, clock and result, the gameplay screen's banner
+and pause state, and the AI's timers and target. ``unpack`` writes it back
+in a few microseconds. The AI's random stream is left out: a restored live
+match just carries on with fresh randomness (replay.py, which needs the
+exact stream, keeps it beside its snapshots).
+
+``History`` keeps one snapshot per tick for the last ``REWIND_SECONDS`` in a
+preallocated ring, so memory stays at ``seconds * rate * SIZE`` bytes
+however long the match runs; ``Rewind`` uses it to take a match back or to
+show the last few seconds again. ``save``/``load`` put an unfinished match
+on disk with the settings needed to rebuild its screen.
+"""
+import os, struct
+from engine import TICKS_PER_SECOND
+
+SAVE_FILE = "savegame.bin"
+REWIND_SECONDS = 10  # history kept for rewind and instant replay
+REPLAY_SECONDS = 5   # shown by an instant replay (R in a match)
+REWIND_STEP_SECONDS = 3  # taken back by one rewind (Backspace)
+GOAL_TEXTS = ("", "GOAL!", "OWN GOAL!", "EXTRA TIME!")
+SIDES = ("left", "right")
+
+# flags
+FINISHED, EXTRA_TIME, PAUSED, LAST_GOAL, OWN_GOAL, AI_TARGET = 1, 2, 4, 8, 16, 32
+
+# width, height, player rects x2, ball x, y, vx, vy, last touch (-1: none), ball player size, score x2,
+# winner (-1: none), flags, last scorer, ticks, banner timer, banner text,
+# AI team (-1: none), cooldown, decision timer, last ball position, target
+STATE = struct.Struct("<HH8i4dbH2HbBbIHBbHH2d2d")
+SIZE = STATE.size
+
+# magic, version, mode (0: PvP, 1: PvAI), first side, second side (PvP), match ticks (0: untimed),
+# extra ticks, AI seed, difficulty length
+SAVE_HEADER = struct.Struct("<4sBBBBIIIB")
+SAVE_MAGIC = b"TFSV"
+SAVE_VERSION = 2
+
+def pack(engine, controllers=None, goal_text_timer=0, goal_text="", paused=False):
+  """One match state as ``SIZE`` bytes; ``controllers`` (team -> AI) may hold at most one AI."""
+  controllers = controllers or {}
+  if len(controllers) > 1:
+    raise ValueError("a snapshot holds at most one AI")
+  ball, last_goal = engine.ball, engine.last_goal
+  flags = ((FINISHED if engine.finished else 0) | (EXTRA_TIME if engine.extra_time else 0) | (PAUSED if paused else 0)
+           | (LAST_GOAL if last_goal else 0) | (OWN_GOAL if last_goal and last_goal[1] else 0))
+  ai_team, ai = -1, (0, 0, 0.0, 0.0, 0.0, 0.0)
+  for ai_team, controller in controllers.items():
+    target = getattr(controller, "target_x", None), getattr(controller, "target_y", None)
+    if target[0] is not None:
+      flags |= AI_TARGET
+    else:
+      target = (0.0, 0.0)
+    ai = (controller.cooldown, controller.decision_timer, *controller.last_ball_pos, *target)
+  return STATE.pack(engine.width, engine.height, *engine.players[0], *engine.players[1],
+                    ball.x, ball.y, ball.vx, ball.vy, -1 if ball.last_touch is None else ball.last_touch, ball.player_size,
+                    engine.score[0], engine.score[1], -1 if engine.winner is None else engine.winner, flags,
+                    last_goal[0] if last_goal else -1, engine.ticks, goal_text_timer,
+                    GOAL_TEXTS.index(goal_text) if goal_text in GOAL_TEXTS else 0, ai_team, *ai)
+
+def unpack(data, engine, controllers=None):
+  """Write a ``pack`` snapshot back into ``engine`` and the AI; returns (banner timer, banner text, paused)."""
+  (width, height, x0, y0, w0, h0, x1, y1, w1, h1, bx, by, bvx, bvy, touch, player_size, s0, s1, winner, flags,
+   scorer, ticks, timer, text, ai_team, cooldown, decision_timer, lbx, lby, tx, ty) = STATE.unpack(data)
+  if (width, height) != (engine.width, engine.height):
+    engine.resize(width, height)
+  engine.players[0].update(x0, y0, w0, h0)
+  engine.players[1].update(x1, y1, w1, h1)
+  ball = engine.ball
+  ball.x, ball.y, ball.vx, ball.vy = bx, by, bvx, bvy
+  ball.last_touch = None if touch < 0 else touch
+  ball.player_size = player_size
+  ball.rect.center = (int(bx), int(by))
+  engine.score[:] = (s0, s1)
+  engine.winner = None if winner < 0 else winner
+  engine.finished, engine.extra_time = bool(flags & FINISHED), bool(flags & EXTRA_TIME)
+  engine.last_goal = (scorer, bool(flags & OWN_GOAL)) if flags & LAST_GOAL else None
+  engine.ticks = ticks
+  if ai_team >= 0 and controllers and ai_team in controllers:
+    controller = controllers[ai_team]
+    controller.cooldown, controller.decision_timer, controller.last_ball_pos = cooldown, decision_timer, (lbx, lby)
+    if flags & AI_TARGET:
+      controller.target_x, controller.target_y = tx, ty
+    else:  # the AI picks its first target on its next tick, as at kickoff
+      controller.__dict__.pop("target_x", None); controller.__dict__.pop("target_y", None)
+  return timer, GOAL_TEXTS[text], bool(flags & PAUSED)
+
+def capture(gameplay):
+  return pack(gameplay.engine, gameplay.controllers, gameplay.goal_text_timer, gameplay.goal_text, gameplay.paused)
+
+def restore(gameplay, data):
+  """Restore a ``capture`` into a gameplay screen, keeping the screen's current window and sprite sizes."""
+  engine = gameplay.engine
+  width, height, sizes = engine.width, engine.height, [rect.size for rect in engine.players]
+  gameplay.goal_text_timer, gameplay.goal_text, gameplay.paused = unpack(data, engine, gameplay.controllers)
+  if (engine.width, engine.height) != (width, height):
+    engine.resize(width, height)
+  for team, size in enumerate(sizes):
+    engine.set_player_size(team, size)
+  gameplay.previous = None
+  gameplay.back_button = None
+
+class History:
+  """The last ``seconds`` of per-tick snapshots in one preallocated ring buffer."""
+  def __init__(self, seconds=REWIND_SECONDS, rate=TICKS_PER_SECOND):
+    self.capacity = max(1, int(seconds * rate))
+    self.buffer = bytearray(self.capacity * SIZE)
+    self.start = 0
+    self.count = 0
+
+  def __len__(self):
+    return self.count
+
+  def push(self, data):
+    index = (self.start + self.count) % self.capacity
+    if self.count == self.capacity:
+      self.start = (self.start + 1) % self.capacity
+    else:
+      self.count += 1
+    self.buffer[index * SIZE:(index + 1) * SIZE] = data
+
+  def get(self, back=0):
+    """The snapshot pushed ``back`` pushes before the newest one."""
+    if not 0 <= back < self.count:
+      raise IndexError(back)
+    index = (self.start + self.count - 1 - back) % self.capacity
+    return bytes(self.buffer[index * SIZE:(index + 1) * SIZE])
+
+  def drop(self, count):
+    """Forget the newest ``count`` snapshots, e.g. the ones a rewind went back past."""
+    self.count = max(0, self.count - count)
+
+  def clear(self):
+    self.start = self.count = 0
+
+class Rewind:
+  """Rewind and instant replay for a gameplay screen, from the ``History`` of its ticks.
+
+  The screen calls ``record()`` after every tick it plays, and ``step()``
+  instead of playing a tick while ``replaying``.
+  """
+  def __init__(self, gameplay, seconds=REWIND_SECONDS, rate=TICKS_PER_SECOND):
+    self.gameplay = gameplay
+    self.rate = rate
+    self.history = History(seconds, rate)
+    self.frames = None  # snapshots still to show in an instant replay
+    self.live = None    # the match as it was when the replay started
+
+  @property
+  def replaying(self):
+    return self.frames is not None
+
+  def record(self):
+    self.history.push(capture(self.gameplay))
+
+  def rewind(self, seconds):
+    """Take the match back ``seconds`` (as far as the history reaches); returns whether it moved."""
+    back = min(len(self.history) - 1, int(seconds * self.rate))
+    if back <= 0 or self.replaying:
+      return False
+    restore(self.gameplay, self.history.get(back))
+    self.history.drop(back)
+    return True
+
+  def replay(self, seconds):
+    """Show the last ``seconds`` again; the match then carries on exactly where it was."""
+    count = min(len(self.history), int(seconds * self.rate))
+    if count < 2 or self.replaying:
+      return False
+    self.live = capture(self.gameplay)
+    self.frames = [self.history.get(back) for back in range(count - 1, -1, -1)]
+    return True
+
+  def step(self):
+    """Show the next replay frame; returns False once the replay is over and the live match is back."""
+    if self.frames:
+      restore(self.gameplay, self.frames.pop(0))
+      return True
+    self.stop()
+    return False
+
+  def stop(self):
+    if self.live is not None:
+      restore(self.gameplay, self.live)
+    self.frames = self.live = None
+
+  def reset(self):
+    """Forget the history and any replay in progress, for a new match on the same screen."""
+    self.history.clear()
+    self.frames = self.live = None
+
+# ---------- save / resume ----------
+class SavedMatch:
+  """An unfinished match read back by ``load``: its settings and its state."""
+  def __init__(self, mode, sides, difficulty, match_ticks, extra_ticks, seed, state):
+    self.mode, self.sides, self.difficulty = mode, sides, difficulty
+    self.match_ticks, self.extra_ticks, self.seed, self.state = match_ticks, extra_ticks, seed, state
+
+  def open(self, screen, width, height, sounds, dirty_rects=False):
+    """A gameplay screen for the match, restored and paused on its pause menu."""
+    if self.mode == "pvp":
+      from pvp import PvPGameplay
+      gameplay = PvPGameplay(screen, width, height, *self.sides, sounds, dirty_rects, self.match_ticks, self.extra_ticks)
+    else:
+      from pvai import PvAIGameplay
+      gameplay = PvAIGameplay(screen, width, height, self.sides[0], self.difficulty, sounds, dirty_rects,
+                              self.match_ticks, self.extra_ticks, self.seed)
+    restore(gameplay, self.state)
+    gameplay.paused = True
+    return gameplay
+
+def save(path, gameplay):
+  """Write an unfinished match to ``path``, as it stands outside any instant replay."""
+  state = gameplay.rewind.live if gameplay.rewind.replaying else capture(gameplay)
+  engine = gameplay.engine
+  if gameplay.controllers:
+    mode, sides, difficulty = 1, (gameplay.human_side, gameplay.ai_side), gameplay.ai_controller.difficulty.encode()
+    seed = gameplay.seed
+  else:
+    mode, sides, difficulty, seed = 0, (gameplay.side_p1, gameplay.side_p2), b"", 0
+  header = SAVE_HEADER.pack(SAVE_MAGIC, SAVE_VERSION, mode, SIDES.index(sides[0]), SIDES.index(sides[1]),
+                            engine.match_ticks or 0, engine.extra_ticks, seed, len(difficulty))
+  tmp = path + ".tmp"
+  with open(tmp, "wb") as f:
+    f.write(header + difficulty + state)
+  os.replace(tmp, path)
+
+def load(path):
+  """The ``SavedMatch`` in ``path``, or None if there is none (or it is unreadable)."""
+  try:
+    with open(path, "rb") as f:
+      data = f.read()
+    magic, version, mode, side1, side2, match_ticks, extra_ticks, seed, n = SAVE_HEADER.unpack_from(data)
+    if magic != SAVE_MAGIC or version != SAVE_VERSION or len(data) != SAVE_HEADER.size + n + SIZE:
+      raise ValueError("not a save this version can read")
+  except FileNotFoundError:
+    return None
+  except (OSError, ValueError, struct.error) as e:
+    print(f"Ignoring saved match {path}: {e}")
+    return None
+  difficulty = data[SAVE_HEADER.size:SAVE_HEADER.size + n].decode()
+  return SavedMatch("pvai" if mode else "pvp", (SIDES[side1], SIDES[side2]), difficulty,
+                    match_ticks or None, extra_ticks, seed, data[-SIZE:])
+
+def discard(path):
+  try:
+    os.remove(path)
+  except FileNotFoundError:
+    pass
@@ -0,0 +1,50 @@
+"""Fixed-timestep simulation clock, decoupled from the frame rate.
+
+Matches advance in whole ticks of ``1 / rate`` seconds however fast or slow
+frames are drawn. ``advance(dt)`` adds a frame's real time to an accumulator
+and returns how many ticks to run; ``alpha`` is how far the display is
+between the last two ticks, for interpolated drawing. A frame that fell
+further behind than ``max_steps`` ticks runs only those and drops the rest
+of the backlog, so a machine too slow to keep up falls behind real time
+instead of spiralling into ever longer frames.
+
+The match rules are tuned per tick at ``TICKS_PER_SECOND``; another rate
+plays the whole game (and its clock) proportionally faster or slower.
+"""
+from engine import TICKS_PER_SECOND
+
+class FixedTimestep:
+  def __init__(self, rate=TICKS_PER_SECOND, max_steps=5):
+    self.rate = rate
+    self.step = 1.0 / rate
+    self.max_steps = max_steps
+    self.accumulator = 0.0
+    self.dropped = 0  # ticks skipped by the catch-up cap, for diagnostics
+    self.restart = False
+
+  def reset(self):
+    """Forget banked time and the frame in progress, e.g. one that spent its time loading a match."""
+    self.accumulator = 0.0
+    self.restart = True
+
+  def advance(self, dt):
+    """Bank ``dt`` seconds of real time; returns the number of ticks to simulate now."""
+    if self.restart:
+      dt, self.restart = 0.0, False
+    self.accumulator += max(0.0, dt)
+    steps = int(self.accumulator / self.step)
+    if steps > self.max_steps:
+      self.dropped += steps - self.max_steps
+      steps = self.max_steps
+      self.accumulator %= self.step
+    else:
+      self.accumulator -= steps * self.step
+    return steps
+
+  @property
+  def alpha(self):
+    """Fraction of a tick elapsed since the last one, in [0, 1)."""
+    return min(self.accumulator / self.step, 1.0)
+
+def lerp_point(a, b, alpha):
+  return (round(a[0] + (b[0] - a[0]) * alpha), round(a[1] + (b[1] - a[1]) * alpha))
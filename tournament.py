@@ -0,0 +1,133 @@
+"""AI-vs-AI tournament: every difficulty against every other, on both sides, across all CPU cores.
+
+  python tournament.py --matches 500
+  python tournament.py --tiers hard expert --matches 2000 --workers 8
+
+Matches are played by ``engine.run_ai_match`` with real ``AIController``s, so
+balance changes to ``ai.py`` show up here directly. Each match is seeded from
+``--seed`` and its index, so a run is reproducible regardless of worker count.
+"""
+import os
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import argparse, math, random, sys, time
+from collections import defaultdict
+from multiprocessing import Pool
+
+from ai import AIController
+from engine import run_ai_match
+
+# "expert" is not special-cased in set_difficulty: it is the unnamed top tier (the else branch)
+DIFFICULTIES = ("easy", "medium", "hard", "expert")
+MAX_TICKS = 60 * 60 * 3  # three minutes of game time, then the match counts as a draw
+
+def play_match(job):
+  """Play one seeded match; runs in a worker process."""
+  index, left, right, seed, max_ticks = job
+  rng = random.Random(seed)
+  left_ai = AIController(left, random.Random(rng.getrandbits(64)))
+  right_ai = AIController(right, random.Random(rng.getrandbits(64)))
+  engine = run_ai_match(left_ai, right_ai, max_ticks=max_ticks)
+  return index, left, right, engine.score[0], engine.score[1], engine.winner, engine.ticks
+
+def schedule(tiers, matches, seed, max_ticks=MAX_TICKS):
+  """Every ordered pair of distinct tiers, so each plays every other from both sides."""
+  jobs = []
+  for left in tiers:
+    for right in tiers:
+      if left == right:
+        continue
+      for _ in range(matches):
+        index = len(jobs)
+        jobs.append((index, left, right, seed * 1_000_003 + index, max_ticks))
+  return jobs
+
+def wilson(wins, n, z=1.96):
+  """95% Wilson score interval for a win rate."""
+  if n == 0:
+    return 0.0, 1.0
+  p = wins / n
+  denom = 1 + z * z / n
+  centre = (p + z * z / (2 * n)) / denom
+  half = z * math.sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / denom
+  return max(0.0, centre - half), min(1.0, centre + half)
+
+class Standings:
+  """Running W/D/L and goal difference, per pairing (first tier's point of view) and per tier."""
+  def __init__(self):
+    self.pairs = defaultdict(lambda: {"w": 0, "d": 0, "l": 0, "gd": [], "ticks": 0, "side_w": [0, 0], "side_n": [0, 0]})
+    self.played = 0
+
+  def add(self, left, right, left_goals, right_goals, winner, ticks):
+    self.played += 1
+    for side, me, other, gf, ga in ((0, left, right, left_goals, right_goals), (1, right, left, right_goals, left_goals)):
+      won = winner == side
+      row = self.pairs[(me, other)]
+      row["w" if won else "d" if winner is None else "l"] += 1
+      row["side_w"][side] += won
+      row["side_n"][side] += 1
+      row["gd"].append(gf - ga)
+      row["ticks"] += ticks
+
+  @staticmethod
+  def _side_rate(row, side):
+    n = row["side_n"][side]
+    return f"{100 * row['side_w'][side] / n:.1f}%" if n else "-"
+
+  def table(self, tiers):
+    lines = [f"{'pairing':<18}{'W':>6}{'D':>6}{'L':>6}  {'win%':>6}  {'95% CI':<15}{'GD/match':>16}  {'as left':>8}{'as right':>9}"]
+    for me in tiers:
+      for other in tiers:
+        row = self.pairs.get((me, other))
+        if not row:
+          continue
+        n = row["w"] + row["d"] + row["l"]
+        lo, hi = wilson(row["w"], n)
+        gd = row["gd"]
+        mean = sum(gd) / n
+        sd = math.sqrt(sum((g - mean) ** 2 for g in gd) / (n - 1)) if n > 1 else 0.0
+        lines.append(f"{me + ' vs ' + other:<18}{row['w']:>6}{row['d']:>6}{row['l']:>6}  "
+                     f"{100 * row['w'] / n:>5.1f}%  [{100 * lo:4.1f}, {100 * hi:5.1f}]  "
+                     f"{mean:>+7.2f} ± {1.96 * sd / math.sqrt(n):.2f}  "
+                     f"{self._side_rate(row, 0):>8}{self._side_rate(row, 1):>9}")
+    lines.append("")
+    lines.append(f"{'tier':<18}{'W':>6}{'D':>6}{'L':>6}  {'win%':>6}  {'95% CI':<15}")
+    for me in tiers:
+      w = sum(r["w"] for (a, _), r in self.pairs.items() if a == me)
+      d = sum(r["d"] for (a, _), r in self.pairs.items() if a == me)
+      l = sum(r["l"] for (a, _), r in self.pairs.items() if a == me)
+      n = w + d + l
+      if n:
+        lo, hi = wilson(w, n)
+        lines.append(f"{me:<18}{w:>6}{d:>6}{l:>6}  {100 * w / n:>5.1f}%  [{100 * lo:4.1f}, {100 * hi:5.1f}]")
+    return "\n".join(lines)
+
+def main(argv=None):
+  parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+  parser.add_argument("--tiers", nargs="+", default=list(DIFFICULTIES), help="difficulties to enter")
+  parser.add_argument("--matches", type=int, default=500, help="matches per ordered pairing")
+  parser.add_argument("--workers", type=int, default=os.cpu_count(), help="worker processes")
+  parser.add_argument("--seed", type=int, default=0)
+  parser.add_argument("--max-ticks", type=int, default=MAX_TICKS, help="ticks before a match is called a draw")
+  parser.add_argument("--report-every", type=int, default=1000, help="print standings every N results")
+  args = parser.parse_args(argv)
+
+  jobs = schedule(args.tiers, args.matches, args.seed, args.max_ticks)
+  standings = Standings()
+  start = time.perf_counter()
+  print(f"{len(jobs)} matches on {args.workers} workers", flush=True)
+  with Pool(args.workers) as pool:
+    for _, left, right, left_goals, right_goals, winner, ticks in pool.imap_unordered(play_match, jobs, chunksize=16):
+      standings.add(left, right, left_goals, right_goals, winner, ticks)
+      if standings.played % args.report_every == 0 and standings.played < len(jobs):
+        elapsed = time.perf_counter() - start
+        print(f"\n--- {standings.played}/{len(jobs)} matches, {elapsed:.1f}s ---", flush=True)
+        print(standings.table(args.tiers), flush=True)
+
+  elapsed = time.perf_counter() - start
+  print(f"\n=== final: {standings.played} matches in {elapsed:.1f}s ===")
+  print(standings.table(args.tiers))
+  return 0
+
+if __name__ == "__main__":
+  sys.exit(main())
@@ -0,0 +1,160 @@
+"""Closed-form ball trajectory: where the ball will be, when it stops, and whether it scores.
+
+``Ball.move`` adds the velocity, reflects off ``main_rect`` and multiplies by
+``FRICTION_FACTOR`` every tick, zeroing an axis once it drops under
+``VELOCITY_THRESHOLD``. So after ``t`` ticks an axis has travelled the
+geometric series ``v0 * (1 - f**t) / (1 - f)``, the axis stops at a tick found
+with one logarithm, and wall bounces are the same path folded back into the
+field. Every query is O(1) with no tick-by-tick simulation.
+
+``Ball.move`` clamps the ball onto a wall instead of mirroring the overshoot,
+so each bounce can shift the prediction by up to one tick of travel (at most
+``Ball.speed`` pixels). A kicked ball travels at most ``speed / (1 - f)`` =
+300 px, so that is at most a bounce or two.
+"""
+import math
+from functools import lru_cache
+from ball import FRICTION_FACTOR, VELOCITY_THRESHOLD
+
+BALL_RADIUS = 22
+_LOG_F = math.log(FRICTION_FACTOR)
+
+def stop_tick(v):
+  """Ticks until ``Ball.move`` zeroes a velocity component of ``v``."""
+  v = abs(v)
+  if v == 0.0:
+    return 0
+  return max(1, math.floor(math.log(VELOCITY_THRESHOLD / v) / _LOG_F) + 1)
+
+def travel(v, t):
+  """Signed distance an axis covers in ``t`` ticks, ignoring walls."""
+  if v == 0.0:
+    return 0.0
+  t = min(t, stop_tick(v))
+  return v * (1.0 - FRICTION_FACTOR ** t) / (1.0 - FRICTION_FACTOR)
+
+def ticks_to_travel(v, distance):
+  """First tick at which an axis has covered ``distance`` (> 0), or None if it stops short."""
+  v = abs(v)
+  if v == 0.0:
+    return None
+  remaining = 1.0 - distance * (1.0 - FRICTION_FACTOR) / v
+  if remaining <= 0.0:
+    return None
+  t = max(1, math.ceil(math.log(remaining) / _LOG_F))
+  return t if t <= stop_tick(v) else None
+
+def fold(u, lo, hi):
+  """Map an unfolded coordinate back between two reflecting walls."""
+  span = hi - lo
+  if span <= 0:
+    return lo
+  m = (u - lo) % (2 * span)
+  return lo + (m if m <= span else 2 * span - m)
+
+class BallPredictor:
+  def __init__(self, main_rect, goal_left, goal_right, radius=BALL_RADIUS):
+    r = radius
+    self.x_lo, self.x_hi = main_rect.left + r, main_rect.right - r
+    self.y_lo, self.y_hi = main_rect.top + r, main_rect.bottom - r
+    # the ball rect overlaps a goal rect past these lines, within these heights
+    self.goal_left_x = goal_left.right + r
+    self.goal_right_x = goal_right.left - r
+    self.mouth_left = (goal_left.top - r, goal_left.bottom + r)
+    self.mouth_right = (goal_right.top - r, goal_right.bottom + r)
+
+  @staticmethod
+  @lru_cache(maxsize=8)
+  def for_field(width, height, radius=BALL_RADIUS):
+    from engine import field_rects
+    return BallPredictor(*field_rects(width, height), radius=radius)
+
+  def position(self, x, y, vx, vy, t):
+    """Ball center after ``t`` ticks (ignores goals: see ``goal_entry``)."""
+    return (fold(x + travel(vx, t), self.x_lo, self.x_hi),
+            fold(y + travel(vy, t), self.y_lo, self.y_hi))
+
+  def stop_tick(self, vx, vy):
+    return max(stop_tick(vx), stop_tick(vy))
+
+  def rest_position(self, x, y, vx, vy):
+    return self.position(x, y, vx, vy, self.stop_tick(vx, vy))
+
+  def goal_entry(self, x, y, vx, vy):
+    """``(tick, goal)`` with goal ``"left"``/``"right"`` if the ball rolls into a goal, else None."""
+    if vx == 0.0:
+      return None
+    total = abs(travel(vx, stop_tick(vx)))
+    # walk the unfolded x path: goal line of the side we are heading to, then its wall, then back
+    heading_right = vx > 0
+    covered = 0.0
+    pos = x
+    while covered < total:
+      goal_x = self.goal_right_x if heading_right else self.goal_left_x
+      wall_x = self.x_hi if heading_right else self.x_lo
+      to_goal = (goal_x - pos) if heading_right else (pos - goal_x)
+      if to_goal > 0:
+        t = ticks_to_travel(vx, covered + to_goal)
+        if t is None:
+          return None
+        ball_y = fold(y + travel(vy, t), self.y_lo, self.y_hi)
+        lo, hi = self.mouth_right if heading_right else self.mouth_left
+        if lo < ball_y < hi:
+          return t, "right" if heading_right else "left"
+      covered += abs(wall_x - pos)
+      pos = wall_x
+      heading_right = not heading_right
+    return None
+
+
+def predict_positions(x, y, vx, vy, t, predictor):
+  """NumPy version of ``BallPredictor.position`` for arrays of balls and horizons."""
+  import numpy as np
+  def axis(p, v, lo, hi):
+    speed = np.abs(v)
+    moving = speed > 0.0
+    k = np.floor(np.log(VELOCITY_THRESHOLD / np.where(moving, speed, 1.0)) / _LOG_F) + 1
+    k = np.where(moving, np.maximum(k, 1), 0)
+    u = p + v * (1.0 - FRICTION_FACTOR ** np.minimum(t, k)) / (1.0 - FRICTION_FACTOR)
+    span = hi - lo
+    m = np.mod(u - lo, 2 * span)
+    return lo + np.where(m <= span, m, 2 * span - m)
+  return (axis(x, vx, predictor.x_lo, predictor.x_hi),
+          axis(y, vy, predictor.y_lo, predictor.y_hi))
+
+
+if __name__ == "__main__":
+  # accuracy check against tick-by-tick Ball.move
+  import random, time
+  from engine import MatchEngine
+  engine = MatchEngine(1200, 675)
+  predictor = BallPredictor(engine.main_rect, engine.goal_left, engine.goal_right, engine.ball.radius)
+  rng = random.Random(0)
+  worst, goal_ok, goal_total, stop_ok = 0.0, 0, 0, 0
+  trials = 2000
+  for _ in range(trials):
+    ball = engine.ball
+    ball.x, ball.y = rng.uniform(predictor.x_lo, predictor.x_hi), rng.uniform(predictor.y_lo, predictor.y_hi)
+    angle = rng.uniform(0, 2 * math.pi)
+    ball.vx, ball.vy = math.cos(angle) * ball.speed, math.sin(angle) * ball.speed
+    ball.rect.center = (int(ball.x), int(ball.y))
+    start = (ball.x, ball.y, ball.vx, ball.vy)
+    expect_goal = predictor.goal_entry(*start)
+    stop = predictor.stop_tick(ball.vx, ball.vy)
+    actual_goal, t = None, 0
+    while ball.vx or ball.vy:
+      ball.move(engine.play_area, engine.goal_left, engine.goal_right); t += 1
+      if ball.rect.colliderect(engine.goal_left): actual_goal = "left"
+      elif ball.rect.colliderect(engine.goal_right): actual_goal = "right"
+      if actual_goal: break
+      px, py = predictor.position(*start, t)
+      worst = max(worst, abs(px - ball.x), abs(py - ball.y))
+    if actual_goal is None: stop_ok += (t == stop)
+    goal_total += actual_goal is not None
+    goal_ok += (expect_goal[1] if expect_goal else None) == actual_goal
+  print(f"{trials} random kicks: max position error {worst:.2f} px, goal prediction right {goal_ok}/{trials} "
+        f"({goal_total} goals), stop tick exact {stop_ok}/{trials - goal_total}")
+  start = time.perf_counter()
+  for _ in range(100_000):
+    predictor.position(600.0, 300.0, 4.2, -3.1, 57)
+  print(f"position(): {(time.perf_counter() - start) * 10:.2f} us/query")
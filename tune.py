@@ -0,0 +1,201 @@
+"""Auto-tune the AI difficulty tiers against a reference opponent.
+
+  python tune.py --generations 30 --population 24 --matches 40
+  python tune.py --targets easy=0.2 hard=0.75 --reference medium
+
+Each tier gets its own cross-entropy search (a diagonal CMA-ES-style update:
+sample a Gaussian population, keep the elite, refit mean and spread) over the
+difficulty numbers and the decision radii of ``AIController``. A candidate's
+fitness is how far its win rate against the reference, over seeded headless
+matches on both sides, is from the tier's target. Matches fan out over a
+process pool. Progress is checkpointed after every generation, so an
+interrupted search resumes where it stopped. The best candidates are written
+to ``ai_difficulty.json``, which the game loads at startup.
+
+Tuning itself always starts from, and plays against, the built-in tiers in
+``ai.DIFFICULTY_TABLE`` (nothing here loads ``ai_difficulty.json``), and the
+checkpoint records the reference's parameters, so a resumed or repeated run
+never plays against an opponent that an earlier run already tuned.
+"""
+import os
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import argparse, json, random, sys, time, zlib
+from multiprocessing import Pool
+
+import numpy as np
+
+from ai import AIController, DEFAULT_RADII, DIFFICULTY_FILE, DIFFICULTY_TABLE
+from engine import run_ai_match
+from tournament import MAX_TICKS
+
+SEARCH_SPACE = {
+  "reaction_time": (1, 6),
+  "speed_multiplier": (0.4, 1.6),
+  "accuracy": (0.5, 1.0),
+  "aggression": (0.3, 1.0),
+  "lookahead": (0, 90),
+  "shoot_radius": (60, 300),
+  "strike_radius": (40, 200),
+  "defend_radius": (40, 200),
+  "approach_radius": (60, 240),
+  "chase_radius": (20, 160),
+}
+# win rate each tier should reach against the reference opponent; "top" is the unnamed tier
+DEFAULT_TARGETS = {"easy": 0.25, "medium": 0.5, "hard": 0.7, "top": 0.85}
+CHECKPOINT_FILE = "tune_checkpoint.json"
+
+def tier_params(tier):
+  key = None if tier == "top" else tier
+  return {**DEFAULT_RADII, **DIFFICULTY_TABLE.get(key, DIFFICULTY_TABLE[None])}
+
+def clip(params):
+  out = {}
+  for name, (lo, hi) in SEARCH_SPACE.items():
+    value = min(hi, max(lo, float(params[name])))
+    out[name] = int(round(value)) if name in ("reaction_time", "lookahead") else round(value, 3)
+  return out
+
+def play(job):
+  """One seeded match of a candidate against the reference; runs in a worker process."""
+  key, params, reference, seed, side, max_ticks = job
+  rng = random.Random(seed)
+  candidate = AIController("custom", random.Random(rng.getrandbits(64)))
+  candidate.apply_params(params)
+  opponent = AIController("reference", random.Random(rng.getrandbits(64)))
+  opponent.apply_params(reference)
+  left, right = (candidate, opponent) if side == 0 else (opponent, candidate)
+  engine = run_ai_match(left, right, max_ticks=max_ticks)
+  score = 0.5 if engine.winner is None else float(engine.winner == side)
+  return key, score
+
+class TierSearch:
+  """Gaussian cross-entropy search for one tier; plain dict state so it checkpoints as JSON."""
+  def __init__(self, tier, target, state=None):
+    self.tier = tier
+    self.target = target
+    if state is None:
+      start = tier_params(tier)
+      state = {
+        "generation": 0,
+        "mean": {name: float(start[name]) for name in SEARCH_SPACE},
+        "std": {name: (hi - lo) / 4 for name, (lo, hi) in SEARCH_SPACE.items()},
+        "best": clip(start),
+        "best_error": None,
+        "history": [],
+      }
+    self.state = state
+
+  def sample(self, population, seed):
+    rng = np.random.default_rng([seed, zlib.crc32(self.tier.encode()), self.state["generation"]])
+    mean, std = self.state["mean"], self.state["std"]
+    candidates = [clip(mean)]  # always re-test the current mean
+    while len(candidates) < population:
+      candidates.append(clip({name: rng.normal(mean[name], std[name]) for name in SEARCH_SPACE}))
+    return candidates
+
+  def update(self, candidates, win_rates, elite_frac=0.25):
+    errors = [abs(rate - self.target) for rate in win_rates]
+    order = sorted(range(len(candidates)), key=errors.__getitem__)
+    elite = [candidates[i] for i in order[:max(2, int(len(candidates) * elite_frac))]]
+    for name, (lo, hi) in SEARCH_SPACE.items():
+      values = np.array([c[name] for c in elite], dtype=float)
+      self.state["mean"][name] = float(values.mean())
+      # keep some spread so the search cannot collapse onto a noisy winner
+      self.state["std"][name] = float(max(values.std(), (hi - lo) * 0.02))
+    best = order[0]
+    if self.state["best_error"] is None or errors[best] < self.state["best_error"]:
+      self.state["best"] = candidates[best]
+      self.state["best_error"] = errors[best]
+    self.state["history"].append({"generation": self.state["generation"], "best_error": errors[best],
+                                  "win_rate": win_rates[best]})
+    self.state["generation"] += 1
+
+def load_checkpoint(path):
+  try:
+    with open(path) as f:
+      return json.load(f)
+  except (OSError, ValueError):
+    return None
+
+def save_json(path, data):
+  tmp = path + ".tmp"
+  with open(tmp, "w") as f:
+    json.dump(data, f, indent=2)
+  os.replace(tmp, path)  # atomic, so a kill mid-write never corrupts the checkpoint
+
+def evaluate(pool, searches, population, matches, reference, seed, max_ticks):
+  """Play every candidate of every tier against the ``reference`` parameters; returns {tier: (candidates, win_rates)}."""
+  jobs, candidates = [], {}
+  for search in searches:
+    cands = search.sample(population, seed)
+    candidates[search.tier] = cands
+    # every candidate of a generation plays the same seeds, so they are compared on equal terms
+    base = np.random.default_rng([seed, zlib.crc32(search.tier.encode()), search.state["generation"], 1])
+    match_seeds = base.integers(0, 2**63, matches).tolist()
+    for c, params in enumerate(cands):
+      for m, match_seed in enumerate(match_seeds):
+        jobs.append(((search.tier, c), params, reference, match_seed, m % 2, max_ticks))
+  totals = {}
+  for key, score in pool.imap_unordered(play, jobs, chunksize=8):
+    totals[key] = totals.get(key, 0.0) + score
+  return {tier: (cands, [totals[(tier, c)] / matches for c in range(len(cands))])
+          for tier, cands in candidates.items()}
+
+def main(argv=None):
+  parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+  parser.add_argument("--targets", nargs="+", metavar="TIER=RATE",
+                      help="win-rate targets, default " + " ".join(f"{k}={v}" for k, v in DEFAULT_TARGETS.items()))
+  parser.add_argument("--reference", default="medium", help="opponent tier every candidate plays")
+  parser.add_argument("--generations", type=int, default=20)
+  parser.add_argument("--population", type=int, default=16, help="candidates per tier per generation")
+  parser.add_argument("--matches", type=int, default=40, help="matches per candidate, alternating sides")
+  parser.add_argument("--workers", type=int, default=os.cpu_count())
+  parser.add_argument("--seed", type=int, default=0)
+  parser.add_argument("--max-ticks", type=int, default=MAX_TICKS)
+  parser.add_argument("--checkpoint", default=CHECKPOINT_FILE)
+  parser.add_argument("--output", default=DIFFICULTY_FILE)
+  parser.add_argument("--fresh", action="store_true", help="ignore an existing checkpoint")
+  args = parser.parse_args(argv)
+
+  targets = dict(DEFAULT_TARGETS)
+  if args.targets:
+    targets = {tier: float(rate) for tier, rate in (t.split("=", 1) for t in args.targets)}
+
+  reference = tier_params(args.reference)
+  checkpoint = None if args.fresh else load_checkpoint(args.checkpoint)
+  if checkpoint and (checkpoint["targets"] != targets or checkpoint["reference"] != args.reference
+                     or checkpoint.get("reference_params") != reference):
+    print(f"{args.checkpoint} was made for different targets/reference; starting over (use --checkpoint to keep it)")
+    checkpoint = None
+  if checkpoint:
+    print(f"resuming from {args.checkpoint}")
+  searches = [TierSearch(tier, target, checkpoint["tiers"][tier] if checkpoint else None) for tier, target in targets.items()]
+
+  with Pool(args.workers) as pool:
+    while True:
+      pending = [s for s in searches if s.state["generation"] < args.generations]
+      if not pending:
+        break
+      start = time.perf_counter()
+      results = evaluate(pool, pending, args.population, args.matches, reference, args.seed, args.max_ticks)
+      for search in pending:
+        search.update(*results[search.tier])
+      save_json(args.checkpoint, {"targets": targets, "reference": args.reference, "reference_params": reference,
+                                  "tiers": {s.tier: s.state for s in searches}})
+      elapsed = time.perf_counter() - start
+      print(f"generation {pending[0].state['generation']}/{args.generations} ({elapsed:.1f}s)", flush=True)
+      for search in pending:
+        last = search.state["history"][-1]
+        print(f"  {search.tier:<7} target {search.target:.2f}  best this gen {last['win_rate']:.2f}  "
+              f"best so far error {search.state['best_error']:.3f}", flush=True)
+
+  table = {s.tier: s.state["best"] for s in searches}
+  save_json(args.output, table)
+  print(f"wrote {args.output}:")
+  for tier, params in table.items():
+    print(f"  {tier}: " + ", ".join(f"{k}={v}" for k, v in params.items()))
+  return 0
+
+if __name__ == "__main__":
+  sys.exit(main())
@@ -0,0 +1,72 @@
+"""Retained menu widgets: laid out and scaled once, redrawn every frame.
+
+A ``Scene`` owns a build function that returns its widgets by name. The
+widgets are kept until the scene's key (typically the window size, the
+screen surface and the menu phase) changes, so image scaling and text layout
+happen on those changes rather than every frame. Widgets are anything with a
+``draw()`` method: ``Button`` and the labels below. Setting ``visible = False``
+on a widget skips it. Widgets with a ``rect`` (buttons) go into the scene's
+``Dispatcher`` each layout; ``dispatch(events, key)`` returns the names that
+were clicked, so drawing and input are independent.
+"""
+import fonts
+from dispatcher import Dispatcher
+
+class Label:
+  """Outlined single-line text centered on ``center``."""
+  def __init__(self, surface, text, size, center, color=(255, 255, 255), stroke_color=(0, 0, 0), stroke_width=2):
+    self.surface = surface
+    self.text, self.size, self.center = text, size, center
+    self.color, self.stroke_color, self.stroke_width = color, stroke_color, stroke_width
+    self.visible = True
+
+  def draw(self):
+    fonts.blit_outlined(self.surface, self.text, self.size, self.center, self.color, self.stroke_color, self.stroke_width)
+
+class TextBlock:
+  """Outlined lines stacked around ``center`` with ``spacing`` pixels between them."""
+  def __init__(self, surface, lines, size, center, color=(255, 255, 255), stroke_color=(0, 0, 0), stroke_width=2, spacing=6):
+    labels = [fonts.render_outlined(line, size, color, stroke_color, stroke_width) for line in lines]
+    heights = [label.get_height() - 2 * stroke_width for label in labels]
+    y = center[1] - (sum(heights) + spacing * (len(lines) - 1)) // 2
+    self.lines = []
+    for line, h in zip(lines, heights):
+      self.lines.append(Label(surface, line, size, (center[0], y + h // 2), color, stroke_color, stroke_width))
+      y += h + spacing
+    self.visible = True
+
+  def draw(self):
+    for label in self.lines:
+      label.draw()
+
+class Scene:
+  def __init__(self, build):
+    self.build = build
+    self.key = None
+    self.widgets = {}
+    self.dispatcher = Dispatcher()
+
+  def layout(self, key):
+    """Rebuild the widgets if ``key`` differs from the one they were built for."""
+    if key != self.key:
+      self.widgets = self.build()
+      self.key = key
+      self.dispatcher.clear()
+      for name, widget in self.widgets.items():
+        if hasattr(widget, "rect"):
+          self.dispatcher.add(name, widget)
+    return self.widgets
+
+  def __getitem__(self, name):
+    return self.widgets[name]
+
+  def dispatch(self, events, key):
+    """The names of the visible widgets clicked in ``events``."""
+    self.layout(key)
+    return set(self.dispatcher.dispatch(events))
+
+  def draw(self, key):
+    """Draw every visible widget in build order."""
+    for widget in self.layout(key).values():
+      if getattr(widget, "visible", True):
+        widget.draw()
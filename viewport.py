@@ -0,0 +1,61 @@
+"""Fixed logical resolution: draw at one size, scale to the window once per frame.
+
+In this mode every screen draws on ``Viewport.surface``, which never changes
+size. ``present`` scales it into the largest rect of the same aspect ratio
+that fits the window and fills the rest with letterbox bars. A window resize
+only recomputes that rect, so nothing is re-scaled or reloaded and the match
+physics keep the logical field size. ``Button`` reads the mouse through
+``mouse_pos``, which maps window coordinates back to logical ones while a
+viewport is active.
+"""
+import pygame
+
+_active = None  # the viewport mouse positions are mapped through, if any
+
+class Viewport:
+  def __init__(self, logical_size, window_size, bar_color=(0, 0, 0)):
+    self.surface = pygame.Surface(logical_size).convert()
+    self.bar_color = bar_color
+    self.resize(*window_size)
+
+  def resize(self, width, height):
+    """Fit the logical surface into a ``width`` x ``height`` window, keeping its aspect ratio."""
+    lw, lh = self.surface.get_size()
+    self.scale = min(width / lw, height / lh)
+    w, h = max(1, min(width, round(lw * self.scale))), max(1, min(height, round(lh * self.scale)))
+    self.rect = pygame.Rect((width - w) // 2, (height - h) // 2, w, h)
+    bars = (pygame.Rect(0, 0, width, self.rect.top), pygame.Rect(0, self.rect.bottom, width, height - self.rect.bottom),
+            pygame.Rect(0, self.rect.top, self.rect.left, h), pygame.Rect(self.rect.right, self.rect.top, width - self.rect.right, h))
+    self.bars = [bar for bar in bars if bar.width > 0 and bar.height > 0]
+
+  def present(self, window):
+    """Scale the logical frame onto ``window``; the caller flips the display."""
+    for bar in self.bars:
+      window.fill(self.bar_color, bar)
+    if self.rect.size == self.surface.get_size():
+      window.blit(self.surface, self.rect)
+      return
+    target = window.subsurface(self.rect)
+    if self.scale > 1:
+      # enlarging: plain scaling is several times cheaper and looks the same at a glance
+      pygame.transform.scale(self.surface, self.rect.size, target)
+      return
+    try:
+      pygame.transform.smoothscale(self.surface, self.rect.size, target)
+    except ValueError:  # smoothscale needs 24/32-bit surfaces
+      pygame.transform.scale(self.surface, self.rect.size, target)
+
+  def to_logical(self, pos):
+    return (int((pos[0] - self.rect.x) / self.scale), int((pos[1] - self.rect.y) / self.scale))
+
+  def activate(self):
+    global _active
+    _active = self
+
+def logical_pos(pos):
+  """A window position (the mouse's, an event's ``pos``) on the surface the screens draw on."""
+  return _active.to_logical(pos) if _active is not None else pos
+
+def mouse_pos():
+  """The mouse position on the surface the screens draw on."""
+  return logical_pos(pygame.mouse.get_pos())